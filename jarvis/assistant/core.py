@@ -1,14 +1,37 @@
 import asyncio
+import os
 import pathlib
-from typing import Optional
+from dataclasses import asdict
+from typing import Awaitable, Optional, Tuple
+
+import psutil
 
 from jarvis.assistant.llm.llm_client import LLMClient
 from jarvis.assistant.memory.memory_manager import MemoryManager, UserProfile
+from jarvis.assistant.memory.sessions import ConversationSession, SessionManager
+from jarvis.assistant.pipeline import VoicePipeline
 from jarvis.assistant.skills.skill_manager import SkillManager
+from jarvis.assistant.speculation import SpeculativeGenerator
 from jarvis.assistant.speech.speech_listener import SpeechListener
 from jarvis.assistant.speech.speech_synthesizer import SpeechSynthesizer
+from jarvis.assistant.system.governor import ResourceGovernor, apply_native_thread_limit, limit_native_threads
 from jarvis.assistant.system.monitor import SystemMonitor
+from jarvis.utils.executors import LOW, executors, run_in
 from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import (
+    COMMANDS,
+    CONVERSATIONS,
+    ERRORS,
+    MODEL_RESIDENT,
+    PROCESS_RSS,
+    QUEUE_DEPTH,
+    SESSIONS,
+    registry,
+)
+from jarvis.utils.profiler import SamplingProfiler
+from jarvis.utils.recording import recorder
+from jarvis.utils.startup import StartupTimeline
+from jarvis.utils.tracing import tracer
 
 
 class JarvisAssistant:
@@ -16,96 +39,287 @@ class JarvisAssistant:
     Coordinates the major subsystems that power the Jarvis experience.
     """
 
-    def __init__(self):
+    def __init__(self, data_dir: Optional[pathlib.Path] = None):
         self.logger = get_logger(__name__)
-        base_dir = pathlib.Path(__file__).resolve().parent.parent.parent
-        data_dir = base_dir / "jarvis" / "data"
+        # Constructors stay cheap; model loads and I/O happen concurrently in start().
+        self.startup = StartupTimeline()
+        if data_dir is None:
+            base_dir = pathlib.Path(__file__).resolve().parent.parent.parent
+            data_dir = base_dir / "jarvis" / "data"
         data_dir.mkdir(parents=True, exist_ok=True)
+        self.data_dir = data_dir
 
         self.memory = MemoryManager(memory_path=data_dir / "memory.json")
-        self.skill_manager = SkillManager(memory_manager=self.memory)
+        self.sessions = SessionManager(self.memory)
+        self.monitor = SystemMonitor(sample_interval=5.0)
+        self.governor = ResourceGovernor(monitor=self.monitor)
+        self.skill_manager = SkillManager(
+            memory_manager=self.memory,
+            system_monitor=self.monitor,
+            resource_governor=self.governor,
+        )
         self.llm = LLMClient(memory_manager=self.memory)
         self.synthesizer = SpeechSynthesizer()
         self.listener = SpeechListener(memory_manager=self.memory)
-        self.monitor = SystemMonitor()
+        self.skill_manager.notifier = self.synthesizer.speak
+        # Speculation is optional background work: it pauses while the governor defers background load.
+        self.speculator = SpeculativeGenerator(
+            transcribe=self.listener.transcribe_partial,
+            generate=lambda text: self._generate_reply(text, self.sessions.default),
+            classify=self.listener.infer_intent,
+            enabled=lambda: self.governor.background_allowed and self.startup.is_ready("llm"),
+        )
+        self.pipeline = VoicePipeline(
+            listener=self.listener,
+            run_command=self._handle_command,
+            run_conversation=self._handle_conversation,
+            speak=self.synthesizer.speak,
+            ready=self._wait_for_dispatch,
+            interrupt_speech=self.synthesizer.interrupt,
+            speculator=self.speculator,
+        )
+        self.profiler = SamplingProfiler(output_dir=data_dir / "profiles")
+        self._register_governor_policies()
+        self._process = psutil.Process(os.getpid())
+        self._llm_models_seen: set[str] = set()
+        QUEUE_DEPTH.set_function(lambda: self.synthesizer.pending, queue="tts")
+        SESSIONS.set_function(lambda: len(self.sessions))
+        registry.add_collector(self._collect_metrics)
 
         self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._speech_task: Optional[asyncio.Task] = None
+        self._startup_task: Optional[asyncio.Task] = None
+        self._voice_task: Optional[asyncio.Task] = None
         self._monitor_task: Optional[asyncio.Task] = None
         self._running = False
+        self._closed = False
 
-    async def start(self) -> None:
+    async def start(self, voice: bool = True, speech_output: bool = True) -> None:
+        """
+        Starts the assistant. ``voice=False`` runs headless: no microphone, no Whisper, and text-to-speech
+        only if ``speech_output`` is set.
+        """
         if self._running:
             return
 
         self.logger.info("Starting Jarvis subsystems")
         self._loop = asyncio.get_running_loop()
-        await self.memory.load()
-        await self.skill_manager.load_builtin_skills()
-        self.listener.configure_wake_word()
+        self.listener.attach_intent_classifier(self.skill_manager.intent_classifier)
         self.listener.attach_loop(self._loop)
 
-        self._speech_task = self._loop.create_task(self._speech_loop(), name="jarvis-speech-loop")
+        self._startup_task = self._loop.create_task(
+            self.initialize_subsystems(voice=voice, speech_output=speech_output), name="jarvis-startup"
+        )
+        if voice:
+            self.listener.configure_wake_word()
+            self._voice_task = self._loop.create_task(self._start_voice_pipeline(), name="jarvis-voice-start")
         self._monitor_task = self._loop.create_task(self._monitor_loop(), name="jarvis-monitor-loop")
         self._running = True
 
     async def shutdown(self) -> None:
-        if not self._running:
+        """
+        Stops background work and releases every subsystem; also used after ``initialize_subsystems`` alone,
+        as replays do.
+        """
+        if self._closed:
             return
+        self._closed = True
 
         self.logger.info("Shutting down Jarvis")
-        tasks = [task for task in (self._speech_task, self._monitor_task) if task]
+        tasks = [task for task in (self._startup_task, self._voice_task, self._monitor_task) if task]
         for task in tasks:
             task.cancel()
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
+        await self.pipeline.stop()
+        await self.skill_manager.close()
+        self.logger.info("Speculation: %s", self.speculator.describe())
+        await run_in("disk", recorder.stop, priority=LOW)
 
+        if self.profiler.running:
+            await run_in("disk", self.profiler.stop, priority=LOW)
         await self.synthesizer.shutdown()
         await self.llm.close()
-        await self.memory.flush()
+        # Flushing before the load finished would overwrite the memory file with an empty state.
+        if self.startup.is_ready("memory"):
+            await self.memory.flush()
+        executors.shutdown()
         self._running = False
 
-    async def _speech_loop(self) -> None:
-        while True:
-            try:
-                transcription = await self.listener.listen()
-                if transcription is None:
-                    continue
-
-                if transcription.intent == "command":
-                    await self._handle_command(transcription.text)
-                else:
-                    await self._handle_conversation(transcription.text)
-            except asyncio.CancelledError:
-                raise
-            except Exception as exc:  # pylint: disable=broad-exception-caught
-                self.logger.exception("Error in speech loop: %s", exc)
-                await asyncio.sleep(1.0)
+    async def initialize_subsystems(self, voice: bool = True, speech_output: bool = True) -> None:
+        """
+        Initialises the independent subsystems concurrently and records the startup timeline.
+        """
+        initializers = {
+            "stt": self.listener.load_model,
+            "tts": self.synthesizer.initialize,
+            "memory": self.memory.load,
+            "skills": self._load_skills,
+            "llm": self.llm.warm_up,
+        }
+        if not voice:
+            del initializers["stt"]
+        if not (voice or speech_output):
+            del initializers["tts"]
+        await self.startup.gather(initializers)
+        # torch and OpenCV are loaded by now; size their intra-op pools to the inference executor.
+        apply_native_thread_limit()
+        self.logger.info("Startup timeline: %s", self.startup.describe())
+        await run_in("disk", self.startup.append_to, self.data_dir / "startup-timeline.jsonl", priority=LOW)
+
+    async def start_recording(self, path: pathlib.Path) -> None:
+        """
+        Records every interaction from now on to ``path``, starting with the models in use and the memory
+        state they ran against, so a replay can reproduce the same context.
+        """
+        await self.startup.wait_ready("memory")
+        # Recordings are keyed by interaction id, which only exists while tracing.
+        tracer.enabled = True
+        meta = {
+            "stt_model": self.listener.model_name,
+            "llm_model": self.llm.model,
+            "sample_rate": self.listener.sample_rate,
+            "memory": asdict(self.memory.state),
+        }
+        await run_in("disk", recorder.start, path, meta, priority=LOW)
+
+    async def _start_voice_pipeline(self) -> None:
+        # Wake listening only needs STT; the router waits for skills and memory once there is input to route.
+        await self.startup.wait_ready("stt")
+        if not self.listener.model_loaded:
+            self.logger.error("Speech recognition is unavailable; voice input disabled.")
+            return
+        self.pipeline.start()
+
+    async def _load_skills(self) -> None:
+        await self.skill_manager.load_builtin_skills()
+        # Custom commands live in memory, which loads concurrently with skill discovery.
+        await self.startup.wait_ready("memory")
+        await self.skill_manager.compile_macros()
+
+    async def _wait_for_dispatch(self) -> None:
+        await self.startup.wait_ready("skills")
+        await self.startup.wait_ready("memory")
 
     async def _monitor_loop(self) -> None:
         while True:
             try:
                 self.monitor.sample()
-                await asyncio.sleep(30.0)
+                await self.governor.evaluate()
+                await asyncio.sleep(self.monitor.sample_interval)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:  # pylint: disable=broad-exception-caught
+                ERRORS.inc(stage="monitor")
                 self.logger.exception("Error in monitor loop: %s", exc)
                 await asyncio.sleep(5.0)
 
-    async def _handle_conversation(self, text: str) -> None:
+    async def _collect_metrics(self) -> None:
+        PROCESS_RSS.set(self._process.memory_info().rss)
+        resident = await self.llm.loaded_models()
+        if resident is not None:
+            self._llm_models_seen |= set(resident) | {self.llm.model, self.llm.default_model}
+            for model in self._llm_models_seen:
+                MODEL_RESIDENT.set(1.0 if model in resident else 0.0, kind="llm", model=model)
+
+    def _register_governor_policies(self) -> None:
+        config = self.governor.config
+        default_stt_model = self.listener.model_name
+        default_wake_interval = self.listener.wake_poll_interval
+        default_sample_interval = self.monitor.sample_interval
+
+        async def downshift_stt() -> None:
+            await self.listener.switch_model(config.low_power_stt_model)
+
+        async def restore_stt() -> None:
+            await self.listener.switch_model(default_stt_model)
+
+        async def slow_wake_polling() -> None:
+            self.listener.wake_poll_interval = config.low_power_wake_interval
+
+        async def restore_wake_polling() -> None:
+            self.listener.wake_poll_interval = default_wake_interval
+
+        async def slow_sampling() -> None:
+            self.monitor.sample_interval = config.low_power_sample_interval
+
+        async def restore_sampling() -> None:
+            self.monitor.sample_interval = default_sample_interval
+
+        async def limit_threads() -> None:
+            limit_native_threads(config.native_threads)
+
+        async def restore_threads() -> None:
+            limit_native_threads(None)
+
+        async def no_op() -> None:
+            return None
+
+        self.governor.add_policy("stt-downshift", ("busy", "on_battery"), downshift_stt, restore_stt)
+        self.governor.add_policy("wake-polling", ("busy", "on_battery"), slow_wake_polling, restore_wake_polling)
+        self.governor.add_policy("monitor-cadence", ("on_battery",), slow_sampling, restore_sampling)
+        self.governor.add_policy("native-threads", ("busy",), limit_threads, restore_threads)
+        # Consumers consult governor.background_allowed before starting optional background work.
+        self.governor.add_policy("defer-background", ("busy", "on_battery", "memory_pressure"), no_op, no_op)
+
+        if self.llm.low_power_model:
+
+            async def downshift_llm() -> None:
+                self.llm.model = self.llm.low_power_model
+
+            async def restore_llm() -> None:
+                self.llm.model = self.llm.default_model
+
+            self.governor.add_policy("llm-downshift", ("busy", "memory_pressure"), downshift_llm, restore_llm)
+
+    async def process_text(self, text: str, session: Optional[ConversationSession] = None) -> Tuple[str, Optional[str]]:
+        """
+        Routes one already-transcribed utterance through intent → skill/LLM and returns (intent, reply).
+        """
+        await self._wait_for_dispatch()
+        with tracer.span("intent"):
+            intent = self.skill_manager.intent_classifier.classify(text).intent
+        recorder.event("intent", text=text, intent=intent, session=session.session_id if session else None)
+        return intent, await self.respond(text, intent, session)
+
+    async def respond(self, text: str, intent: str, session: Optional[ConversationSession] = None) -> Optional[str]:
+        """
+        Runs an utterance whose intent is already known (e.g. from the voice path) to a reply.
+        """
+        if intent == "command":
+            COMMANDS.inc()
+            return await self._handle_command(text)
+        CONVERSATIONS.inc()
+        return await self._handle_conversation(text, session)
+
+    async def _handle_conversation(
+        self,
+        text: str,
+        session: Optional[ConversationSession] = None,
+        prefetched: Optional[Awaitable[str]] = None,
+    ) -> str:
         self.logger.debug("Handling conversational input: %s", text)
-        user_profile: UserProfile = self.memory.user_profile
-        system_prompt = self._build_system_prompt(user_profile)
-        response = await self.llm.generate_response(prompt=text, system_prompt=system_prompt)
-        await self.memory.update_from_conversation(user_message=text, assistant_message=response)
-        await self.synthesizer.speak(response)
+        session = session or self.sessions.default
+        response: Optional[str] = None
+        if prefetched is not None:
+            try:
+                response = await prefetched
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # The early request failed (e.g. Ollama dropped it); a fresh one may still succeed.
+                self.logger.warning("Speculative reply failed, generating again: %s", exc)
+        if response is None:
+            response = await self._generate_reply(text, session)
+        await session.record(text, response)
+        return response
+
+    async def _generate_reply(self, text: str, session: ConversationSession) -> str:
+        system_prompt = self._build_system_prompt(self.memory.user_profile)
+        return await self.llm.generate_response(prompt=text, system_prompt=system_prompt, history=session.history)
 
-    async def _handle_command(self, text: str) -> None:
+    async def _handle_command(self, text: str) -> Optional[str]:
         self.logger.debug("Handling command: %s", text)
-        command_response = await self.skill_manager.execute(text)
-        if command_response:
-            await self.synthesizer.speak(command_response)
+        return await self.skill_manager.execute(text)
 
     @staticmethod
     def _build_system_prompt(profile: UserProfile) -> str:
@@ -0,0 +1,201 @@
+import asyncio
+import itertools
+import json
+import os
+import pathlib
+import socket
+import stat
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional, Set
+
+from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import ERRORS, HEADLESS_REQUESTS
+from jarvis.utils.tracing import tracer
+
+if TYPE_CHECKING:
+    from jarvis.assistant.core import JarvisAssistant
+
+DEFAULT_TCP_PORT = 8765
+
+
+class HeadlessServer:
+    """
+    Text front end speaking a JSON-lines protocol over stdin/stdout and a local socket.
+
+    Each request is one line: ``{"text": "...", "session": "optional id", "id": any, "speak": false}``
+    (a bare non-JSON line is treated as ``text``). Each reply is one line:
+    ``{"id": ..., "session": ..., "intent": ..., "reply": ..., "latency_ms": ...}`` or ``{"id": ..., "error": ...}``.
+    Requests on a connection run concurrently; requests within one session are answered in order.
+    """
+
+    def __init__(
+        self,
+        assistant: "JarvisAssistant",
+        socket_path: Optional[pathlib.Path] = None,
+        port: Optional[int] = None,
+        use_stdin: bool = True,
+        speak: bool = False,
+        on_stdin_closed: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.logger = get_logger(__name__)
+        self.assistant = assistant
+        self.socket_path = socket_path
+        self.port = port
+        self.use_stdin = use_stdin
+        self.speak = speak
+        self.on_stdin_closed = on_stdin_closed
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stdin_task: Optional[asyncio.Task] = None
+        self._connections = itertools.count(1)
+        self._pending: Set[asyncio.Task] = set()
+
+    @property
+    def _uses_unix_socket(self) -> bool:
+        return self.port is None and self.socket_path is not None and hasattr(asyncio, "start_unix_server")
+
+    async def start(self) -> None:
+        if self._uses_unix_socket:
+            self._server = await asyncio.start_unix_server(self._handle_client, sock=self._bind_unix_socket())
+            self.logger.info("Headless server listening on %s", self.socket_path)
+        elif self.socket_path is not None or self.port is not None:
+            # An explicit port, or no Unix sockets (Windows): listen on loopback TCP.
+            port = self.port or DEFAULT_TCP_PORT
+            self._server = await asyncio.start_server(self._handle_client, host="127.0.0.1", port=port)
+            self.logger.info("Headless server listening on 127.0.0.1:%d", port)
+        if self.use_stdin:
+            self._stdin_task = asyncio.get_running_loop().create_task(self._stdin_loop(), name="jarvis-headless-stdin")
+
+    def _bind_unix_socket(self) -> socket.socket:
+        """
+        Binds the socket readable and writable by this user only: anyone who can connect can drive every
+        skill, including launching programs and restarting the machine.
+        """
+        try:
+            mode = self.socket_path.lstat().st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"{self.socket_path} exists and is not a socket; refusing to replace it.")
+            # A stale socket left by a previous run.
+            self.socket_path.unlink()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The umask covers the window between bind and chmod, where the socket would otherwise be open to all.
+        previous_umask = os.umask(0o177)
+        try:
+            sock.bind(str(self.socket_path))
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self.socket_path, 0o600)
+        return sock
+
+    async def stop(self) -> None:
+        if self._stdin_task is not None:
+            self._stdin_task.cancel()
+            await asyncio.gather(self._stdin_task, return_exceptions=True)
+            self._stdin_task = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self._uses_unix_socket:
+                self.socket_path.unlink(missing_ok=True)
+        for task in list(self._pending):
+            task.cancel()
+        await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def handle_line(self, line: str, default_session: str, transport: str) -> Optional[Dict[str, Any]]:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            request = json.loads(line) if line.startswith("{") else {"text": line}
+        except json.JSONDecodeError as exc:
+            return {"error": f"invalid JSON: {exc.msg}"}
+        text = str(request.get("text", "")).strip()
+        request_id = request.get("id")
+        if not text:
+            return {"id": request_id, "error": "missing text"}
+
+        HEADLESS_REQUESTS.inc(transport=transport)
+        session = self.assistant.sessions.get(str(request.get("session") or default_session))
+        started = time.perf_counter()
+        try:
+            async with session.lock:
+                with tracer.interaction(transport):
+                    intent, reply = await self.assistant.process_text(text, session)
+            if reply and request.get("speak", self.speak):
+                self._spawn(self.assistant.synthesizer.speak(reply))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            ERRORS.inc(stage="headless")
+            self.logger.exception("Headless request failed: %s", exc)
+            return {"id": request_id, "session": session.session_id, "error": str(exc)}
+        return {
+            "id": request_id,
+            "session": session.session_id,
+            "intent": intent,
+            "reply": reply,
+            "latency_ms": round((time.perf_counter() - started) * 1000.0, 1),
+        }
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        default_session = f"conn-{next(self._connections)}"
+        write_lock = asyncio.Lock()
+        tasks: Set[asyncio.Task] = set()
+
+        async def respond(line: str) -> None:
+            response = await self.handle_line(line, default_session, "socket")
+            if response is None:
+                return
+            async with write_lock:
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                task = asyncio.get_running_loop().create_task(respond(raw.decode("utf-8", errors="replace")))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError) as exc:
+            self.logger.debug("Headless client disconnected: %s", exc)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _stdin_loop(self) -> None:
+        # A reader thread works on every platform (the Windows proactor loop can't watch stdin pipes).
+        loop = asyncio.get_running_loop()
+        lines: asyncio.Queue = asyncio.Queue()
+
+        def _read() -> None:
+            for raw in sys.stdin:
+                loop.call_soon_threadsafe(lines.put_nowait, raw)
+            loop.call_soon_threadsafe(lines.put_nowait, None)
+
+        threading.Thread(target=_read, name="jarvis-stdin", daemon=True).start()
+        while True:
+            line = await lines.get()
+            if line is None:
+                break
+            response = await self.handle_line(line, "stdin", "stdin")
+            if response is not None:
+                print(json.dumps(response), flush=True)
+        self.logger.info("stdin closed.")
+        if self.on_stdin_closed is not None:
+            self.on_stdin_closed()
+
+    def _spawn(self, coroutine: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
@@ -1,10 +1,14 @@
 import asyncio
-from typing import Optional
+import time
+from typing import Dict, List, Optional
 
 import httpx
 
 from jarvis.assistant.memory.memory_manager import MemoryManager
 from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import LLM_LATENCY
+from jarvis.utils.recording import recorder
+from jarvis.utils.tracing import tracer
 
 
 class LLMClient:
@@ -12,17 +16,30 @@ class LLMClient:
     Interfaces with a locally hosted Ollama model (e.g., phi3, llama3).
     """
 
-    def __init__(self, memory_manager: MemoryManager, model: str = "phi3:mini") -> None:
+    def __init__(
+        self,
+        memory_manager: MemoryManager,
+        model: str = "phi3:mini",
+        low_power_model: Optional[str] = None,
+        base_url: str = "http://localhost:11434",
+    ) -> None:
         self.logger = get_logger(__name__)
         self.model = model
+        self.default_model = model
+        self.low_power_model = low_power_model
         self.memory = memory_manager
         self.client = httpx.AsyncClient(
-            base_url="http://localhost:11434",
+            base_url=base_url,
             timeout=httpx.Timeout(60.0, read=120.0),
         )
 
-    async def generate_response(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        conversation_context = self._build_conversation_context()
+    async def generate_response(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        history: Optional[List[Dict[str, str]]] = None,
+    ) -> str:
+        conversation_context = self._build_conversation_context(history)
         payload = {
             "model": self.model,
             "prompt": self._compose_prompt(system_prompt, conversation_context, prompt),
@@ -30,13 +47,46 @@ class LLMClient:
         }
 
         self.logger.debug("Sending prompt to Ollama model %s", self.model)
-        response = await self.client.post("/api/generate", json=payload)
-        response.raise_for_status()
-        content = response.json()
-        return content.get("response", "").strip()
+        started = time.perf_counter()
+        with tracer.span("llm.generate"):
+            try:
+                response = await self.client.post("/api/generate", json=payload)
+            except asyncio.CancelledError:
+                # Cancelling closes the connection, which makes Ollama abandon the generation.
+                self.logger.info("Cancelled in-flight Ollama request for %s", self.model)
+                raise
+            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+        LLM_LATENCY.observe(elapsed, model=payload["model"])
+        reply = response.json().get("response", "").strip()
+        recorder.event("llm", model=payload["model"], prompt=payload["prompt"], response=reply, seconds=elapsed)
+        return reply
 
-    def _build_conversation_context(self) -> str:
-        messages = self.memory.state.conversation_log[-6:]
+    async def warm_up(self) -> bool:
+        """
+        Asks Ollama to load the model without generating anything, so the first real prompt skips the load.
+        """
+        try:
+            response = await self.client.post("/api/generate", json={"model": self.model, "keep_alive": "10m"})
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            self.logger.warning("Ollama warm-up for %s failed: %s", self.model, exc)
+            return False
+        return True
+
+    async def loaded_models(self) -> Optional[List[str]]:
+        """
+        Lists models Ollama currently holds in memory, or ``None`` if the server can't be reached.
+        """
+        try:
+            response = await self.client.get("/api/ps", timeout=2.0)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return None
+        return [entry.get("name", "") for entry in response.json().get("models", [])]
+
+    def _build_conversation_context(self, history: Optional[List[Dict[str, str]]] = None) -> str:
+        messages = (self.memory.state.conversation_log if history is None else history)[-6:]
         formatted = []
         for message in messages:
             formatted.append(f"User: {message['user']}")
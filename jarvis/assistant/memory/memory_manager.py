@@ -4,6 +4,7 @@ import pathlib
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional
 
+from jarvis.utils.executors import HIGH, run_in
 from jarvis.utils.logger import get_logger
 
 
@@ -42,7 +43,7 @@ class MemoryManager:
             return
 
         self.logger.info("Loading memory from %s", self.memory_path)
-        content = await asyncio.get_running_loop().run_in_executor(None, self.memory_path.read_text, "utf-8")
+        content = await run_in("disk", self.memory_path.read_text, "utf-8", priority=HIGH)
         try:
             data = json.loads(content)
             self.state = MemoryState(
@@ -56,9 +57,7 @@ class MemoryManager:
     async def flush(self) -> None:
         async with self._lock:
             serialized = json.dumps(asdict(self.state), indent=2)
-            await asyncio.get_running_loop().run_in_executor(
-                None, self.memory_path.write_text, serialized, "utf-8"
-            )
+            await run_in("disk", self.memory_path.write_text, serialized, "utf-8")
             self.logger.debug("Persisted memory state.")
 
     async def remember_user_name(self, name: str) -> None:
@@ -73,6 +72,12 @@ class MemoryManager:
         self.state.user.custom_commands[trigger.lower()] = action
         await self.flush()
 
+    async def remove_custom_command(self, trigger: str) -> bool:
+        if self.state.user.custom_commands.pop(trigger.lower(), None) is None:
+            return False
+        await self.flush()
+        return True
+
     async def update_from_conversation(self, user_message: str, assistant_message: str) -> None:
         self.state.conversation_log.append({"user": user_message, "assistant": assistant_message})
         max_entries = 50
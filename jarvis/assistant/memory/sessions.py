@@ -0,0 +1,64 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.utils.logger import get_logger
+
+DEFAULT_SESSION = "default"
+
+
+class ConversationSession:
+    """
+    Conversation history for one client. The user profile always comes from the shared MemoryManager;
+    only the persistent (voice) session writes its turns back to memory.json.
+    """
+
+    def __init__(self, session_id: str, memory: MemoryManager, persistent: bool = False, max_turns: int = 50) -> None:
+        self.session_id = session_id
+        self.memory = memory
+        self.persistent = persistent
+        self.lock = asyncio.Lock()
+        self._turns: Deque[Dict[str, str]] = deque(maxlen=max_turns)
+
+    @property
+    def history(self) -> List[Dict[str, str]]:
+        if self.persistent:
+            return self.memory.state.conversation_log
+        return list(self._turns)
+
+    async def record(self, user_message: str, assistant_message: str) -> None:
+        if self.persistent:
+            await self.memory.update_from_conversation(user_message=user_message, assistant_message=assistant_message)
+            return
+        self._turns.append({"user": user_message, "assistant": assistant_message})
+
+
+class SessionManager:
+    """
+    Keeps the most recently used sessions (LRU), plus the persistent default session, which is never evicted.
+    """
+
+    def __init__(self, memory: MemoryManager, max_sessions: int = 256) -> None:
+        self.logger = get_logger(__name__)
+        self.memory = memory
+        self.max_sessions = max_sessions
+        self.default = ConversationSession(DEFAULT_SESSION, memory, persistent=True)
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sessions) + 1
+
+    def get(self, session_id: Optional[str]) -> ConversationSession:
+        if not session_id or session_id == DEFAULT_SESSION:
+            return self.default
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = ConversationSession(session_id, self.memory)
+            self._sessions[session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                evicted, _ = self._sessions.popitem(last=False)
+                self.logger.debug("Evicted idle session %s", evicted)
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
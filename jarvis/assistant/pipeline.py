@@ -0,0 +1,341 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Set, TypeVar
+
+import numpy as np
+
+from jarvis.assistant.speculation import Speculation, SpeculativeGenerator
+from jarvis.assistant.speech.speech_listener import SpeechListener
+from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import (
+    BARGE_IN_LATENCY,
+    COMMANDS,
+    CONVERSATIONS,
+    ERRORS,
+    QUEUE_DEPTH,
+    QUEUE_DROPS,
+    WAKES,
+)
+from jarvis.utils.recording import recorder
+from jarvis.utils.tracing import Trace, tracer
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+# Stages whose in-flight work a barge-in abandons.
+INTERRUPTIBLE_STAGES = ("llm", "tts")
+
+T = TypeVar("T")
+
+
+@dataclass
+class PipelineItem:
+    """
+    One utterance travelling through the pipeline; each stage fills in its own fields.
+    """
+
+    trace: Optional[Trace] = None
+    audio: Optional[np.ndarray] = None
+    text: str = ""
+    intent: str = ""
+    response: str = ""
+    created: float = field(default_factory=time.monotonic)
+    speculation: Optional[Speculation] = None
+    # An accepted speculative LLM request whose reply replaces a fresh one.
+    prefetched: Optional["asyncio.Task[Any]"] = None
+
+
+class StageQueue(Generic[T]):
+    """
+    Bounded queue between two stages with an explicit policy for when it is full:
+    ``block`` applies backpressure to the producer, ``drop_oldest`` evicts the stalest item,
+    ``drop_newest`` rejects the incoming one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        policy: str = BLOCK,
+        on_drop: Optional[Callable[[T], None]] = None,
+    ) -> None:
+        if policy not in (BLOCK, DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.logger = get_logger(__name__)
+        self.name = name
+        self.policy = policy
+        self.on_drop = on_drop
+        self.dropped = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        QUEUE_DEPTH.set_function(self._queue.qsize, queue=name)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    async def put(self, item: T) -> bool:
+        """
+        Enqueues ``item`` according to the policy; returns False if it was the one dropped.
+        """
+        if self.policy == BLOCK:
+            await self._queue.put(item)
+            return True
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return True
+        if self.policy == DROP_NEWEST:
+            self._drop(item)
+            return False
+        self._drop(self._queue.get_nowait())
+        self._queue.task_done()
+        self._queue.put_nowait(item)
+        return True
+
+    async def get(self) -> T:
+        return await self._queue.get()
+
+    def task_done(self) -> None:
+        self._queue.task_done()
+
+    def clear(self) -> List[T]:
+        """
+        Removes and returns everything still waiting (without counting it as dropped).
+        """
+        items = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+            self._queue.task_done()
+        return items
+
+    def _drop(self, item: T) -> None:
+        self.dropped += 1
+        QUEUE_DROPS.inc(queue=self.name)
+        self.logger.warning("Queue %s full (%d items); dropped one (%s).", self.name, self._queue.maxsize, self.policy)
+        if self.on_drop is not None:
+            self.on_drop(item)
+
+
+class VoicePipeline:
+    """
+    Runs capture, transcription, routing, skill/LLM handling and speech as concurrent stages connected
+    by bounded queues, so the microphone keeps listening while Jarvis thinks or speaks.
+    """
+
+    def __init__(
+        self,
+        listener: SpeechListener,
+        run_command: Callable[[str], Awaitable[Optional[str]]],
+        run_conversation: Callable[..., Awaitable[Optional[str]]],
+        speak: Callable[[str], Awaitable[None]],
+        ready: Optional[Callable[[], Awaitable[None]]] = None,
+        interrupt_speech: Optional[Callable[[], Awaitable[object]]] = None,
+        barge_in_timeout: float = 1.0,
+        speculator: Optional[SpeculativeGenerator] = None,
+    ) -> None:
+        """
+        ``run_conversation(text)`` answers a question; with a ``speculator`` it is also called as
+        ``run_conversation(text, prefetched=task)`` when a speculative request for the same text was accepted.
+        """
+        self.logger = get_logger(__name__)
+        self.listener = listener
+        self.run_command = run_command
+        self.run_conversation = run_conversation
+        self.speak = speak
+        self.ready = ready
+        self.interrupt_speech = interrupt_speech
+        self.barge_in_timeout = barge_in_timeout
+        self.speculator = speculator
+        self.last_barge_in: Optional[float] = None
+        # Capture must never block, so raw audio evicts the stalest recording; the router is cheap and
+        # may block transcription; a slow LLM keeps only the newest questions; stale replies are skipped.
+        self.audio: StageQueue[PipelineItem] = StageQueue("audio", 2, DROP_OLDEST, self._finish)
+        self.utterances: StageQueue[PipelineItem] = StageQueue("utterances", 4, BLOCK, self._finish)
+        self.commands: StageQueue[PipelineItem] = StageQueue("commands", 8, DROP_OLDEST, self._finish)
+        self.conversations: StageQueue[PipelineItem] = StageQueue("conversations", 2, DROP_OLDEST, self._finish)
+        self.speech: StageQueue[PipelineItem] = StageQueue("speech", 4, DROP_OLDEST, self._finish)
+        self._tasks: List[asyncio.Task] = []
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._interrupted: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    @property
+    def busy(self) -> bool:
+        """
+        True while Jarvis is generating or speaking a reply (or has one queued).
+        """
+        inflight = any(
+            task is not None and not task.done() for task in map(self._inflight.get, INTERRUPTIBLE_STAGES)
+        )
+        return inflight or self.speech.qsize() > 0 or self.conversations.qsize() > 0
+
+    async def barge_in(self) -> float:
+        """
+        Abandons the reply in progress: drops queued speech and questions, cancels the LLM request,
+        and stops playback. Returns the time taken until all of it has actually stopped, in seconds.
+        """
+        started = time.perf_counter()
+        with tracer.span("barge_in"):
+            for item in self.speech.clear() + self.conversations.clear():
+                self._finish(item)
+            interrupted = [
+                task
+                for task in map(self._inflight.get, INTERRUPTIBLE_STAGES)
+                if task is not None and not task.done()
+            ]
+            for task in interrupted:
+                self._interrupted.add(task)
+                task.cancel()
+            waits: List[Awaitable[object]] = []
+            if interrupted:
+                waits.append(asyncio.wait(interrupted, timeout=self.barge_in_timeout))
+            if self.interrupt_speech is not None:
+                waits.append(self.interrupt_speech())
+            await asyncio.gather(*waits)
+        latency = time.perf_counter() - started
+        self.last_barge_in = latency
+        BARGE_IN_LATENCY.observe(latency)
+        self.logger.info("Barge-in stopped %d stage(s) in %.0f ms", len(interrupted), latency * 1000.0)
+        return latency
+
+    def start(self) -> None:
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        stages = {
+            "capture": self._capture_stage(),
+            "stt": self._consume("stt", self.audio, self._transcribe),
+            "router": self._consume("router", self.utterances, self._route),
+            "skills": self._consume("skills", self.commands, self._run_command),
+            "llm": self._consume("llm", self.conversations, self._run_conversation),
+            "tts": self._consume("tts", self.speech, self._speak),
+        }
+        self._tasks = [loop.create_task(stage, name=f"jarvis-pipeline-{name}") for name, stage in stages.items()]
+        self.logger.info("Voice pipeline started with stages: %s", ", ".join(stages))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit_text(self, text: str, label: str = "text") -> None:
+        """
+        Injects an already-transcribed utterance at the router stage.
+        """
+        item = PipelineItem(trace=tracer.begin(label), text=text)
+        with tracer.resume(item.trace):
+            item.intent = self.listener.infer_intent(text)
+            recorder.event("intent", text=text, intent=item.intent)
+        await self.utterances.put(item)
+
+    async def _capture_stage(self) -> None:
+        while True:
+            try:
+                await self.listener.wait_for_wake_word()
+                WAKES.inc()
+                if self.busy:
+                    await self.barge_in()
+                item = PipelineItem(trace=tracer.begin("voice"))
+                on_audio = None
+                if self.speculator is not None:
+                    item.speculation = self.speculator.begin()
+                    on_audio = item.speculation.feed
+                try:
+                    with tracer.resume(item.trace):
+                        item.audio = await self.listener.record_command(on_audio=on_audio)
+                except asyncio.CancelledError:
+                    self._finish(item)
+                    raise
+                if item.audio is None:
+                    self._finish(item)
+                    continue
+                await self.audio.put(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                ERRORS.inc(stage="capture")
+                self.logger.exception("Error in capture stage: %s", exc)
+                await asyncio.sleep(1.0)
+
+    async def _consume(
+        self, name: str, source: StageQueue[PipelineItem], handler: Callable[[PipelineItem], Awaitable[None]]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await source.get()
+            # Each item runs as a child task so a barge-in can cancel it without stopping the stage.
+            task = loop.create_task(self._handle(handler, item), name=f"jarvis-pipeline-{name}-item")
+            self._inflight[name] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                self._finish(item)
+                if task not in self._interrupted:
+                    raise
+                self.logger.debug("%s stage interrupted by barge-in", name)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                ERRORS.inc(stage=name)
+                self.logger.exception("Error in %s stage: %s", name, exc)
+                self._finish(item)
+            finally:
+                self._interrupted.discard(task)
+                self._inflight.pop(name, None)
+                source.task_done()
+
+    @staticmethod
+    async def _handle(handler: Callable[[PipelineItem], Awaitable[None]], item: PipelineItem) -> None:
+        with tracer.resume(item.trace):
+            await handler(item)
+
+    async def _transcribe(self, item: PipelineItem) -> None:
+        result = await self.listener.transcribe_command(item.audio)
+        item.audio = None
+        if result is None:
+            self._finish(item)
+            return
+        item.text, item.intent = result.text, result.intent
+        if item.speculation is not None:
+            item.prefetched = item.speculation.resolve(item.text if item.intent != "command" else None)
+        await self.utterances.put(item)
+
+    async def _route(self, item: PipelineItem) -> None:
+        if self.ready is not None:
+            await self.ready()
+        if item.intent == "command":
+            COMMANDS.inc()
+            await self.commands.put(item)
+        else:
+            CONVERSATIONS.inc()
+            await self.conversations.put(item)
+
+    async def _run_command(self, item: PipelineItem) -> None:
+        await self._respond(item, await self.run_command(item.text))
+
+    async def _run_conversation(self, item: PipelineItem) -> None:
+        if item.prefetched is not None:
+            await self._respond(item, await self.run_conversation(item.text, prefetched=item.prefetched))
+            return
+        await self._respond(item, await self.run_conversation(item.text))
+
+    async def _respond(self, item: PipelineItem, response: Optional[str]) -> None:
+        if not response:
+            self._finish(item)
+            return
+        item.response = response
+        await self.speech.put(item)
+
+    async def _speak(self, item: PipelineItem) -> None:
+        await self.speak(item.response)
+        self._finish(item)
+
+    def _finish(self, item: PipelineItem) -> None:
+        if item.speculation is not None:
+            item.speculation.cancel()
+        if item.trace is None or item.trace.duration_ms is not None:
+            return
+        tracer.finish(item.trace)
+        self.logger.info("Interaction timeline %s", item.trace.describe())
@@ -0,0 +1,72 @@
+import re
+from typing import Optional, TYPE_CHECKING
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.skills.base_skill import Skill, SkillMetadata
+from jarvis.assistant.skills.macro_engine import MACRO_SKILL_NAME, MacroError
+from jarvis.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from jarvis.assistant.skills.skill_manager import SkillManager
+
+DEFINITION_PATTERN = re.compile(
+    r"^when i say\s+[\"']?(?P<trigger>.+?)[\"']?\s*(?:,|:|\s(?:do|run|you should)\s)\s*(?P<action>.+?)[.!]?$",
+    re.IGNORECASE,
+)
+FORGET_PATTERN = re.compile(
+    r"^forget (?:the |my )?(?:custom )?command\s+[\"']?(?P<trigger>.+?)[\"']?[.!]?$",
+    re.IGNORECASE,
+)
+
+
+class CustomCommandsSkill(Skill):
+    metadata = SkillMetadata(
+        name=MACRO_SKILL_NAME,
+        description="Teaches Jarvis personal command phrases that run a sequence of skills.",
+        triggers=("when i say", "forget the command", "forget command", "list my commands"),
+    )
+
+    def __init__(self) -> None:
+        self.logger = get_logger(__name__)
+        self.skill_manager: Optional["SkillManager"] = None
+
+    def set_skill_manager(self, manager: "SkillManager") -> None:
+        self.skill_manager = manager
+
+    async def handle(self, text: str, memory: MemoryManager) -> str:
+        if self.skill_manager is None:
+            return "Custom commands are unavailable right now."
+        lowered = text.lower()
+        if lowered.startswith("when i say"):
+            return await self._define(text)
+        if lowered.startswith("forget"):
+            return await self._forget(text)
+        if lowered.startswith("list my commands"):
+            return self._list()
+        return "Tell me 'when I say movie night, open vlc and mute the volume' to teach me a command."
+
+    async def _define(self, text: str) -> str:
+        match = DEFINITION_PATTERN.match(text.strip())
+        if match is None:
+            return "Please phrase it as 'when I say movie night, open vlc and mute the volume'."
+        trigger, action = match.group("trigger"), match.group("action")
+        try:
+            macro = await self.skill_manager.add_macro(trigger, action)
+        except MacroError as exc:
+            return f"I couldn't set that up: {exc}."
+        steps = len(macro.steps)
+        return f"Done. Saying '{macro.trigger}' will now run {steps} step{'s' if steps != 1 else ''}."
+
+    async def _forget(self, text: str) -> str:
+        match = FORGET_PATTERN.match(text.strip())
+        if match is None:
+            return "Which command should I forget?"
+        if await self.skill_manager.remove_macro(match.group("trigger")):
+            return f"I've forgotten '{match.group('trigger')}'."
+        return f"I don't have a command called '{match.group('trigger')}'."
+
+    def _list(self) -> str:
+        triggers = sorted(macro.trigger for macro in self.skill_manager.macros.macros)
+        if not triggers:
+            return "You haven't taught me any commands yet."
+        return "Your commands: " + ", ".join(triggers) + "."
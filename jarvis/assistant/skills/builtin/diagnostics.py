@@ -0,0 +1,42 @@
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.skills.base_skill import Skill, SkillMetadata
+from jarvis.utils.tracing import tracer
+
+SPOKEN_STAGES = (
+    ("stt.transcribe", "transcription"),
+    ("skill.dispatch", "skill dispatch"),
+    ("llm.generate", "language model"),
+    ("tts.speak", "speech"),
+    ("interaction.voice", "whole interactions"),
+)
+
+
+class DiagnosticsSkill(Skill):
+    metadata = SkillMetadata(
+        name="Diagnostics",
+        description="Reports pipeline latency percentiles and the timeline of recent interactions.",
+        triggers=("diagnostics", "latency report", "performance report", "last interaction"),
+    )
+
+    async def handle(self, text: str, memory: MemoryManager) -> str:
+        if not tracer.enabled:
+            return "Tracing is disabled, so I have no timing data to report."
+
+        if "last interaction" in text.lower():
+            traces = tracer.recent_traces(limit=1)
+            if not traces:
+                return "I haven't recorded a complete interaction yet."
+            trace = traces[-1]
+            stages = ", ".join(f"{span.name} took {span.duration_ms:.0f} milliseconds" for span in trace.spans)
+            return f"The last interaction took {trace.duration_ms:.0f} milliseconds: {stages}."
+
+        parts = []
+        for stage, label in SPOKEN_STAGES:
+            histogram = tracer.histograms.get(stage)
+            if histogram is None or not histogram.count:
+                continue
+            stats = tracer.percentiles(stage, quantiles=(0.5, 0.95))
+            parts.append(f"{label} median {stats['p50']:.0f}, p95 {stats['p95']:.0f} milliseconds")
+        if not parts:
+            return "I don't have enough timing data yet. Ask me again after a few requests."
+        return "Latency report: " + "; ".join(parts) + "."
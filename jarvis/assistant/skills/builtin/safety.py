@@ -1,8 +1,8 @@
-import asyncio
 import subprocess
 
 from jarvis.assistant.memory.memory_manager import MemoryManager
 from jarvis.assistant.skills.base_skill import Skill, SkillMetadata
+from jarvis.utils.executors import HIGH, run_in
 from jarvis.utils.logger import get_logger
 
 
@@ -38,10 +38,13 @@ class SafetyConfirmationSkill(Skill):
         memory.state.user.preferences.pop("pending_action", None)
         await memory.flush()
         self.logger.warning("Executing sensitive command: %s", cmd)
-        await asyncio.get_running_loop().run_in_executor(
-            None,
+        await run_in(
+            "subprocess",
             subprocess.run,
             cmd,
-            {"check": False, "stdout": subprocess.PIPE, "stderr": subprocess.PIPE},
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            priority=HIGH,
         )
         return success_message
@@ -22,7 +22,7 @@ class SkillDevelopmentSkill(Skill):
         self.skill_manager: Optional["SkillManager"] = None
         self.pending_key = "pending_skill_change"
 
-    def set_skill_manager(self, manager: SkillManager) -> None:
+    def set_skill_manager(self, manager: "SkillManager") -> None:
         self.skill_manager = manager
 
     async def handle(self, text: str, memory: MemoryManager) -> str:
@@ -1,19 +1,53 @@
+import re
+from typing import Optional, Tuple
+
 from jarvis.assistant.memory.memory_manager import MemoryManager
 from jarvis.assistant.skills.base_skill import Skill, SkillMetadata
 from jarvis.assistant.system.monitor import SystemMonitor
 
+# Up to three words between "last"/"past" and the unit hold the amount: "10", "five", "twenty-five", "few".
+WINDOW_PATTERN = re.compile(r"\b(?:last|past)\s+((?:[a-z0-9.-]+\s+){0,3}?)(second|minute|hour)s?\b")
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8,
+    "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19, "twenty": 20, "thirty": 30, "forty": 40,
+    "fifty": 50, "sixty": 60, "ninety": 90, "half": 0.5, "couple": 2, "few": 3,
+}
+AMOUNT_FILLERS = frozenset(("of", "and"))
+UNIT_SECONDS = {"second": 1.0, "minute": 60.0, "hour": 3600.0}
+METRIC_KEYWORDS = (
+    ("cpu", ("cpu", "processor")),
+    ("ram", ("memory", "ram")),
+    ("battery", ("battery",)),
+)
+METRIC_LABELS = {"cpu": "CPU usage", "ram": "Memory usage", "battery": "Battery charge"}
+
 
 class StatusSkill(Skill):
     metadata = SkillMetadata(
         name="System Status",
-        description="Reports CPU usage, memory consumption, and battery level.",
-        triggers=("status", "cpu", "memory", "battery", "monitor"),
+        description="Reports CPU usage, memory consumption, battery level, recent trends and the top processes.",
+        triggers=("status", "cpu", "memory", "battery", "monitor", "top processes"),
     )
 
     def __init__(self) -> None:
-        self.monitor = SystemMonitor()
+        self.monitor: Optional[SystemMonitor] = None
+
+    def set_system_monitor(self, monitor: SystemMonitor) -> None:
+        self.monitor = monitor
 
     async def handle(self, text: str, memory: MemoryManager) -> str:
+        if self.monitor is None:
+            self.monitor = SystemMonitor()
+        lowered = text.lower()
+
+        if "process" in lowered or ("using" in lowered and "most" in lowered):
+            return self._describe_top_processes(lowered)
+
+        parsed = self._parse_window(lowered)
+        if parsed is not None:
+            return self._describe_trend(lowered, *parsed)
+
         snapshot = self.monitor.get_snapshot()
         cpu = snapshot.get("cpu")
         ram = snapshot.get("ram")
@@ -23,3 +57,71 @@ class StatusSkill(Skill):
         if battery is not None:
             response += f" Battery charge stands at {battery:.0f} percent."
         return response
+
+    def _describe_trend(self, lowered: str, window: float, understood: bool) -> str:
+        metric = next(
+            (name for name, keywords in METRIC_KEYWORDS if any(keyword in lowered for keyword in keywords)), "cpu"
+        )
+        # When the requested window isn't the one reported on, say which one was used.
+        note = "" if understood else "I didn't catch how long you meant. "
+        history = self.monitor.capacity * self.monitor.sample_interval
+        if window > history:
+            window = history
+            note = f"I only keep the last {self._format_window(history)} of readings. "
+        trend = self.monitor.trend(metric, window)
+        span = self._format_window(window)
+        if trend.stats.samples == 0:
+            return f"{note}I don't have any {METRIC_LABELS[metric].lower()} readings from the last {span} yet."
+        stats = trend.stats
+        return (
+            f"{note}{METRIC_LABELS[metric]} over the last {span} averaged {stats.mean:.0f} percent, "
+            f"peaking at {stats.max:.0f} with a 95th percentile of {stats.p95:.0f}. "
+            f"It is {trend.direction}, currently at {trend.last:.0f} percent."
+        )
+
+    def _describe_top_processes(self, lowered: str) -> str:
+        key = "ram" if "memory" in lowered or "ram" in lowered else "cpu"
+        processes = self.monitor.top_processes(count=3, key=key)
+        if not processes:
+            return "I couldn't read the process table."
+        if key == "ram":
+            parts = [f"{proc.name} at {proc.ram_mb:.0f} megabytes" for proc in processes]
+            return "The heaviest memory users are " + ", ".join(parts) + "."
+        parts = [f"{proc.name} at {proc.cpu:.0f} percent" for proc in processes]
+        return "The busiest processes are " + ", ".join(parts) + "."
+
+    @staticmethod
+    def _parse_window(lowered: str) -> Optional[Tuple[float, bool]]:
+        """
+        Returns the requested window in seconds and whether its amount was understood; an amount that
+        wasn't ("the last several minutes") counts as one unit.
+        """
+        match = WINDOW_PATTERN.search(lowered)
+        if not match:
+            return None
+        count = StatusSkill._parse_amount(match.group(1))
+        understood = count is not None and count > 0
+        return (count if understood else 1.0) * UNIT_SECONDS[match.group(2)], understood
+
+    @staticmethod
+    def _parse_amount(amount: str) -> Optional[float]:
+        words = [word for word in re.split(r"[\s-]+", amount.strip()) if word and word not in AMOUNT_FILLERS]
+        if not words:
+            return 1.0
+        if len(words) == 1:
+            try:
+                return float(words[0])
+            except ValueError:
+                pass
+        if not all(word in NUMBER_WORDS for word in words):
+            return None
+        return float(sum(NUMBER_WORDS[word] for word in words))
+
+    @staticmethod
+    def _format_window(seconds: float) -> str:
+        for unit in ("hour", "minute", "second"):
+            size = UNIT_SECONDS[unit]
+            if seconds >= size:
+                count = seconds / size
+                return f"{count:.0f} {unit}" + ("s" if round(count) != 1 else "")
+        return f"{seconds:.0f} seconds"
@@ -1,10 +1,10 @@
-import asyncio
 import os
 import subprocess
 from pathlib import Path
 
 from jarvis.assistant.memory.memory_manager import MemoryManager
 from jarvis.assistant.skills.base_skill import Skill, SkillMetadata
+from jarvis.utils.executors import HIGH, run_in
 from jarvis.utils.logger import get_logger
 
 
@@ -59,7 +59,7 @@ class SystemControlSkill(Skill):
                 if not Path(path).exists():
                     return f"I cannot find {friendly} at the expected location."
                 self.logger.info("Launching %s (%s)", friendly, path)
-                await asyncio.get_running_loop().run_in_executor(None, subprocess.Popen, [path])
+                await run_in("subprocess", subprocess.Popen, [path], priority=HIGH)
                 return f"Launching {friendly} now."
         return "I'm afraid that application isn't on my approved list."
 
@@ -68,11 +68,14 @@ class SystemControlSkill(Skill):
             exe_name = Path(path).name
             if friendly in text:
                 self.logger.info("Closing %s via taskkill", exe_name)
-                await asyncio.get_running_loop().run_in_executor(
-                    None,
+                await run_in(
+                    "subprocess",
                     subprocess.run,
                     ["taskkill", "/IM", exe_name, "/F"],
-                    {"check": False, "stdout": subprocess.PIPE, "stderr": subprocess.PIPE},
+                    check=False,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    priority=HIGH,
                 )
                 return f"I've attempted to close {friendly}."
         return "I don't have clearance to close that application."
@@ -83,6 +86,6 @@ class SystemControlSkill(Skill):
                 if not Path(path).exists():
                     return f"The {friendly} directory is missing."
                 self.logger.info("Opening folder %s", path)
-                await asyncio.get_running_loop().run_in_executor(None, os.startfile, path)
+                await run_in("subprocess", os.startfile, path, priority=HIGH)
                 return f"Opening your {friendly}."
         return "That folder isn't in my directory whitelist, sorry."
@@ -1,53 +1,96 @@
-import cv2
-import numpy as np
+import re
+from typing import Awaitable, Callable, Optional
 
 from jarvis.assistant.memory.memory_manager import MemoryManager
 from jarvis.assistant.skills.base_skill import Skill, SkillMetadata
-from jarvis.assistant.vision.vision_manager import VisionManager
+from jarvis.assistant.vision.analysis import ImageAnalyzer, describe_screens
+from jarvis.assistant.system.governor import ResourceGovernor
+from jarvis.assistant.vision.vision_manager import ENCODE_PARAMS, VisionManager
+from jarvis.assistant.vision.watcher import ScreenWatcher
+from jarvis.utils.executors import run_in
+
+CAMERA_INDEX_PATTERN = re.compile(r"\b(?:webcam|camera)\s+(?:number\s+)?(\d+)\b")
 
 
 class VisionSkill(Skill):
     metadata = SkillMetadata(
         name="Vision",
-        description="Captures the screen or webcam and provides a lightweight description.",
-        triggers=("grab screen", "screenshot", "webcam", "what do you see"),
+        description="Captures the screen or webcam, describes it, and can watch the screen for changes.",
+        triggers=("grab screen", "screenshot", "webcam", "what do you see", "watch my screen", "stop watching"),
     )
 
     def __init__(self) -> None:
         self.vision = VisionManager()
+        self.analyzer = ImageAnalyzer()
+        self.notify: Optional[Callable[[str], Awaitable[None]]] = None
+        self.governor: Optional[ResourceGovernor] = None
+        self.watcher: Optional[ScreenWatcher] = None
+
+    def set_notifier(self, notify: Callable[[str], Awaitable[None]]) -> None:
+        self.notify = notify
+
+    def set_resource_governor(self, governor: ResourceGovernor) -> None:
+        self.governor = governor
+
+    async def close(self) -> None:
+        if self.watcher is not None:
+            await self.watcher.stop()
+        # Joining webcam grabber threads can block for a moment.
+        await run_in("inference", self.vision.close)
 
     async def handle(self, text: str, memory: MemoryManager) -> str:
         lowered = text.lower()
+        if lowered.startswith("stop watching"):
+            if self.watcher is None or not self.watcher.running:
+                return "I wasn't watching the screen."
+            await self.watcher.stop()
+            return "I've stopped watching your screen."
+
+        if lowered.startswith("watch"):
+            return self._start_watch()
+
+        persist = memory.state.user.preferences.get("vision_save", self.vision.save_format)
+        if persist != "off" and persist not in ENCODE_PARAMS:
+            persist = self.vision.save_format
         if "screen" in lowered or "screenshot" in lowered:
-            path = self.vision.capture_screen()
-            description = self._describe_image(path)
-            return f"I've captured the screen to {path}. {description}"
+            frames = await run_in("inference", self.vision.grab_all_screens)
+            analyses = await run_in("inference", lambda: [self.analyzer.analyze(frame) for frame in frames])
+            description = describe_screens(analyses)
+            if persist == "off":
+                return description
+            paths = [
+                self.vision.save_frame_async(frame, "screencap" if index == 1 else f"screencap-{index}", persist)
+                for index, frame in enumerate(frames, start=1)
+            ]
+            return f"I've captured the screen to {paths[0]}. {description}"
 
         if "webcam" in lowered or "what do you see" in lowered:
-            path = self.vision.capture_webcam()
-            if not path:
+            index_match = CAMERA_INDEX_PATTERN.search(lowered)
+            index = int(index_match.group(1)) if index_match else 0
+            frame = await run_in("inference", self.vision.grab_webcam, index)
+            if frame is None:
                 return "I couldn't access the webcam."
-            description = self._describe_image(path)
+            analysis = await run_in("inference", self.analyzer.analyze, frame)
+            description = analysis.describe()
+            if persist == "off":
+                return description
+            path = self.vision.save_frame_async(frame, "webcam", persist)
             return f"Webcam snapshot saved to {path}. {description}"
 
         return "I'm not sure which image you'd like me to capture."
 
-    def _describe_image(self, path) -> str:
-        image = cv2.imread(str(path))
-        if image is None:
-            return "However, I couldn't analyze the image content."
-
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        brightness = np.mean(hsv[:, :, 2])
-        contrast = np.std(hsv[:, :, 2])
-        edges = cv2.Canny(image, 100, 200)
-        edge_density = np.mean(edges > 0)
-
-        brightness_desc = "dim" if brightness < 80 else "balanced" if brightness < 170 else "bright"
-        contrast_desc = "soft" if contrast < 40 else "defined" if contrast < 80 else "high contrast"
-        detail_desc = "minimal detail" if edge_density < 0.01 else "moderate detail" if edge_density < 0.03 else "high detail"
-
-        return (
-            f"The scene appears {brightness_desc} with {contrast_desc} lighting and {detail_desc}. "
-            "I can provide a closer analysis if you need specifics."
-        )
+    def _start_watch(self) -> str:
+        if self.notify is None:
+            return "I have no way to alert you from the background yet, so I can't watch the screen."
+        if self.watcher is None:
+            governor = self.governor
+            self.watcher = ScreenWatcher(
+                vision=self.vision,
+                analyzer=self.analyzer,
+                notify=self.notify,
+                background_allowed=(lambda: governor.background_allowed) if governor else None,
+            )
+        if self.watcher.running:
+            return "I'm already keeping an eye on your screen."
+        self.watcher.start()
+        return "Watching your screen. I'll let you know when something changes; say 'stop watching' to end."
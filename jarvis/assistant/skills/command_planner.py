@@ -0,0 +1,132 @@
+import re
+from dataclasses import dataclass, field
+from typing import List
+
+from jarvis.assistant.skills.intent_classifier import IntentClassifier, normalize_utterance
+from jarvis.utils.logger import get_logger
+
+CONJUNCTION_PATTERN = re.compile(r"\s*(?:,\s*)?\b(and then|then|and also|and|also)\b\s*|\s*[;,]\s*", re.IGNORECASE)
+SEQUENTIAL_CONJUNCTIONS = ("and then", "then")
+SERIAL_PREFIXES = (
+    "shutdown",
+    "shut down",
+    "restart",
+    "reboot",
+)
+# Answers to a pending confirmation must be their own utterance, or "restart and confirm" would reboot in one go.
+CONFIRMATION_PREFIXES = (
+    "confirm",
+    "jarvis confirm",
+    "cancel",
+    "jarvis cancel",
+)
+# A clause starting with one of these asks for something on its own. Without one ("...status of my cpu and
+# memory") a clause only extends the previous one, and is folded back into it if it goes to the same skill.
+CLAUSE_VERBS = frozenset(
+    "open launch close start stop run show tell give take grab list check watch forget remember set switch "
+    "create improve rollback restart reboot shutdown shut what what's whats how".split()
+)
+# Commands whose argument is itself a command phrase ("when I say movie night, open vlc and ..."); never split.
+VERBATIM_PREFIXES = ("when i say",)
+
+
+@dataclass
+class CommandStep:
+    text: str
+    skill_name: str
+    serial: bool = False
+
+
+@dataclass
+class CommandPlan:
+    """
+    Ordered stages of command steps; steps within a stage are independent and may run concurrently.
+    """
+
+    stages: List[List[CommandStep]] = field(default_factory=list)
+
+    @property
+    def steps(self) -> List[CommandStep]:
+        return [step for stage in self.stages for step in stage]
+
+    @property
+    def is_compound(self) -> bool:
+        return len(self.steps) > 1
+
+
+class CommandPlanner:
+    """
+    Splits conjunctive utterances ("open notepad and show me the status") into skill steps.
+    """
+
+    def __init__(self, classifier: IntentClassifier) -> None:
+        self.logger = get_logger(__name__)
+        self.classifier = classifier
+
+    def plan(self, text: str) -> CommandPlan:
+        segments = self._split(text)
+        if len(segments) < 2 or normalize_utterance(text).startswith(VERBATIM_PREFIXES):
+            return self._single(text)
+
+        steps: List[tuple[CommandStep, bool]] = []
+        for segment, after_sequential in segments:
+            match = self.classifier.classify(segment)
+            if match.intent != "command" or not match.skill_name:
+                # Any clause that isn't a skill command means the conjunction was part of the sentence.
+                return self._single(text)
+            command_text = match.command_text or segment
+            if command_text.lower().startswith(CONFIRMATION_PREFIXES):
+                self.logger.info("Not splitting %r: confirmations only run on their own.", text)
+                return self._single(text)
+            previous = steps[-1][0] if steps else None
+            first_word = command_text.lower().split(" ", 1)[0]
+            if previous is not None and previous.skill_name == match.skill_name and first_word not in CLAUSE_VERBS:
+                previous.text = f"{previous.text} and {command_text}"
+                continue
+            serial = command_text.lower().startswith(SERIAL_PREFIXES)
+            steps.append((CommandStep(text=command_text, skill_name=match.skill_name, serial=serial), after_sequential))
+        if len(steps) < 2:
+            return self._single(text)
+
+        plan = CommandPlan()
+        current: List[CommandStep] = []
+        for step, after_sequential in steps:
+            if current and (after_sequential or step.serial):
+                plan.stages.append(current)
+                current = []
+            current.append(step)
+            if step.serial:
+                plan.stages.append(current)
+                current = []
+        if current:
+            plan.stages.append(current)
+
+        self.logger.debug(
+            "Planned %d steps in %d stages: %s",
+            len(plan.steps),
+            len(plan.stages),
+            [[step.text for step in stage] for stage in plan.stages],
+        )
+        return plan
+
+    @staticmethod
+    def _single(text: str) -> CommandPlan:
+        return CommandPlan(stages=[[CommandStep(text=text, skill_name="")]])
+
+    @staticmethod
+    def _split(text: str) -> List[tuple[str, bool]]:
+        segments: List[tuple[str, bool]] = []
+        position = 0
+        after_sequential = False
+        for boundary in CONJUNCTION_PATTERN.finditer(text):
+            segment = text[position : boundary.start()].strip()
+            if segment:
+                segments.append((segment, after_sequential))
+                after_sequential = False
+            conjunction = (boundary.group(1) or "").lower()
+            after_sequential = after_sequential or conjunction in SEQUENTIAL_CONJUNCTIONS
+            position = boundary.end()
+        tail = text[position:].strip()
+        if tail:
+            segments.append((tail, after_sequential))
+        return segments
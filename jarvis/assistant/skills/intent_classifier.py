@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from jarvis.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from jarvis.assistant.skills.base_skill import Skill
+    from jarvis.assistant.skills.macro_engine import MacroEngine
+
+COURTESY_PREFIX_PATTERN = re.compile(
+    r"^(?:(?:hey\s+)?jarvis[,\s]+|please\s+|kindly\s+|"
+    r"(?:could|can|would|will)\s+you(?:\s+please)?\s+|"
+    r"i\s+(?:want|need|would\s+like)\s+you\s+to\s+|i'd\s+like\s+you\s+to\s+)+",
+    re.IGNORECASE,
+)
+TRAILING_COURTESY_PATTERN = re.compile(r"[\s,]*(?:please|for\s+me|thanks|thank\s+you)?[\s.!?]*$", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+STOP_WORDS = frozenset(
+    (
+        "a an and are as at be can could do does for from how i is it its jarvis me my of on or "
+        "please the this to up what what's whats when where who why will with would you your"
+    ).split()
+)
+
+
+def strip_courtesy(text: str) -> str:
+    """
+    Removes courtesy wrappers such as "could you ... please" while preserving the original casing.
+    """
+    stripped = WHITESPACE_PATTERN.sub(" ", text).strip()
+    stripped = COURTESY_PREFIX_PATTERN.sub("", stripped)
+    stripped = TRAILING_COURTESY_PATTERN.sub("", stripped)
+    return stripped.strip()
+
+
+def normalize_utterance(text: str) -> str:
+    return strip_courtesy(text).lower()
+
+
+@dataclass
+class IntentMatch:
+    intent: str
+    skill_name: Optional[str] = None
+    score: float = 0.0
+    command_text: str = ""
+
+
+class IntentClassifier:
+    """
+    Routes utterances to skills using char n-gram TF-IDF vectors built from skill metadata.
+    """
+
+    def __init__(self, ngram_range: tuple[int, int] = (3, 5), threshold: float = 0.45) -> None:
+        self.logger = get_logger(__name__)
+        self.ngram_range = ngram_range
+        self.threshold = threshold
+        self._vocabulary: Dict[str, int] = {}
+        self._idf = np.zeros(0, dtype=np.float32)
+        self._max_idf = 1.0
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._row_labels = np.zeros(0, dtype=np.int32)
+        self._skill_names: List[str] = []
+        self._triggers: List[tuple[str, ...]] = []
+        # Set by SkillManager so the user's custom command triggers route as commands, never to the LLM.
+        self.macros: Optional["MacroEngine"] = None
+
+    @property
+    def skill_names(self) -> List[str]:
+        return list(self._skill_names)
+
+    def fit(self, skills: Iterable["Skill"]) -> None:
+        documents: List[str] = []
+        labels: List[int] = []
+        self._skill_names = []
+        self._triggers = []
+        for index, skill in enumerate(skills):
+            metadata = skill.metadata
+            self._skill_names.append(metadata.name)
+            self._triggers.append(tuple(trigger.lower() for trigger in metadata.triggers))
+            for trigger in metadata.triggers:
+                documents.append(trigger.lower())
+                labels.append(index)
+            documents.append(metadata.description.lower())
+            labels.append(index)
+
+        self._vocabulary = {}
+        document_grams = [self._ngrams(document) for document in documents]
+        for grams in document_grams:
+            for gram in grams:
+                self._vocabulary.setdefault(gram, len(self._vocabulary))
+
+        document_frequency = np.zeros(len(self._vocabulary), dtype=np.float32)
+        for grams in document_grams:
+            for gram in set(grams):
+                document_frequency[self._vocabulary[gram]] += 1.0
+        self._idf = (np.log((1.0 + len(documents)) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+        self._max_idf = float(np.log(1.0 + len(documents)) + 1.0)
+
+        matrix = np.zeros((len(documents), len(self._vocabulary)), dtype=np.float32)
+        for row, grams in enumerate(document_grams):
+            for gram in grams:
+                matrix[row, self._vocabulary[gram]] += 1.0
+        matrix *= self._idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        self._matrix = matrix / norms
+        self._row_labels = np.asarray(labels, dtype=np.int32)
+        self.logger.debug(
+            "Intent classifier fitted on %d skills (%d documents, %d n-grams)",
+            len(self._skill_names),
+            len(documents),
+            len(self._vocabulary),
+        )
+
+    def classify(self, text: str) -> IntentMatch:
+        command_text = strip_courtesy(text)
+        normalized = command_text.lower()
+        if not normalized or not self._skill_names:
+            return IntentMatch(intent="conversation", command_text=command_text)
+
+        if self.macros is not None and self.macros.match(command_text) is not None:
+            return IntentMatch(
+                intent="command",
+                skill_name=self.macros.skill_name,
+                score=1.0,
+                command_text=command_text,
+            )
+
+        prefix_match = self._match_prefix(normalized)
+        if prefix_match is not None:
+            return IntentMatch(
+                intent="command",
+                skill_name=self._skill_names[prefix_match],
+                score=1.0,
+                command_text=command_text,
+            )
+
+        scores = self.score(normalized)
+        best = int(np.argmax(scores))
+        best_score = float(scores[best])
+        if best_score >= self.threshold:
+            return IntentMatch(
+                intent="command",
+                skill_name=self._skill_names[best],
+                score=best_score,
+                command_text=command_text,
+            )
+        return IntentMatch(intent="conversation", score=best_score, command_text=command_text)
+
+    def score(self, normalized: str) -> np.ndarray:
+        """
+        Returns the best cosine similarity per skill for an already normalized utterance.
+        """
+        per_skill = np.zeros(len(self._skill_names), dtype=np.float32)
+        vector = self._vectorize(normalized)
+        if vector is None:
+            return per_skill
+        similarities = self._matrix @ vector
+        np.maximum.at(per_skill, self._row_labels, similarities)
+        return per_skill
+
+    def _match_prefix(self, normalized: str) -> Optional[int]:
+        for index, triggers in enumerate(self._triggers):
+            if any(normalized.startswith(trigger) for trigger in triggers):
+                return index
+        return None
+
+    def _vectorize(self, text: str) -> Optional[np.ndarray]:
+        indices: List[int] = []
+        unseen: Dict[str, int] = {}
+        for gram in self._ngrams(text):
+            index = self._vocabulary.get(gram)
+            if index is None:
+                unseen[gram] = unseen.get(gram, 0) + 1
+            else:
+                indices.append(index)
+        if not indices:
+            return None
+        vector = np.bincount(indices, minlength=len(self._vocabulary)).astype(np.float32)
+        vector *= self._idf
+        # N-grams no skill uses still count towards the length, so one shared word ("status", "memory") in a
+        # longer chat sentence doesn't look like a command. They get the rarest idf, as an unseen term would.
+        unseen_mass = float(np.sum(np.square(np.fromiter(unseen.values(), dtype=np.float32)))) * self._max_idf**2
+        norm = float(np.sqrt(np.dot(vector, vector) + unseen_mass))
+        return vector / norm if norm else None
+
+    def _ngrams(self, text: str) -> Sequence[str]:
+        low, high = self.ngram_range
+        grams: List[str] = []
+        for word in text.split():
+            if word in STOP_WORDS:
+                continue
+            padded = f" {word} "
+            for size in range(low, high + 1):
+                if len(padded) < size:
+                    break
+                grams.extend(padded[start : start + size] for start in range(len(padded) - size + 1))
+        return grams
+
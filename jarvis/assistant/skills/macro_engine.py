@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Mapping, Optional
+
+from jarvis.assistant.skills.command_planner import CommandPlanner
+from jarvis.assistant.skills.intent_classifier import normalize_utterance, strip_courtesy
+from jarvis.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from jarvis.assistant.skills.base_skill import Skill
+
+ARGS_PLACEHOLDER = "{args}"
+# Metadata name of the builtin skill that defines custom commands; the classifier routes macro triggers to it.
+MACRO_SKILL_NAME = "Custom Commands"
+
+
+class MacroError(ValueError):
+    """
+    Raised when a custom command's action can't be compiled into skill steps.
+    """
+
+
+@dataclass
+class MacroStep:
+    text: str
+    skill: "Skill"
+
+    def render(self, args: str) -> str:
+        return self.text.replace(ARGS_PLACEHOLDER, args).strip()
+
+
+@dataclass
+class Macro:
+    """
+    A custom command compiled to skill steps; steps within a stage are independent and run concurrently.
+    """
+
+    trigger: str
+    action: str
+    stages: List[List[MacroStep]] = field(default_factory=list)
+
+    @property
+    def takes_args(self) -> bool:
+        return any(ARGS_PLACEHOLDER in step.text for stage in self.stages for step in stage)
+
+    @property
+    def steps(self) -> List[MacroStep]:
+        return [step for stage in self.stages for step in stage]
+
+
+@dataclass
+class MacroMatch:
+    macro: Macro
+    args: str = ""
+
+
+class MacroEngine:
+    """
+    Compiles the user's custom commands ("movie night" → "open vlc and mute volume") into skill steps once,
+    so matching a trigger is a dictionary lookup and running it needs neither the classifier nor the LLM.
+
+    Actions use the compound-command grammar: "and" / "," run steps concurrently, "then" runs them in order.
+    A step may contain ``{args}``, which is replaced by whatever the user said after the trigger.
+    """
+
+    skill_name = MACRO_SKILL_NAME
+
+    def __init__(self, planner: CommandPlanner) -> None:
+        self.logger = get_logger(__name__)
+        self.planner = planner
+        self._macros: Dict[str, Macro] = {}
+        # First word of the trigger -> macros, longest trigger first, so matching only scans a few candidates.
+        self._by_first_word: Dict[str, List[Macro]] = {}
+
+    def __len__(self) -> int:
+        return len(self._macros)
+
+    def __contains__(self, trigger: str) -> bool:
+        return normalize_utterance(trigger) in self._macros
+
+    @property
+    def macros(self) -> List[Macro]:
+        return list(self._macros.values())
+
+    async def compile_all(
+        self, commands: Mapping[str, str], resolve: Callable[[str], Awaitable[Optional["Skill"]]]
+    ) -> List[str]:
+        """
+        Replaces every macro with freshly compiled ones; returns the triggers that failed to compile.
+        """
+        compiled: Dict[str, Macro] = {}
+        failed: List[str] = []
+        for trigger, action in commands.items():
+            try:
+                macro = await self.compile(trigger, action, resolve)
+            except MacroError as exc:
+                self.logger.warning("Skipping custom command %r: %s", trigger, exc)
+                failed.append(trigger)
+                continue
+            compiled[macro.trigger] = macro
+        self._macros = compiled
+        self._reindex()
+        self.logger.info("Compiled %d custom command(s)", len(compiled))
+        return failed
+
+    async def compile(
+        self, trigger: str, action: str, resolve: Callable[[str], Awaitable[Optional["Skill"]]]
+    ) -> Macro:
+        normalized = normalize_utterance(trigger)
+        if not normalized:
+            raise MacroError("the trigger is empty")
+        macro = Macro(trigger=normalized, action=action)
+        for stage in self.planner.plan(action).stages:
+            compiled_stage: List[MacroStep] = []
+            for step in stage:
+                text = strip_courtesy(step.text)
+                skill = await resolve(text)
+                if skill is None:
+                    raise MacroError(f"no skill handles {text!r}")
+                compiled_stage.append(MacroStep(text=text, skill=skill))
+            macro.stages.append(compiled_stage)
+        if not macro.steps:
+            raise MacroError("the action is empty")
+        return macro
+
+    def add(self, macro: Macro) -> None:
+        self._macros[macro.trigger] = macro
+        self._reindex()
+
+    def remove(self, trigger: str) -> bool:
+        if self._macros.pop(normalize_utterance(trigger), None) is None:
+            return False
+        self._reindex()
+        return True
+
+    def match(self, text: str) -> Optional[MacroMatch]:
+        normalized = normalize_utterance(text)
+        if not normalized:
+            return None
+        exact = self._macros.get(normalized)
+        if exact is not None:
+            return MacroMatch(macro=exact)
+        for macro in self._by_first_word.get(normalized.split(" ", 1)[0], ()):
+            if normalized.startswith(macro.trigger + " ") and macro.takes_args:
+                # Arguments keep the user's casing (names, paths).
+                return MacroMatch(macro=macro, args=strip_courtesy(text)[len(macro.trigger) :].strip())
+        return None
+
+    def _reindex(self) -> None:
+        index: Dict[str, List[Macro]] = {}
+        for macro in sorted(self._macros.values(), key=lambda item: len(item.trigger), reverse=True):
+            index.setdefault(macro.trigger.split(" ", 1)[0], []).append(macro)
+        self._by_first_word = index
+
@@ -4,11 +4,20 @@ import inspect
 import pkgutil
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Type
+from typing import Awaitable, Callable, Dict, List, Optional, Type
 
 from jarvis.assistant.memory.memory_manager import MemoryManager
 from jarvis.assistant.skills.base_skill import Skill
+from jarvis.assistant.skills.command_planner import CommandPlan, CommandPlanner
+from jarvis.assistant.skills.intent_classifier import IntentClassifier, normalize_utterance
+from jarvis.assistant.skills.macro_engine import MACRO_SKILL_NAME, Macro, MacroEngine, MacroMatch
+from jarvis.assistant.system.governor import ResourceGovernor
+from jarvis.assistant.system.monitor import SystemMonitor
+from jarvis.utils.executors import run_in
 from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import ERRORS, SKILL_DISPATCHES
+from jarvis.utils.recording import recorder
+from jarvis.utils.tracing import tracer
 
 
 class SkillManager:
@@ -16,20 +25,58 @@ class SkillManager:
     Loads, manages, and executes Jarvis skills.
     """
 
-    def __init__(self, memory_manager: MemoryManager):
+    def __init__(
+        self,
+        memory_manager: MemoryManager,
+        system_monitor: Optional[SystemMonitor] = None,
+        resource_governor: Optional[ResourceGovernor] = None,
+    ):
         self.logger = get_logger(__name__)
         self.memory = memory_manager
+        self.system_monitor = system_monitor
+        self.resource_governor = resource_governor
+        self.notifier: Optional[Callable[[str], Awaitable[None]]] = None
         self.skills: List[Skill] = []
+        self.intent_classifier = IntentClassifier()
+        self.planner = CommandPlanner(self.intent_classifier)
+        self.macros = MacroEngine(self.planner)
+        self.intent_classifier.macros = self.macros
         self.skill_directory = Path(__file__).parent / "builtin"
         self.custom_skill_directory = Path(__file__).parent / "custom"
         self.custom_skill_directory.mkdir(exist_ok=True, parents=True)
 
     async def load_builtin_skills(self) -> None:
         self.logger.info("Loading builtin skills from %s", self.skill_directory)
-        self.skills = []
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._load_skills_from_package, "jarvis.assistant.skills.builtin")
-        await loop.run_in_executor(None, self._load_skills_from_package, "jarvis.assistant.skills.custom")
+        # A reload builds new instances, so the old ones release their devices and background tasks first.
+        await self.close()
+        await run_in("disk", self._load_skills_from_package, "jarvis.assistant.skills.builtin")
+        await run_in("disk", self._load_skills_from_package, "jarvis.assistant.skills.custom")
+        self.intent_classifier.fit(self.skills)
+        # Compiled steps point at skill instances, so a reload recompiles them against the new ones.
+        await self.compile_macros()
+
+    async def compile_macros(self) -> None:
+        """
+        Compiles the user's custom commands from memory into the dispatch path.
+        """
+        await self.macros.compile_all(self.memory.user_profile.custom_commands, self._resolve_skill)
+
+    async def add_macro(self, trigger: str, action: str) -> Macro:
+        """
+        Compiles and stores a custom command; raises MacroError (and stores nothing) if a step has no skill.
+        """
+        macro = await self.macros.compile(trigger, action, self._resolve_skill)
+        await self.memory.add_custom_command(macro.trigger, action)
+        self.macros.add(macro)
+        return macro
+
+    async def remove_macro(self, trigger: str) -> bool:
+        normalized = normalize_utterance(trigger)
+        removed = self.macros.remove(normalized)
+        for stored in list(self.memory.user_profile.custom_commands):
+            if normalize_utterance(stored) == normalized:
+                removed = await self.memory.remove_custom_command(stored) or removed
+        return removed
 
     def _load_skills_from_package(self, package_name: str) -> None:
         importlib.invalidate_caches()
@@ -47,15 +94,130 @@ class SkillManager:
     def _register_skill(self, skill: Skill) -> None:
         if hasattr(skill, "set_skill_manager"):
             skill.set_skill_manager(self)  # type: ignore[attr-defined]
+        if self.system_monitor is not None and hasattr(skill, "set_system_monitor"):
+            skill.set_system_monitor(self.system_monitor)  # type: ignore[attr-defined]
+        if self.resource_governor is not None and hasattr(skill, "set_resource_governor"):
+            skill.set_resource_governor(self.resource_governor)  # type: ignore[attr-defined]
+        if hasattr(skill, "set_notifier"):
+            skill.set_notifier(self.notify)  # type: ignore[attr-defined]
         self.logger.debug("Registered skill %s", skill.metadata.name)
         self.skills.append(skill)
 
+    async def close(self) -> None:
+        """
+        Lets skills that hold resources (capture devices, watchers) release them, and forgets all skills.
+        """
+        skills, self.skills = self.skills, []
+        for skill in skills:
+            if not hasattr(skill, "close"):
+                continue
+            try:
+                await skill.close()  # type: ignore[attr-defined]
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.warning("Closing skill %s failed: %s", skill.metadata.name, exc)
+
+    async def notify(self, text: str) -> None:
+        """
+        Delivers an unprompted message from a background skill (e.g. screen watch) to the user.
+        """
+        if self.notifier is None:
+            self.logger.info("Skill notification (no notifier attached): %s", text)
+            return
+        await self.notifier(text)
+
+    def get_skill(self, name: str) -> Optional[Skill]:
+        for skill in self.skills:
+            if skill.metadata.name == name:
+                return skill
+        return None
+
     async def execute(self, text: str) -> Optional[str]:
+        macro_match = self.macros.match(text)
+        if macro_match is not None:
+            return await self.execute_macro(macro_match)
+        plan = self.planner.plan(text)
+        if not plan.is_compound:
+            return await self._execute_single(text)
+        return await self.execute_plan(plan)
+
+    async def execute_plan(self, plan: CommandPlan) -> Optional[str]:
+        replies: List[str] = []
+        for stage in plan.stages:
+            if len(stage) == 1:
+                results = [await self._execute_single(stage[0].text)]
+            else:
+                self.logger.info("Running %d independent steps concurrently", len(stage))
+                results = await asyncio.gather(*(self._execute_single(step.text) for step in stage))
+            replies.extend(reply for reply in results if reply)
+        return " ".join(replies) if replies else None
+
+    @tracer.traced("skill.macro")
+    async def execute_macro(self, match: MacroMatch) -> Optional[str]:
+        macro = match.macro
+        self.logger.info("Running custom command %r (%d step(s))", macro.trigger, len(macro.steps))
+        replies: List[str] = []
+        for stage in macro.stages:
+            results = await asyncio.gather(*(self._run_step(step.skill, step.render(match.args)) for step in stage))
+            replies.extend(reply for reply in results if reply)
+        return " ".join(replies) if replies else None
+
+    async def _run_step(self, skill: Skill, text: str) -> Optional[str]:
+        try:
+            return await self._dispatch(skill, text)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            ERRORS.inc(stage="skill")
+            self.logger.exception("Skill %s failed: %s", skill.metadata.name, exc)
+            return None
+
+    async def _dispatch(self, skill: Skill, text: str) -> Optional[str]:
+        SKILL_DISPATCHES.inc(skill=skill.metadata.name)
+        reply = await skill.handle(text, self.memory)
+        if recorder.enabled:
+            # Preferences carry state between turns (e.g. a pending restart), so a replay can restore them.
+            preferences = dict(self.memory.state.user.preferences)
+            recorder.event("skill", skill=skill.metadata.name, text=text, reply=reply, preferences=preferences)
+        return reply
+
+    async def _resolve_skill(self, text: str) -> Optional[Skill]:
+        """
+        Finds the skill that would handle ``text`` today, without running it. Custom commands can't call
+        other custom commands, so macros never recurse.
+        """
         for skill in self.skills:
+            if skill.metadata.name == MACRO_SKILL_NAME:
+                continue
             try:
                 if await skill.can_handle(text):
+                    return skill
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.warning("Skill %s failed to inspect %r: %s", skill.metadata.name, text, exc)
+        match = self.intent_classifier.classify(text)
+        if match.intent != "command" or not match.skill_name or match.skill_name == MACRO_SKILL_NAME:
+            return None
+        return self.get_skill(match.skill_name)
+
+    @tracer.traced("skill.dispatch")
+    async def _execute_single(self, text: str) -> Optional[str]:
+        macro_match = self.macros.match(text)
+        if macro_match is not None:
+            return await self.execute_macro(macro_match)
+        match = self.intent_classifier.classify(text)
+        command_text = match.command_text or text
+        for skill in self.skills:
+            try:
+                if await skill.can_handle(command_text):
                     self.logger.info("Dispatching to skill %s", skill.metadata.name)
-                    return await skill.handle(text, self.memory)
+                    return await self._dispatch(skill, command_text)
             except Exception as exc:  # pylint: disable=broad-exception-caught
+                ERRORS.inc(stage="skill")
                 self.logger.exception("Skill %s failed: %s", skill.metadata.name, exc)
+
+        fuzzy_skill = self.get_skill(match.skill_name) if match.skill_name else None
+        if fuzzy_skill is not None:
+            self.logger.info("Dispatching to skill %s (similarity %.2f)", fuzzy_skill.metadata.name, match.score)
+            try:
+                return await self._dispatch(fuzzy_skill, command_text)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                ERRORS.inc(stage="skill")
+                self.logger.exception("Skill %s failed: %s", fuzzy_skill.metadata.name, exc)
         return "I'm afraid I can't comply with that request just yet."
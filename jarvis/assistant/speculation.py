@@ -0,0 +1,203 @@
+import asyncio
+import re
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+import numpy as np
+
+from jarvis.assistant.skills.intent_classifier import normalize_utterance
+from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import SPECULATION_SAVED, SPECULATIONS
+
+STARTED = "started"
+ACCEPTED = "accepted"
+# The final transcript differed from the one the request was started for.
+REJECTED = "rejected"
+# A later partial transcript changed while the request was running (the user kept talking).
+DIVERGED = "diverged"
+# The utterance was dropped or barged over before its final transcript.
+ABANDONED = "abandoned"
+OUTCOMES = (STARTED, ACCEPTED, REJECTED, DIVERGED, ABANDONED)
+
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s']")
+
+
+def canonical_transcript(text: str) -> str:
+    """
+    Transcript form used to decide whether a speculative request matches: Whisper's partial and final
+    passes often differ only in casing, punctuation and courtesy words.
+    """
+    return " ".join(PUNCTUATION_PATTERN.sub(" ", normalize_utterance(text)).split())
+
+
+class Speculation:
+    """
+    Speculative LLM state for one utterance while it is being recorded.
+    """
+
+    def __init__(self, speculator: "SpeculativeGenerator") -> None:
+        self.speculator = speculator
+        self.text = ""
+        self.task: Optional[asyncio.Task] = None
+        self.attempts = 0
+        self.accepted = False
+        self._started = 0.0
+        self._finished: Optional[float] = None
+        self._partial = ""
+        self._partial_since = 0.0
+        self._last_partial = float("-inf")
+        self._transcribing: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def feed(self, audio: np.ndarray) -> None:
+        """
+        Called with the audio recorded so far; transcribes it in the background unless a pass is running.
+        """
+        if self._closed or (self._transcribing is not None and not self._transcribing.done()):
+            return
+        now = time.monotonic()
+        if now - self._last_partial < self.speculator.partial_interval or not self.speculator.enabled():
+            return
+        self._last_partial = now
+        self._transcribing = asyncio.get_running_loop().create_task(self._update(audio))
+
+    def resolve(self, final_text: Optional[str]) -> Optional[asyncio.Task]:
+        """
+        Settles the speculation against the final transcript (``None`` if it turned out to be a command).
+        Returns the running or finished request if it matches; otherwise cancels it.
+        """
+        self._stop_partials()
+        if self.task is None:
+            return None
+        if final_text is None or canonical_transcript(final_text) != self.text:
+            self._discard(REJECTED)
+            return None
+        now = time.monotonic()
+        saved = min(now, self._finished or now) - self._started
+        self.accepted = True
+        self.speculator.record(ACCEPTED, saved)
+        self.speculator.logger.info("Speculative reply accepted; %.0f ms of generation already done", saved * 1000.0)
+        return self.task
+
+    def cancel(self) -> None:
+        """
+        Abandons the utterance; cancels a request that is still running, even an accepted one.
+        """
+        self._stop_partials()
+        if self.task is None or self.task.done():
+            return
+        if self.accepted:
+            self.task.cancel()
+        else:
+            self._discard(ABANDONED)
+
+    async def _update(self, audio: np.ndarray) -> None:
+        try:
+            text = await self.speculator.transcribe(audio)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.speculator.logger.debug("Partial transcription failed: %s", exc)
+            return
+        if self._closed:
+            return
+        canonical = canonical_transcript(text)
+        now = time.monotonic()
+        if canonical != self._partial:
+            self._partial, self._partial_since = canonical, now
+            if self.task is not None and canonical != self.text:
+                self._discard(DIVERGED)
+            return
+        if self.task is None and now - self._partial_since >= self.speculator.stable_seconds:
+            self._launch(text, canonical)
+
+    def _launch(self, text: str, canonical: str) -> None:
+        speculator = self.speculator
+        if self.attempts >= speculator.max_attempts or len(canonical.split()) < speculator.min_words:
+            return
+        if speculator.classify(text) != "conversation":
+            return
+        self.attempts += 1
+        self.text = canonical
+        self._started, self._finished = time.monotonic(), None
+        self.task = asyncio.get_running_loop().create_task(speculator.generate(text), name="jarvis-speculation")
+        self.task.add_done_callback(self._on_done)
+        speculator.record(STARTED)
+        speculator.logger.debug("Speculating on stable partial transcript %r", text)
+
+    def _on_done(self, task: asyncio.Task) -> None:
+        if task is self.task:
+            self._finished = time.monotonic()
+        if not task.cancelled() and task.exception() is not None and not self.accepted:
+            self.speculator.logger.debug("Speculative request failed: %s", task.exception())
+
+    def _discard(self, outcome: str) -> None:
+        task, self.task, self.text = self.task, None, ""
+        if task is not None and not task.done():
+            task.cancel()
+        self.speculator.record(outcome)
+
+    def _stop_partials(self) -> None:
+        self._closed = True
+        if self._transcribing is not None and not self._transcribing.done():
+            self._transcribing.cancel()
+
+
+class SpeculativeGenerator:
+    """
+    Starts the LLM request while the user is still finishing their sentence: once the running transcript
+    has been stable for ``stable_seconds`` and looks conversational, the request is sent early, kept if
+    the final transcript matches and cancelled if it diverges.
+
+    Aggressiveness is tuned with ``stable_seconds``, ``partial_interval``, ``min_words`` and ``max_attempts``;
+    ``counts`` and ``describe()`` report the acceptance rate and latency saved to tune against.
+    """
+
+    def __init__(
+        self,
+        transcribe: Callable[[np.ndarray], Awaitable[str]],
+        generate: Callable[[str], Awaitable[Optional[str]]],
+        classify: Callable[[str], str],
+        enabled: Optional[Callable[[], bool]] = None,
+        stable_seconds: float = 0.4,
+        partial_interval: float = 0.3,
+        min_words: int = 3,
+        max_attempts: int = 2,
+    ) -> None:
+        self.logger = get_logger(__name__)
+        self.transcribe = transcribe
+        self.generate = generate
+        self.classify = classify
+        self.enabled = enabled or (lambda: True)
+        self.stable_seconds = stable_seconds
+        self.partial_interval = partial_interval
+        self.min_words = min_words
+        self.max_attempts = max_attempts
+        self.counts: Dict[str, int] = dict.fromkeys(OUTCOMES, 0)
+        self.saved_seconds = 0.0
+
+    def begin(self) -> Speculation:
+        return Speculation(self)
+
+    def record(self, outcome: str, saved: Optional[float] = None) -> None:
+        self.counts[outcome] += 1
+        SPECULATIONS.inc(outcome=outcome)
+        if saved is not None:
+            self.saved_seconds += saved
+            SPECULATION_SAVED.observe(saved)
+
+    @property
+    def acceptance_rate(self) -> Optional[float]:
+        started = self.counts[STARTED]
+        return self.counts[ACCEPTED] / started if started else None
+
+    def describe(self) -> str:
+        started, accepted = self.counts[STARTED], self.counts[ACCEPTED]
+        if not started:
+            return "no speculative requests"
+        average = self.saved_seconds / accepted * 1000.0 if accepted else 0.0
+        return (
+            f"{started} speculative requests, {accepted} accepted ({accepted / started:.0%}), "
+            f"{self.counts[REJECTED]} rejected, {self.counts[DIVERGED]} diverged, "
+            f"{self.counts[ABANDONED]} abandoned; {average:.0f} ms saved per accepted reply"
+        )
@@ -0,0 +1,182 @@
+import hashlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+
+from jarvis.utils.logger import get_logger
+
+
+class AudioSource:
+    """
+    Blocking source of mono float32 audio; ``record`` returns ``seconds`` of samples or ``None`` on failure.
+    """
+
+    sample_rate: int = 16000
+
+    def record(self, seconds: float) -> Optional[np.ndarray]:
+        raise NotImplementedError
+
+
+class MicrophoneAudioSource(AudioSource):
+    """
+    Reads from the default input device through a sounddevice input stream. The stream stays open
+    between reads, so consecutive short reads form one gapless recording.
+    """
+
+    def __init__(self, sample_rate: int = 16000) -> None:
+        self.logger = get_logger(__name__)
+        self.sample_rate = sample_rate
+        self._stream = None
+
+    def record(self, seconds: float) -> Optional[np.ndarray]:
+        try:
+            if self._stream is None:
+                # Imported on first use so headless runs don't need PortAudio.
+                import sounddevice  # pylint: disable=import-outside-toplevel
+
+                self._stream = sounddevice.InputStream(samplerate=self.sample_rate, channels=1, dtype="float32")
+                self._stream.start()
+            audio, overflowed = self._stream.read(int(seconds * self.sample_rate))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.logger.exception("Audio capture failed: %s", exc)
+            self.close()
+            return None
+        if overflowed:
+            self.logger.debug("Microphone input overflowed; some samples were dropped.")
+        return audio.flatten()
+
+    def close(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+
+@dataclass
+class ScriptedSegment:
+    """
+    One scripted recording: ``text`` is what the scripted transcriber will "hear" (empty means silence).
+    """
+
+    text: str = ""
+    seconds: float = 1.0
+
+
+@dataclass
+class _ScriptedChunk:
+    segment: int
+    text: str
+    # Fraction of the segment spoken by the end of this chunk.
+    progress: float
+
+
+class ScriptedAudioSource(AudioSource):
+    """
+    Replays a fixed script of utterances and silences, so the listener and pipeline can be driven
+    deterministically without a microphone or Whisper. Pair it with ``transcriber()`` as the listener model.
+
+    A read never crosses a segment boundary; shorter reads consume a segment piecewise, and the transcriber
+    then "hears" the words spoken so far, so partial transcripts grow as they would with Whisper.
+    ``time_scale`` shrinks the real time each recording takes (0 returns instantly).
+    """
+
+    def __init__(self, segments: Sequence[ScriptedSegment], sample_rate: int = 16000, time_scale: float = 0.0) -> None:
+        self.sample_rate = sample_rate
+        self.time_scale = time_scale
+        self._segments = list(segments)
+        self._position = 0
+        self._offset = 0.0
+        self._chunks: Dict[str, _ScriptedChunk] = {}
+        self._chunk_lengths: Set[int] = set()
+        self._lock = threading.Lock()
+        self.exhausted = threading.Event()
+
+    def record(self, seconds: float) -> Optional[np.ndarray]:
+        with self._lock:
+            if self._position < len(self._segments):
+                index = self._position
+                segment = self._segments[index]
+                offset = self._offset
+                duration = min(seconds, segment.seconds - offset)
+                self._offset += duration
+                if self._offset >= segment.seconds - 1e-9:
+                    self._position += 1
+                    self._offset = 0.0
+            else:
+                index, segment, offset, duration = -1, ScriptedSegment(seconds=seconds), 0.0, seconds
+                self.exhausted.set()
+        if self.time_scale:
+            time.sleep(duration * self.time_scale)
+        return self._render(index, segment, offset, duration)
+
+    def _render(self, index: int, segment: ScriptedSegment, offset: float, seconds: float) -> np.ndarray:
+        samples = max(1, int(round(seconds * self.sample_rate)))
+        if segment.text:
+            # Loud noise seeded by the segment and position: it passes energy gating and maps back to the text.
+            key = f"{index}:{offset:.6f}:{segment.text}".encode("utf-8")
+            seed = int.from_bytes(hashlib.blake2b(key, digest_size=4).digest(), "little")
+            audio = (0.5 * np.random.default_rng(seed).standard_normal(samples)).astype(np.float32)
+        else:
+            audio = np.zeros(samples, dtype=np.float32)
+        with self._lock:
+            self._chunks[self._fingerprint(audio)] = _ScriptedChunk(
+                segment=index, text=segment.text, progress=min(1.0, (offset + seconds) / segment.seconds)
+            )
+            self._chunk_lengths.add(samples)
+        return audio
+
+    @staticmethod
+    def _fingerprint(audio: np.ndarray) -> str:
+        return hashlib.blake2b(np.ascontiguousarray(audio).tobytes(), digest_size=16).hexdigest()
+
+    def transcriber(self, latency: float = 0.0) -> "ScriptedTranscriber":
+        return ScriptedTranscriber(self, latency)
+
+    def text_for(self, audio: np.ndarray) -> str:
+        """
+        Decodes audio assembled from this source's reads back into the words spoken so far.
+        """
+        with self._lock:
+            chunks, lengths = dict(self._chunks), sorted(self._chunk_lengths, reverse=True)
+        progress: Dict[int, _ScriptedChunk] = {}
+        position = 0
+        while position < len(audio):
+            for length in lengths:
+                chunk = chunks.get(self._fingerprint(audio[position : position + length]))
+                if chunk is not None:
+                    break
+            else:
+                break  # Not audio from this source.
+            best = progress.get(chunk.segment)
+            if chunk.text and (best is None or chunk.progress > best.progress):
+                progress[chunk.segment] = chunk
+            position += length
+        words: List[str] = []
+        for segment in sorted(progress):
+            chunk = progress[segment]
+            segment_words = chunk.text.split()
+            words.extend(segment_words[: math.ceil(len(segment_words) * chunk.progress - 1e-9)])
+        return " ".join(words)
+
+
+class ScriptedTranscriber:
+    """
+    Stands in for a Whisper model: ``transcribe`` returns the scripted text for audio from its source,
+    optionally after ``latency`` seconds to mimic decode time.
+    """
+
+    def __init__(self, source: ScriptedAudioSource, latency: float = 0.0) -> None:
+        self.source = source
+        self.latency = latency
+
+    def transcribe(self, audio: np.ndarray, **_options) -> Dict[str, List]:
+        if self.latency:
+            time.sleep(self.latency)
+        text = self.source.text_for(audio)
+        return {"text": text, "segments": [{"avg_logprob": 0.0}] if text else []}
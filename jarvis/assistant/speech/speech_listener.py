@@ -1,14 +1,20 @@
 import asyncio
 import re
-from typing import Optional
+import threading
+import time
+from typing import Callable, List, Optional
 
 import numpy as np
-import sounddevice as sd
-import whisper
 
 from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.skills.intent_classifier import IntentClassifier
+from jarvis.assistant.speech.audio_source import AudioSource, MicrophoneAudioSource
 from jarvis.assistant.speech.transcription import TranscriptionResult
-from jarvis.utils.logger import get_logger
+from jarvis.utils.executors import HIGH, NORMAL, run_in
+from jarvis.utils.logger import get_logger, get_rate_limited_logger
+from jarvis.utils.metrics import MODEL_RESIDENT, STT_LATENCY
+from jarvis.utils.recording import recorder
+from jarvis.utils.tracing import tracer
 
 WAKE_WORD_PATTERN = re.compile(r"\bhey\s+jarvis\b", re.IGNORECASE)
 
@@ -18,111 +24,222 @@ class SpeechListener:
     Captures live microphone audio, detects the wake word, and produces transcriptions.
     """
 
-    def __init__(self, memory_manager: MemoryManager, sample_rate: int = 16000) -> None:
+    def __init__(
+        self,
+        memory_manager: MemoryManager,
+        sample_rate: int = 16000,
+        model_name: str = "base",
+        audio_source: Optional[AudioSource] = None,
+    ) -> None:
         self.logger = get_logger(__name__)
+        # The wake loop polls several times a second; its debug lines are sampled instead of logged every pass.
+        self.wake_logger = get_rate_limited_logger(f"{__name__}.wake")
         self.memory = memory_manager
         self.sample_rate = sample_rate
-        self.model = whisper.load_model("base")
+        self.audio_source = audio_source or MicrophoneAudioSource(sample_rate)
+        self.model_name = model_name
+        # Loaded by load_model() so startup can overlap it with the other subsystems.
+        self.model = None
+        self._model_lock = asyncio.Lock()
+        # Wake detection and command transcription run in different pipeline stages but share one model.
+        self._transcribe_lock = threading.Lock()
+        self.wake_poll_interval = 0.2
         self.energy_threshold = 0.01
+        # Commands are read in short chunks and end after this much trailing silence.
+        self.chunk_seconds = 0.25
         self.silence_duration = 1.2
+        self.start_timeout = 5.0
         self.max_phrase_seconds = 18
         self._wake_enabled = True
         self._forced_awake = asyncio.Event()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.intent_classifier: Optional[IntentClassifier] = None
 
     def configure_wake_word(self) -> None:
         # Placeholder for future wake word engines (e.g., openwakeword). For now, rely on transcription check.
         self.logger.info("Wake word detection configured: using transcription-based fallback.")
 
     async def listen(self) -> Optional[TranscriptionResult]:
-        if not self._loop:
-            self._loop = asyncio.get_running_loop()
-        await self._wait_for_wake_word()
-        self.logger.debug("Wake word detected. Listening for follow-up command.")
+        await self.wait_for_wake_word()
+        return await self.capture_command()
 
-        audio = await asyncio.to_thread(self._record_phrase)
+    async def capture_command(self) -> Optional[TranscriptionResult]:
+        audio = await self.record_command()
         if audio is None:
             return None
+        return await self.transcribe_command(audio)
+
+    async def record_command(self, on_audio: Optional[Callable[[np.ndarray], None]] = None) -> Optional[np.ndarray]:
+        """
+        Records until ``silence_duration`` of silence follows speech (or ``max_phrase_seconds`` pass).
+        Once speech has started, ``on_audio`` receives the audio recorded so far after every chunk.
+        """
+        self.logger.debug("Wake word detected. Listening for follow-up command.")
+        chunks: List[np.ndarray] = []
+        recorded = silence = 0.0
+        speech_started = False
+        with tracer.span("stt.record"):
+            while recorded < self.max_phrase_seconds:
+                chunk = await run_in("audio", self.audio_source.record, self.chunk_seconds, priority=HIGH)
+                if chunk is None or not len(chunk):
+                    break
+                chunks.append(chunk)
+                seconds = len(chunk) / self.sample_rate
+                recorded += seconds
+                if self._energy(chunk) >= self.energy_threshold:
+                    speech_started, silence = True, 0.0
+                else:
+                    silence += seconds
+                if speech_started and on_audio is not None:
+                    on_audio(np.concatenate(chunks))
+                if silence >= (self.silence_duration if speech_started else self.start_timeout):
+                    break
+        if not speech_started:
+            return None
+        self.logger.debug("Recorded %.1f s command (%d chunks)", recorded, len(chunks))
+        return np.concatenate(chunks)
 
-        text, confidence = await asyncio.to_thread(self._transcribe_audio, audio)
+    async def transcribe_command(self, audio: np.ndarray) -> Optional[TranscriptionResult]:
+        with tracer.span("stt.transcribe"):
+            text, confidence = await run_in("inference", self._transcribe_audio, audio, priority=HIGH)
         if not text:
             return None
 
-        intent = self._infer_intent(text)
+        with tracer.span("intent"):
+            intent = self.infer_intent(text)
+        recorder.event("intent", text=text, intent=intent)
         return TranscriptionResult(text=text, confidence=confidence, intent=intent)
 
-    async def _wait_for_wake_word(self) -> None:
+    async def transcribe_partial(self, audio: np.ndarray) -> str:
+        """
+        Transcribes an utterance that is still being recorded, behind final transcriptions.
+        """
+        with tracer.span("stt.partial"):
+            text, _ = await run_in("inference", self._transcribe_audio, audio, "partial", priority=NORMAL)
+        return text
+
+    async def wait_for_wake_word(self) -> None:
+        if not self._loop:
+            self._loop = asyncio.get_running_loop()
         if not self._wake_enabled:
             return
-        self.logger.debug("Listening for wake word...")
+        self.wake_logger.debug("Listening for wake word...")
         self._forced_awake.clear()
         while True:
             if self._forced_awake.is_set():
                 self.logger.debug("Wake word bypassed from tray command.")
                 self._forced_awake.clear()
                 return
-            audio = await asyncio.to_thread(self._record_phrase, phrase_time_limit=3.0)
+            with tracer.span("wake.record"):
+                audio = await run_in("audio", self._record_phrase, phrase_time_limit=3.0, priority=HIGH)
             if audio is None:
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(self.wake_poll_interval)
                 continue
 
-            transcript, _ = await asyncio.to_thread(self._transcribe_audio, audio)
+            with tracer.span("wake.transcribe"):
+                transcript, _ = await run_in("inference", self._transcribe_audio, audio, "wake", priority=HIGH)
             if transcript and WAKE_WORD_PATTERN.search(transcript):
                 return
-            await asyncio.sleep(0.2)
+            await asyncio.sleep(self.wake_poll_interval)
 
     def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         self._loop = loop
 
+    @property
+    def model_loaded(self) -> bool:
+        return self.model is not None
+
+    async def load_model(self) -> None:
+        async with self._model_lock:
+            if self.model is not None:
+                return
+            started = time.perf_counter()
+            self.model = await run_in("inference", self._load_whisper, self.model_name)
+            MODEL_RESIDENT.set(1.0, kind="stt", model=self.model_name)
+            self.logger.info(
+                "Whisper model %s loaded in %.0f ms", self.model_name, (time.perf_counter() - started) * 1000.0
+            )
+
+    async def switch_model(self, model_name: str) -> None:
+        async with self._model_lock:
+            if model_name == self.model_name:
+                return
+            if self.model is None:
+                # Not loaded yet: load_model() will pick up the new name.
+                self.model_name = model_name
+                return
+            self.logger.info("Switching Whisper model from %s to %s", self.model_name, model_name)
+            self.model = await run_in("inference", self._load_whisper, model_name)
+            MODEL_RESIDENT.set(0.0, kind="stt", model=self.model_name)
+            MODEL_RESIDENT.set(1.0, kind="stt", model=model_name)
+            self.model_name = model_name
+
+    @staticmethod
+    def _load_whisper(model_name: str):
+        # Importing whisper pulls in torch, which alone costs seconds; keep it off the import path of core.
+        import whisper  # pylint: disable=import-outside-toplevel
+
+        return whisper.load_model(model_name)
+
+    def attach_intent_classifier(self, classifier: IntentClassifier) -> None:
+        self.intent_classifier = classifier
+
     def force_wake(self) -> None:
         if self._loop:
             self._loop.call_soon_threadsafe(self._forced_awake.set)
 
     def _record_phrase(self, phrase_time_limit: Optional[float] = None) -> Optional[np.ndarray]:
         duration = phrase_time_limit or self.max_phrase_seconds
-        self.logger.debug("Recording audio segment for %.1f seconds", duration)
+        self.wake_logger.debug("Recording audio segment for %.1f seconds", duration)
 
-        try:
-            audio = sd.rec(int(duration * self.sample_rate), samplerate=self.sample_rate, channels=1, dtype="float32")
-            sd.wait()
-        except Exception as exc:  # pylint: disable=broad-exception-caught
-            self.logger.exception("Audio capture failed: %s", exc)
+        audio = self.audio_source.record(duration)
+        if audio is None or not len(audio):
             return None
 
-        energy = float(np.linalg.norm(audio) / len(audio))
-        self.logger.debug("Captured audio energy: %.5f", energy)
+        energy = self._energy(audio)
+        self.wake_logger.debug("Captured audio energy: %.5f", energy)
 
         if energy < self.energy_threshold:
             return None
 
-        return audio.flatten()
+        return audio
 
-    def _transcribe_audio(self, audio: np.ndarray) -> tuple[str, float]:
-        result = self.model.transcribe(audio, fp16=False, language="en")
+    @staticmethod
+    def _energy(audio: np.ndarray) -> float:
+        # RMS level; dividing the norm by the length instead scaled the threshold with the recording duration.
+        return float(np.linalg.norm(audio) / np.sqrt(len(audio)))
+
+    def _transcribe_audio(self, audio: np.ndarray, purpose: str = "command") -> tuple[str, float]:
+        if self.model is None:
+            raise RuntimeError("Whisper model is not loaded yet; await load_model() first.")
+        if purpose == "command":
+            # Partial passes are prefixes of the same utterance, so only the final audio is worth keeping.
+            recorder.audio(audio, self.sample_rate)
+        with self._transcribe_lock:
+            started = time.perf_counter()
+            result = self.model.transcribe(audio, fp16=False, language="en")
+            elapsed = time.perf_counter() - started
+            STT_LATENCY.observe(elapsed, model=self.model_name)
 
         text = result.get("text", "").strip()
         confidence = float(np.mean([seg.get("avg_logprob", -1.0) for seg in result.get("segments", [])]) + 1.0) / 2.0
         confidence = max(0.0, min(1.0, confidence))
-        self.logger.debug("Transcription: '%s' (confidence %.2f)", text, confidence)
+        logger = self.logger if purpose == "command" else self.wake_logger
+        logger.debug("Transcription (%s): '%s' (confidence %.2f)", purpose, text, confidence)
+        recorder.event(
+            "stt",
+            purpose=purpose,
+            samples=len(audio),
+            text=text,
+            confidence=confidence,
+            seconds=elapsed,
+            model=self.model_name,
+        )
         return text, confidence
 
-    @staticmethod
-    def _infer_intent(text: str) -> str:
-        lowered = text.lower()
-        command_keywords = (
-            "open ",
-            "launch ",
-            "start ",
-            "close ",
-            "shutdown",
-            "restart",
-            "monitor",
-            "what's my cpu",
-            "show me",
-            "run ",
-            "set ",
-            "remember ",
-        )
-        if any(lowered.startswith(keyword) for keyword in command_keywords):
-            return "command"
-        return "conversation"
+    def infer_intent(self, text: str) -> str:
+        if self.intent_classifier is None:
+            return "conversation"
+        match = self.intent_classifier.classify(text)
+        self.logger.debug("Inferred intent %s (skill=%s, score=%.2f)", match.intent, match.skill_name, match.score)
+        return match.intent
@@ -1,9 +1,15 @@
 import asyncio
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import pyttsx3
 
 from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import TTS_LATENCY
+from jarvis.utils.recording import recorder
+from jarvis.utils.tracing import tracer
 
 
 class SpeechSynthesizer:
@@ -13,10 +19,39 @@ class SpeechSynthesizer:
 
     def __init__(self) -> None:
         self.logger = get_logger(__name__)
-        self.engine = pyttsx3.init()
+        self.engine = None
         self.voice_lock = asyncio.Lock()
-        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis-tts")
+        self.pending = 0
+        self._init_future: Optional[asyncio.Future] = None
+        # interrupt() bumps the generation; speech started under an older generation stops at the next word.
+        self._generation = 0
+        self._speaking_generation = 0
+        self._idle = threading.Event()
+        self._idle.set()
+
+    @property
+    def ready(self) -> bool:
+        return self.engine is not None
+
+    @property
+    def speaking(self) -> bool:
+        return not self._idle.is_set()
+
+    async def initialize(self) -> None:
+        """
+        Creates the pyttsx3 engine on the TTS thread, which is also the thread that later drives it.
+        """
+        if self._init_future is None:
+            self._init_future = asyncio.get_running_loop().run_in_executor(self.executor, self._init_engine)
+        await asyncio.shield(self._init_future)
+
+    def _init_engine(self) -> None:
+        started = time.perf_counter()
+        self.engine = pyttsx3.init()
+        self.engine.connect("started-word", self._on_word)
         self._configure_voice()
+        self.logger.info("TTS engine initialised in %.0f ms", (time.perf_counter() - started) * 1000.0)
 
     def _configure_voice(self) -> None:
         voices = self.engine.getProperty("voices")
@@ -28,14 +63,69 @@ class SpeechSynthesizer:
         self.logger.debug("Configured pyttsx3 voice.")
 
     async def speak(self, text: str) -> None:
+        generation = self._generation
+        self.pending += 1
+        try:
+            await self.initialize()
+            async with self.voice_lock:
+                if generation != self._generation:
+                    self.logger.debug("Skipping speech queued before an interruption.")
+                    return
+                self.logger.debug("Speaking %d-character response: %.80s", len(text), text)
+                started = time.perf_counter()
+                with tracer.span("tts.speak"):
+                    await asyncio.get_running_loop().run_in_executor(
+                        self.executor, self._speak_blocking, text, generation
+                    )
+                elapsed = time.perf_counter() - started
+                TTS_LATENCY.observe(elapsed, engine="pyttsx3")
+                recorder.event("tts", text=text, seconds=elapsed)
+        finally:
+            self.pending -= 1
+
+    async def interrupt(self, timeout: float = 1.0) -> bool:
+        """
+        Stops current playback at the next word boundary and discards speech queued behind it.
+        Returns True once the engine has gone quiet.
+        """
+        self._generation += 1
+        deadline = time.monotonic() + timeout
+        # Poll rather than park a worker thread on the event; playback stops within one word anyway.
+        while not self._idle.is_set():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.01)
+        return True
+
+    def _speak_blocking(self, text: str, generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._speaking_generation = generation
+        self._idle.clear()
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+        finally:
+            self._idle.set()
+
+    def _on_word(self, _name, _location, _length) -> None:
+        # pyttsx3 only honours stop() reliably from inside its own callbacks.
+        if self._speaking_generation != self._generation:
+            self.engine.stop()
+
+    async def render_to_file(self, text: str, path: str) -> None:
+        """
+        Synthesises speech into an audio file instead of the speakers (used by benchmarks as a null sink).
+        """
+        await self.initialize()
         async with self.voice_lock:
-            self.logger.info("Speaking response: %s", text)
-            await asyncio.get_running_loop().run_in_executor(self.executor, self._speak_blocking, text)
+            await asyncio.get_running_loop().run_in_executor(self.executor, self._render_blocking, text, path)
 
-    def _speak_blocking(self, text: str) -> None:
-        self.engine.say(text)
+    def _render_blocking(self, text: str, path: str) -> None:
+        self.engine.save_to_file(text, path)
         self.engine.runAndWait()
 
     async def shutdown(self) -> None:
         self.executor.shutdown(wait=False, cancel_futures=True)
-        self.engine.stop()
+        if self.engine is not None:
+            self.engine.stop()
@@ -0,0 +1,219 @@
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from jarvis.assistant.system.monitor import SystemMonitor
+from jarvis.utils.executors import default_native_threads
+from jarvis.utils.logger import get_logger
+
+
+@dataclass
+class Condition:
+    """
+    A host-state flag with hysteresis: it engages above one threshold and releases below a lower one.
+    """
+
+    name: str
+    engage_above: float
+    release_below: float
+    active: bool = False
+
+    def update(self, value: Optional[float]) -> bool:
+        if value is None:
+            return False
+        if not self.active and value > self.engage_above:
+            self.active = True
+            return True
+        if self.active and value < self.release_below:
+            self.active = False
+            return True
+        return False
+
+
+@dataclass
+class GovernorPolicy:
+    name: str
+    conditions: Tuple[str, ...]
+    apply: Callable[[], Awaitable[None]]
+    revert: Callable[[], Awaitable[None]]
+    active: bool = False
+    changed_at: float = 0.0
+
+
+@dataclass
+class PolicyTransition:
+    policy: str
+    engaged: bool
+    reason: str
+    at: float
+    cpu_before: Optional[float]
+    ram_before: Optional[float]
+    settle_at: float
+    reported: bool = False
+
+
+@dataclass
+class GovernorConfig:
+    cpu_engage: float = 75.0
+    cpu_release: float = 50.0
+    ram_engage: float = 85.0
+    ram_release: float = 75.0
+    window_seconds: float = 60.0
+    min_dwell_seconds: float = 120.0
+    low_power_stt_model: str = "tiny"
+    low_power_wake_interval: float = 1.0
+    low_power_sample_interval: float = 15.0
+    native_threads: int = field(default_factory=lambda: max(1, default_native_threads() // 2))
+
+
+class ResourceGovernor:
+    """
+    Downshifts Jarvis when the host is busy or on battery, and restores it once conditions clear.
+    """
+
+    def __init__(self, monitor: SystemMonitor, config: Optional[GovernorConfig] = None) -> None:
+        self.logger = get_logger(__name__)
+        self.monitor = monitor
+        self.config = config or GovernorConfig()
+        self.conditions: Dict[str, Condition] = {
+            "busy": Condition("busy", self.config.cpu_engage, self.config.cpu_release),
+            "memory_pressure": Condition("memory_pressure", self.config.ram_engage, self.config.ram_release),
+            "on_battery": Condition("on_battery", 0.5, 0.5),
+        }
+        self.policies: List[GovernorPolicy] = []
+        self.transitions: List[PolicyTransition] = []
+
+    def add_policy(
+        self,
+        name: str,
+        conditions: Tuple[str, ...],
+        apply: Callable[[], Awaitable[None]],
+        revert: Callable[[], Awaitable[None]],
+    ) -> None:
+        self.policies.append(GovernorPolicy(name=name, conditions=conditions, apply=apply, revert=revert))
+
+    @property
+    def background_allowed(self) -> bool:
+        """
+        Whether optional background work (indexing, watch modes, speculation) should run right now.
+        """
+        return not self.is_active("defer-background")
+
+    def is_active(self, policy_name: str) -> bool:
+        return any(policy.active for policy in self.policies if policy.name == policy_name)
+
+    def read_conditions(self) -> Dict[str, Optional[float]]:
+        snapshot = self.monitor.get_snapshot()
+        cpu_stats = self.monitor.rolling_stats("cpu", self.config.window_seconds)
+        plugged = snapshot.get("plugged")
+        return {
+            "busy": cpu_stats.mean if cpu_stats.samples else snapshot.get("cpu"),
+            "memory_pressure": snapshot.get("ram"),
+            "on_battery": None if plugged is None else (0.0 if plugged else 1.0),
+        }
+
+    async def evaluate(self) -> None:
+        readings = self.read_conditions()
+        for name, condition in self.conditions.items():
+            if condition.update(readings.get(name)):
+                self.logger.info(
+                    "Governor condition %s %s (reading %s)",
+                    name,
+                    "engaged" if condition.active else "released",
+                    readings.get(name),
+                )
+
+        now = time.monotonic()
+        for policy in self.policies:
+            triggering = [name for name in policy.conditions if self.conditions[name].active]
+            wanted = bool(triggering)
+            if wanted == policy.active:
+                continue
+            if policy.changed_at and now - policy.changed_at < self.config.min_dwell_seconds:
+                continue
+            reason = ", ".join(triggering) if triggering else "conditions cleared"
+            try:
+                await (policy.apply() if wanted else policy.revert())
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.exception("Governor policy %s failed to %s: %s", policy.name, "apply" if wanted else "revert", exc)
+                continue
+            policy.active = wanted
+            policy.changed_at = now
+            self._record_transition(policy, wanted, reason, now)
+
+        self._report_settled(now)
+
+    def _record_transition(self, policy: GovernorPolicy, engaged: bool, reason: str, now: float) -> None:
+        cpu = self.monitor.rolling_stats("cpu", self.config.window_seconds)
+        ram = self.monitor.rolling_stats("ram", self.config.window_seconds)
+        transition = PolicyTransition(
+            policy=policy.name,
+            engaged=engaged,
+            reason=reason,
+            at=now,
+            cpu_before=cpu.mean,
+            ram_before=ram.mean,
+            settle_at=now + self.config.window_seconds,
+        )
+        self.transitions.append(transition)
+        self.transitions = self.transitions[-100:]
+        self.logger.info(
+            "Governor %s policy %s (%s); CPU mean %s%%, RAM mean %s%% over the last %.0fs",
+            "engaged" if engaged else "released",
+            policy.name,
+            reason,
+            self._format(cpu.mean),
+            self._format(ram.mean),
+            self.config.window_seconds,
+        )
+
+    def _report_settled(self, now: float) -> None:
+        for transition in self.transitions:
+            if transition.reported or now < transition.settle_at:
+                continue
+            transition.reported = True
+            window = now - transition.at
+            cpu = self.monitor.rolling_stats("cpu", window)
+            ram = self.monitor.rolling_stats("ram", window)
+            self.logger.info(
+                "Governor policy %s effect after %.0fs: CPU mean %s%% -> %s%%, RAM mean %s%% -> %s%%",
+                transition.policy,
+                window,
+                self._format(transition.cpu_before),
+                self._format(cpu.mean),
+                self._format(transition.ram_before),
+                self._format(ram.mean),
+            )
+
+    @staticmethod
+    def _format(value: Optional[float]) -> str:
+        return "n/a" if value is None else f"{value:.0f}"
+
+
+_native_thread_limit: Optional[int] = None
+
+
+def limit_native_threads(count: Optional[int]) -> None:
+    """
+    Caps torch and OpenCV intra-op thread pools; ``None`` restores the default of one share of the
+    cores per inference worker (see ``default_native_threads``).
+    """
+    global _native_thread_limit  # pylint: disable=global-statement
+    _native_thread_limit = count
+    apply_native_thread_limit()
+
+
+def apply_native_thread_limit() -> None:
+    """
+    Applies the current limit to whichever of torch and OpenCV are loaded; call again after loading them.
+    Importing them here just to configure them would cost seconds on the caller's thread.
+    """
+    target = _native_thread_limit if _native_thread_limit is not None else default_native_threads()
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(target)
+    cv2 = sys.modules.get("cv2")
+    if cv2 is not None:
+        cv2.setNumThreads(target)
+    get_logger(__name__).debug("Native thread pools limited to %d", target)
@@ -1,29 +1,187 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
 import psutil
 
 from jarvis.utils.logger import get_logger
 
+METRICS = ("cpu", "ram", "battery")
+
+
+@dataclass
+class RollingStats:
+    metric: str
+    window_seconds: float
+    samples: int
+    mean: Optional[float] = None
+    max: Optional[float] = None
+    p95: Optional[float] = None
+
+
+@dataclass
+class Trend:
+    stats: RollingStats
+    first: Optional[float] = None
+    last: Optional[float] = None
+    slope_per_minute: float = 0.0
+
+    @property
+    def direction(self) -> str:
+        if abs(self.slope_per_minute) < 0.5:
+            return "steady"
+        return "rising" if self.slope_per_minute > 0 else "falling"
+
+
+@dataclass
+class ProcessUsage:
+    pid: int
+    name: str
+    cpu: float
+    ram_mb: float
+
 
 class SystemMonitor:
     """
-    Samples CPU, RAM, and battery metrics for quick diagnostics.
+    Samples CPU, RAM, and battery metrics into preallocated ring buffers shared by all subsystems.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, sample_interval: float = 5.0, history_seconds: float = 3600.0) -> None:
         self.logger = get_logger(__name__)
+        self.sample_interval = sample_interval
+        self.capacity = max(2, int(history_seconds / sample_interval))
         self.last_sample = {}
+        self._timestamps = np.full(self.capacity, np.nan, dtype=np.float64)
+        self._values = np.full((self.capacity, len(METRICS)), np.nan, dtype=np.float32)
+        self._cursor = 0
+        self._lock = threading.Lock()
+        self._sample_costs: deque = deque(maxlen=256)
+        # The first non-blocking cpu_percent call only establishes a baseline and always reads 0.0.
+        psutil.cpu_percent(interval=None)
+        # The same holds per process, so processes are kept by pid and primed when first seen.
+        self._processes: Dict[int, psutil.Process] = {}
+        self._processes_lock = threading.Lock()
+        self._track_processes()
 
     def sample(self) -> None:
+        started = time.perf_counter()
         cpu = psutil.cpu_percent(interval=None)
         ram = psutil.virtual_memory().percent
         battery = None
+        plugged = None
         if hasattr(psutil, "sensors_battery"):
             battery_info = psutil.sensors_battery()
             battery = battery_info.percent if battery_info else None
+            plugged = battery_info.power_plugged if battery_info else None
 
-        self.last_sample = {"cpu": cpu, "ram": ram, "battery": battery}
+        with self._lock:
+            slot = self._cursor % self.capacity
+            self._timestamps[slot] = time.time()
+            self._values[slot] = (cpu, ram, np.nan if battery is None else battery)
+            self._cursor += 1
+            self.last_sample = {"cpu": cpu, "ram": ram, "battery": battery, "plugged": plugged}
+        self._track_processes()
+        self._sample_costs.append(time.perf_counter() - started)
         self.logger.debug("Sampled system metrics: %s", self.last_sample)
 
     def get_snapshot(self) -> dict:
         if not self.last_sample:
             self.sample()
         return self.last_sample.copy()
+
+    @property
+    def sample_count(self) -> int:
+        return min(self._cursor, self.capacity)
+
+    @property
+    def sampling_overhead(self) -> float:
+        """
+        Mean wall-clock seconds spent per ``sample`` call over recent samples.
+        """
+        if not self._sample_costs:
+            return 0.0
+        return float(np.mean(self._sample_costs))
+
+    def history(self, metric: str, window_seconds: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns chronologically ordered (timestamps, values) for a metric within the window.
+        """
+        column = METRICS.index(metric)
+        cutoff = time.time() - window_seconds
+        with self._lock:
+            timestamps = self._timestamps.copy()
+            values = self._values[:, column].copy()
+        mask = (timestamps >= cutoff) & ~np.isnan(values)
+        order = np.argsort(timestamps[mask])
+        return timestamps[mask][order], values[mask][order]
+
+    def rolling_stats(self, metric: str, window_seconds: float) -> RollingStats:
+        _, values = self.history(metric, window_seconds)
+        if values.size == 0:
+            return RollingStats(metric=metric, window_seconds=window_seconds, samples=0)
+        return RollingStats(
+            metric=metric,
+            window_seconds=window_seconds,
+            samples=int(values.size),
+            mean=float(values.mean()),
+            max=float(values.max()),
+            p95=float(np.percentile(values, 95)),
+        )
+
+    def trend(self, metric: str, window_seconds: float) -> Trend:
+        timestamps, values = self.history(metric, window_seconds)
+        stats = self.rolling_stats(metric, window_seconds)
+        if values.size == 0:
+            return Trend(stats=stats)
+        slope = 0.0
+        if values.size >= 2 and timestamps[-1] > timestamps[0]:
+            slope = float(np.polyfit(timestamps - timestamps[0], values, 1)[0]) * 60.0
+        return Trend(stats=stats, first=float(values[0]), last=float(values[-1]), slope_per_minute=slope)
+
+    def _track_processes(self) -> None:
+        """
+        Primes ``cpu_percent`` for processes started since the last call and forgets those that exited.
+        """
+        try:
+            pids = set(psutil.pids())
+        except psutil.Error:
+            return
+        with self._processes_lock:
+            for pid in set(self._processes) - pids:
+                del self._processes[pid]
+            for pid in pids - set(self._processes):
+                try:
+                    proc = psutil.Process(pid)
+                    proc.cpu_percent(interval=None)
+                except psutil.Error:
+                    continue
+                self._processes[pid] = proc
+
+    def top_processes(self, count: int = 5, key: str = "cpu") -> List[ProcessUsage]:
+        """
+        Lists the heaviest processes by ``cpu`` or ``ram``. CPU figures cover the time since the previous call,
+        or since the process was first sampled.
+        """
+        self._track_processes()
+        with self._processes_lock:
+            processes = list(self._processes.values())
+        usages: List[ProcessUsage] = []
+        for proc in processes:
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_percent(interval=None)
+                    name = proc.name()
+                    ram_mb = proc.memory_info().rss / (1024 * 1024)
+            except psutil.Error:
+                continue
+            usages.append(ProcessUsage(pid=proc.pid, name=name or "unknown", cpu=float(cpu), ram_mb=ram_mb))
+        if not usages:
+            return usages
+        scores = np.fromiter(
+            (usage.cpu if key == "cpu" else usage.ram_mb for usage in usages), dtype=np.float64, count=len(usages)
+        )
+        top = np.argsort(scores)[::-1][:count]
+        return [usages[index] for index in top]
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+import cv2
+import numpy as np
+
+from jarvis.assistant.vision.vision_manager import Frame
+from jarvis.utils.logger import get_logger
+
+ROW_NAMES = ("top", "middle", "bottom")
+COL_NAMES = ("left", "centre", "right")
+HUE_NAMES = (
+    (10, "red"),
+    (22, "orange"),
+    (34, "yellow"),
+    (80, "green"),
+    (100, "cyan"),
+    (130, "blue"),
+    (150, "purple"),
+    (170, "magenta"),
+    (180, "red"),
+)
+
+
+@dataclass
+class RegionStats:
+    name: str
+    brightness: float
+    contrast: float
+    edge_density: float
+    colour: str
+
+
+@dataclass
+class FrameAnalysis:
+    source: str
+    width: int
+    height: int
+    brightness: float
+    contrast: float
+    edge_density: float
+    regions: List[RegionStats] = field(default_factory=list)
+    frame_hash: str = ""
+    cached: bool = False
+
+    @property
+    def brightness_desc(self) -> str:
+        return "dim" if self.brightness < 80 else "balanced" if self.brightness < 170 else "bright"
+
+    @property
+    def contrast_desc(self) -> str:
+        return "soft" if self.contrast < 40 else "defined" if self.contrast < 80 else "high contrast"
+
+    @property
+    def detail_desc(self) -> str:
+        if self.edge_density < 0.01:
+            return "minimal detail"
+        return "moderate detail" if self.edge_density < 0.03 else "high detail"
+
+    def describe(self) -> str:
+        summary = f"The scene appears {self.brightness_desc} with {self.contrast_desc} lighting and {self.detail_desc}."
+        if not self.regions:
+            return summary
+        busiest = max(self.regions, key=lambda region: region.edge_density)
+        darkest = min(self.regions, key=lambda region: region.brightness)
+        colours = [region.colour for region in self.regions]
+        dominant = max(set(colours), key=colours.count)
+        details = [f"Most of the detail is in the {busiest.name}", f"the palette is mostly {dominant}"]
+        if darkest.brightness < self.brightness - 30:
+            details.append(f"the {darkest.name} is noticeably darker")
+        return f"{summary} {', '.join(details)}."
+
+
+class ImageAnalyzer:
+    """
+    Describes frames from a downscaled pyramid level using vectorised per-tile statistics.
+    """
+
+    def __init__(
+        self, max_width: int = 640, grid: tuple[int, int] = (3, 3), cache_size: int = 32, key_width: int = 320
+    ) -> None:
+        self.logger = get_logger(__name__)
+        self.max_width = max_width
+        self.key_width = key_width
+        self.grid = grid
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, FrameAnalysis] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def downscale(self, pixels: np.ndarray) -> np.ndarray:
+        small = pixels
+        # Build the pyramid with exact 2x box-filter halvings (OpenCV's fast path for INTER_AREA), so the
+        # final (< 2x) step can be a cheap linear resize.
+        while small.shape[1] >= self.max_width * 2:
+            small = cv2.resize(small, (small.shape[1] // 2, small.shape[0] // 2), interpolation=cv2.INTER_AREA)
+        if small.shape[1] > self.max_width:
+            height = max(1, round(small.shape[0] * self.max_width / small.shape[1]))
+            small = cv2.resize(small, (self.max_width, height), interpolation=cv2.INTER_LINEAR)
+        if small.shape[2] == 4:
+            return cv2.cvtColor(small, cv2.COLOR_BGRA2BGR)
+        return np.ascontiguousarray(small)
+
+    def cache_key(self, pixels: np.ndarray) -> str:
+        """
+        Hashes a nearest-neighbour sample of the raw frame, so a repeated frame skips the downscale too. Edits
+        smaller than the sample spacing can share a key; they barely move the coarse tile statistics either.
+        """
+        sample = pixels
+        if pixels.shape[1] > self.key_width:
+            height = max(1, round(pixels.shape[0] * self.key_width / pixels.shape[1]))
+            sample = cv2.resize(pixels, (self.key_width, height), interpolation=cv2.INTER_NEAREST)
+        digest = hashlib.blake2b(np.ascontiguousarray(sample).data, digest_size=16)
+        digest.update(repr(pixels.shape).encode("ascii"))
+        return digest.hexdigest()
+
+    def analyze(self, frame: Frame) -> FrameAnalysis:
+        frame_hash = self.cache_key(frame.pixels)
+        with self._lock:
+            cached = self._cache.get(frame_hash)
+            if cached is not None:
+                self._cache.move_to_end(frame_hash)
+        if cached is not None:
+            return dataclasses.replace(cached, source=frame.source, cached=True)
+
+        analysis = self._analyze_small(self.downscale(frame.pixels), frame)
+        analysis.frame_hash = frame_hash
+        with self._lock:
+            self._cache[frame_hash] = analysis
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return analysis
+
+    def _analyze_small(self, small: np.ndarray, frame: Frame) -> FrameAnalysis:
+        # HSV value is max(B, G, R); per-channel cv2.max avoids a strided reduction over the channel axis.
+        blue, green, red = cv2.split(small)
+        value = cv2.max(cv2.max(blue, green), red).astype(np.float32)
+        edges = cv2.Canny(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY), 100, 200) > 0
+
+        rows, cols = self.grid
+        tile_h, tile_w = small.shape[0] // rows, small.shape[1] // cols
+        regions: List[RegionStats] = []
+        if tile_h and tile_w:
+            crop_h, crop_w = tile_h * rows, tile_w * cols
+            value_tiles = value[:crop_h, :crop_w].reshape(rows, tile_h, cols, tile_w)
+            edge_tiles = edges[:crop_h, :crop_w].reshape(rows, tile_h, cols, tile_w)
+            tile_brightness = value_tiles.mean(axis=(1, 3))
+            tile_contrast = value_tiles.std(axis=(1, 3))
+            tile_edges = edge_tiles.mean(axis=(1, 3))
+            # With an integer tile size, an area resize to the grid yields exact per-tile mean colours.
+            tile_colours = cv2.resize(small[:crop_h, :crop_w], (cols, rows), interpolation=cv2.INTER_AREA)
+            colour_names = self._colour_names(tile_colours)
+            for row in range(rows):
+                for col in range(cols):
+                    regions.append(
+                        RegionStats(
+                            name=self._region_name(row, col, rows, cols),
+                            brightness=float(tile_brightness[row, col]),
+                            contrast=float(tile_contrast[row, col]),
+                            edge_density=float(tile_edges[row, col]),
+                            colour=colour_names[row][col],
+                        )
+                    )
+
+        return FrameAnalysis(
+            source=frame.source,
+            width=frame.width,
+            height=frame.height,
+            brightness=float(value.mean()),
+            contrast=float(value.std()),
+            edge_density=float(edges.mean()),
+            regions=regions,
+        )
+
+    @staticmethod
+    def _colour_names(tile_colours: np.ndarray) -> List[List[str]]:
+        hsv = cv2.cvtColor(tile_colours, cv2.COLOR_BGR2HSV)
+        names: List[List[str]] = []
+        for row in hsv:
+            row_names = []
+            for hue, saturation, value in row:
+                if saturation < 40:
+                    row_names.append("black" if value < 60 else "white" if value > 200 else "grey")
+                    continue
+                row_names.append(next(name for bound, name in HUE_NAMES if hue < bound or bound == 180))
+            names.append(row_names)
+        return names
+
+    @staticmethod
+    def _region_name(row: int, col: int, rows: int, cols: int) -> str:
+        if (rows, cols) != (3, 3):
+            return f"region {row + 1}-{col + 1}"
+        if (row, col) == (1, 1):
+            return "centre"
+        if row == 1:
+            return f"{COL_NAMES[col]} side"
+        if col == 1:
+            return f"{ROW_NAMES[row]} centre"
+        return f"{ROW_NAMES[row]} {COL_NAMES[col]}"
+
+
+def describe_screens(analyses: Sequence[FrameAnalysis]) -> str:
+    """
+    Combines per-monitor analyses into one spoken description.
+    """
+    if not analyses:
+        return "However, I couldn't analyze the image content."
+    if len(analyses) == 1:
+        return analyses[0].describe()
+    parts = []
+    for index, analysis in enumerate(analyses, start=1):
+        parts.append(f"Monitor {index} ({analysis.width} by {analysis.height}): {analysis.describe()}")
+    return " ".join(parts)
+
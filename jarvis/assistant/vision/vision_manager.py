@@ -1,49 +1,157 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
 import cv2
 import numpy as np
 from mss import mss
 
+from jarvis.assistant.vision.webcam import WebcamSession
+from jarvis.utils.executors import LOW, run_in
 from jarvis.utils.logger import get_logger
 
+ENCODE_PARAMS = {
+    "png": (".png", [cv2.IMWRITE_PNG_COMPRESSION, 1]),
+    "jpg": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 85]),
+    "webp": (".webp", [cv2.IMWRITE_WEBP_QUALITY, 80]),
+}
+
+
+@dataclass
+class Frame:
+    """
+    An in-memory image: BGRA for screen grabs (a zero-copy view over the mss buffer) or BGR for webcams.
+    """
+
+    pixels: np.ndarray
+    source: str
+    captured_at: float
+
+    @property
+    def width(self) -> int:
+        return int(self.pixels.shape[1])
+
+    @property
+    def height(self) -> int:
+        return int(self.pixels.shape[0])
+
+    def gray(self) -> np.ndarray:
+        code = cv2.COLOR_BGRA2GRAY if self.pixels.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        return cv2.cvtColor(self.pixels, code)
+
 
 class VisionManager:
     """
     Provides screen capture and webcam frames for on-device vision tasks.
     """
 
-    def __init__(self, temp_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        temp_dir: Optional[Path] = None,
+        save_format: str = "jpg",
+        webcam_idle_timeout: float = 30.0,
+    ) -> None:
         self.logger = get_logger(__name__)
         self.temp_dir = temp_dir or Path.cwd() / "jarvis" / "data"
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.save_format = save_format
+        self.webcam_idle_timeout = webcam_idle_timeout
+        self._webcams: Dict[Union[int, str], WebcamSession] = {}
+        # mss keeps per-thread OS handles, so each capture thread gets its own long-lived instance.
+        self._local = threading.local()
+        self._handles: List = []
+        self._handles_lock = threading.Lock()
+        self._pending_saves: set[asyncio.Task] = set()
+        self._capture_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="jarvis-capture")
 
-    def capture_screen(self) -> Path:
-        path = self.temp_dir / "screencap.png"
-        with mss() as sct:
-            monitor = sct.monitors[1]
-            sct_img = sct.grab(monitor)
-            img = np.array(sct_img)
-            cv2.imwrite(str(path), cv2.cvtColor(img, cv2.COLOR_BGRA2BGR))
-        self.logger.info("Screen captured to %s", path)
-        return path
+    def _screen_grabber(self):
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss()
+            self._local.sct = sct
+            with self._handles_lock:
+                self._handles.append(sct)
+        return sct
 
-    def capture_webcam(self, index: int = 0) -> Optional[Path]:
-        cap = cv2.VideoCapture(index)
-        if not cap.isOpened():
-            self.logger.error("Unable to access webcam at index %s", index)
-            return None
+    def grab_screen(self, monitor_index: int = 1) -> Frame:
+        sct = self._screen_grabber()
+        shot = sct.grab(sct.monitors[monitor_index])
+        pixels = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+        return Frame(pixels=pixels, source=f"screen:{monitor_index}", captured_at=time.time())
+
+    def monitor_count(self) -> int:
+        # monitors[0] is the union of all displays; physical monitors start at index 1.
+        return len(self._screen_grabber().monitors) - 1
 
-        ret, frame = cap.read()
-        cap.release()
+    def grab_all_screens(self) -> List[Frame]:
+        """
+        Captures every monitor in parallel, one long-lived mss handle per capture thread.
+        """
+        count = self.monitor_count()
+        if count <= 1:
+            return [self.grab_screen(1)]
+        return list(self._capture_pool.map(self.grab_screen, range(1, count + 1)))
 
-        if not ret:
-            self.logger.error("Failed to capture image from webcam.")
+    def webcam_session(self, source: Union[int, str] = 0) -> WebcamSession:
+        session = self._webcams.get(source)
+        if session is None:
+            session = WebcamSession(source, idle_timeout=self.webcam_idle_timeout)
+            self._webcams[source] = session
+        return session
+
+    def grab_webcam(self, source: Union[int, str] = 0) -> Optional[Frame]:
+        pixels = self.webcam_session(source).latest()
+        if pixels is None:
+            self.logger.error("Failed to capture image from webcam %s.", source)
             return None
+        return Frame(pixels=pixels, source=f"webcam:{source}", captured_at=time.time())
 
-        path = self.temp_dir / "webcam.png"
-        cv2.imwrite(str(path), frame)
-        self.logger.info("Webcam snapshot saved to %s", path)
+    def save_frame(self, frame: Frame, name: str, image_format: Optional[str] = None) -> Path:
+        extension, params = ENCODE_PARAMS[image_format or self.save_format]
+        path = self.temp_dir / f"{name}{extension}"
+        pixels = frame.pixels
+        if pixels.shape[2] == 4:
+            pixels = cv2.cvtColor(pixels, cv2.COLOR_BGRA2BGR)
+        ok, encoded = cv2.imencode(extension, pixels, params)
+        if not ok:
+            raise RuntimeError(f"Failed to encode frame as {extension}")
+        path.write_bytes(encoded.tobytes())
+        self.logger.info("Frame from %s saved to %s", frame.source, path)
         return path
+
+    def save_frame_async(self, frame: Frame, name: str, image_format: Optional[str] = None) -> Path:
+        """
+        Schedules encoding and writing in a worker thread and returns the destination path immediately.
+        """
+        extension, _ = ENCODE_PARAMS[image_format or self.save_format]
+        task = asyncio.get_running_loop().create_task(
+            run_in("disk", self.save_frame, frame, name, image_format, priority=LOW), name=f"jarvis-save-{name}"
+        )
+        self._pending_saves.add(task)
+        task.add_done_callback(self._on_save_done)
+        return self.temp_dir / f"{name}{extension}"
+
+    def _on_save_done(self, task: asyncio.Task) -> None:
+        self._pending_saves.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Saving frame failed: %s", task.exception())
+
+    def close(self) -> None:
+        self._capture_pool.shutdown(wait=False, cancel_futures=True)
+        for session in self._webcams.values():
+            session.close()
+        self._webcams.clear()
+        with self._handles_lock:
+            handles, self._handles = self._handles, []
+        for sct in handles:
+            try:
+                sct.close()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.debug("Closing mss handle failed: %s", exc)
+        self._local = threading.local()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+import cv2
+import numpy as np
+
+from jarvis.assistant.vision.analysis import ImageAnalyzer
+from jarvis.assistant.vision.vision_manager import Frame, VisionManager
+from jarvis.utils.executors import LOW, run_in
+from jarvis.utils.logger import get_logger
+
+
+@dataclass
+class WatchConfig:
+    hash_threshold: int = 10
+    block_threshold: float = 0.08
+    block_delta: float = 12.0
+    thumbnail_size: tuple[int, int] = (64, 36)
+    cpu_budget: float = 0.02
+    min_interval: float = 1.0
+    max_interval: float = 10.0
+    notify_cooldown: float = 30.0
+
+
+@dataclass
+class WatchSample:
+    frame: Frame
+    thumbnail: np.ndarray
+    signature: np.ndarray
+    cost: float
+
+
+def difference_hash(gray: np.ndarray) -> np.ndarray:
+    """
+    64-bit dHash: compares horizontally adjacent pixels of a 9x8 thumbnail.
+    """
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    return np.packbits(small[:, 1:] > small[:, :-1])
+
+
+def hamming_distance(first: np.ndarray, second: np.ndarray) -> int:
+    return int(np.unpackbits(np.bitwise_xor(first, second)).sum())
+
+
+class ScreenWatcher:
+    """
+    Watches the primary screen at low cost and describes it only when it changes meaningfully.
+    """
+
+    def __init__(
+        self,
+        vision: VisionManager,
+        analyzer: ImageAnalyzer,
+        notify: Callable[[str], Awaitable[None]],
+        config: Optional[WatchConfig] = None,
+        background_allowed: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.logger = get_logger(__name__)
+        self.vision = vision
+        self.analyzer = analyzer
+        self.notify = notify
+        self.config = config or WatchConfig()
+        self.background_allowed = background_allowed or (lambda: True)
+        self.interval = self.config.min_interval
+        self._reference: Optional[WatchSample] = None
+        self._last_notified = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._reference = None
+        self.interval = self.config.min_interval
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="jarvis-screen-watch")
+        self.logger.info("Screen watch started.")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self.logger.info("Screen watch stopped.")
+
+    def _sample(self) -> WatchSample:
+        started = time.perf_counter()
+        frame = self.vision.grab_screen()
+        # Shrink first so the colour conversion touches a few thousand pixels instead of the whole screen.
+        small = cv2.resize(frame.pixels, self.config.thumbnail_size, interpolation=cv2.INTER_AREA)
+        thumbnail = cv2.cvtColor(small, cv2.COLOR_BGRA2GRAY if small.shape[2] == 4 else cv2.COLOR_BGR2GRAY)
+        signature = difference_hash(thumbnail)
+        return WatchSample(frame=frame, thumbnail=thumbnail, signature=signature, cost=time.perf_counter() - started)
+
+    def change_score(self, sample: WatchSample) -> tuple[int, float]:
+        """
+        Returns (dHash distance, fraction of 8x8 thumbnail blocks whose mean brightness moved noticeably).
+        """
+        reference = self._reference
+        if reference is None:
+            return 64, 1.0
+        distance = hamming_distance(sample.signature, reference.signature)
+        delta = cv2.absdiff(sample.thumbnail, reference.thumbnail).astype(np.float32)
+        width, height = self.config.thumbnail_size
+        rows, cols = height // 8, width // 8
+        blocks = delta[: rows * 8, : cols * 8].reshape(rows, 8, cols, 8).mean(axis=(1, 3))
+        return distance, float((blocks > self.config.block_delta).mean())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if not self.background_allowed():
+                    await asyncio.sleep(self.config.max_interval)
+                    continue
+                sample = await run_in("inference", self._sample, priority=LOW)
+                distance, block_fraction = self.change_score(sample)
+                changed = distance >= self.config.hash_threshold or block_fraction >= self.config.block_threshold
+                cooldown_left = 0.0
+                if changed:
+                    if self._reference is None:
+                        self._reference = sample
+                    elif await self._on_change(sample, distance, block_fraction):
+                        self._reference = sample
+                    else:
+                        # The reference stays put until the change is reported, so a change made during the
+                        # cooldown is still told once it ends (unless the screen went back in the meantime).
+                        cooldown_left = self._last_notified + self.config.notify_cooldown - time.monotonic()
+                self._adapt_interval(sample.cost, changed)
+                await asyncio.sleep(max(self.interval, cooldown_left))
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.logger.exception("Screen watch sample failed: %s", exc)
+                await asyncio.sleep(self.config.max_interval)
+
+    async def _on_change(self, sample: WatchSample, distance: int, block_fraction: float) -> bool:
+        """
+        Describes the change unless the previous notice is still within its cooldown; returns whether it did.
+        """
+        now = time.monotonic()
+        self.logger.debug("Screen changed (dHash %d, blocks %.2f)", distance, block_fraction)
+        if now - self._last_notified < self.config.notify_cooldown:
+            return False
+        self._last_notified = now
+        analysis = await run_in("inference", self.analyzer.analyze, sample.frame, priority=LOW)
+        await self.notify(f"Your screen just changed. {analysis.describe()}")
+        return True
+
+    def _adapt_interval(self, cost: float, changed: bool) -> None:
+        # Keep sampling within the CPU budget, and back off exponentially while the screen is static.
+        budget_interval = cost / self.config.cpu_budget
+        target = self.config.min_interval if changed else self.interval * 2.0
+        self.interval = min(self.config.max_interval, max(self.config.min_interval, budget_interval, target))
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+
+from jarvis.utils.logger import get_logger
+
+
+class WebcamSession:
+    """
+    Keeps a capture device open while it is in use; a grabber thread holds only the newest frame.
+
+    ``source`` is a camera index or a video file path (files loop at their native frame rate, which
+    makes them a drop-in synthetic camera for tests and benchmarks).
+    """
+
+    def __init__(self, source: Union[int, str] = 0, idle_timeout: float = 30.0, warmup_frames: int = 5) -> None:
+        self.logger = get_logger(__name__)
+        self.source = source
+        self.idle_timeout = idle_timeout
+        self.warmup_frames = warmup_frames
+        self._capture: Optional[cv2.VideoCapture] = None
+        self._front: Optional[np.ndarray] = None
+        self._back: Optional[np.ndarray] = None
+        self._sequence = 0
+        self._last_access = 0.0
+        self._frame_ready = threading.Event()
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_file(self) -> bool:
+        return isinstance(self.source, str)
+
+    def open(self) -> bool:
+        with self._lock:
+            if self.is_open:
+                return True
+            started = time.perf_counter()
+            capture = cv2.VideoCapture(self.source)
+            if not capture.isOpened():
+                self.logger.error("Unable to access webcam source %s", self.source)
+                return False
+
+            ok, first = capture.read()
+            if not ok:
+                capture.release()
+                self.logger.error("Webcam source %s produced no frames.", self.source)
+                return False
+            # Auto-exposure needs a few frames to settle; the very first ones are often dark.
+            if not self.is_file:
+                for _ in range(self.warmup_frames):
+                    capture.read(first)
+
+            self._capture = capture
+            self._front = first
+            self._back = np.empty_like(first)
+            self._sequence = 1
+            self._last_access = time.monotonic()
+            self._frame_ready.set()
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._grab_loop, name=f"jarvis-webcam-{self.source}", daemon=True)
+            self._thread.start()
+        self.logger.info("Webcam source %s opened in %.0f ms", self.source, (time.perf_counter() - started) * 1000.0)
+        return True
+
+    def latest(self, timeout: float = 2.0) -> Optional[np.ndarray]:
+        """
+        Returns a copy of the newest frame, opening the device first if needed.
+        """
+        if not self.is_open and not self.open():
+            return None
+        if not self._frame_ready.wait(timeout):
+            return None
+        with self._lock:
+            self._last_access = time.monotonic()
+            return None if self._front is None else self._front.copy()
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def close(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._release()
+
+    def _release(self) -> None:
+        with self._lock:
+            if self._capture is not None:
+                self._capture.release()
+                self._capture = None
+                self.logger.info("Webcam source %s closed.", self.source)
+            self._thread = None
+            self._front = None
+            self._back = None
+            self._frame_ready.clear()
+
+    def _grab_loop(self) -> None:
+        capture = self._capture
+        frame_interval = 0.0
+        if self.is_file:
+            fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+            frame_interval = 1.0 / fps if fps > 0 else 1.0 / 30.0
+
+        while not self._stop_event.is_set():
+            if time.monotonic() - self._last_access > self.idle_timeout:
+                self.logger.debug("Webcam source %s idle for %.0fs; closing.", self.source, self.idle_timeout)
+                self._release()
+                return
+
+            ok, frame = capture.read(self._back)
+            if not ok:
+                if self.is_file:
+                    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                    continue
+                self.logger.warning("Webcam source %s stopped delivering frames.", self.source)
+                self._release()
+                return
+
+            with self._lock:
+                # OpenCV reuses the preallocated buffer unless the stream's frame shape changed.
+                self._front, self._back = frame, self._front
+                self._sequence += 1
+            if frame_interval:
+                self._stop_event.wait(frame_interval)
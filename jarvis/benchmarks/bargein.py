@@ -0,0 +1,122 @@
+import asyncio
+import pathlib
+import tempfile
+import threading
+import time
+from typing import List
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.pipeline import VoicePipeline
+from jarvis.assistant.speech.audio_source import ScriptedAudioSource, ScriptedSegment
+from jarvis.assistant.speech.speech_listener import SpeechListener
+from jarvis.benchmarks.harness import BenchmarkResult, CheckFailed, summarize
+
+LONG_REQUEST = "tell me a long story about space"
+FOLLOW_UP = "what is the weather like"
+LONG_ANSWER = " ".join(["Once upon a time, far beyond the stars, there was a ship."] * 6)
+CANCEL_BUDGET_SECONDS = 0.3
+
+
+class SimulatedSpeaker:
+    """
+    Mimics SpeechSynthesizer: playback blocks a worker thread word by word and an interrupt only takes
+    effect at the next word boundary, as with pyttsx3's ``started-word`` callback.
+    """
+
+    def __init__(self, word_seconds: float = 0.08) -> None:
+        self.word_seconds = word_seconds
+        self.spoken: List[str] = []
+        self._generation = 0
+        self._idle = threading.Event()
+        self._idle.set()
+
+    async def speak(self, text: str) -> None:
+        await asyncio.to_thread(self._speak_blocking, text, self._generation)
+
+    def _speak_blocking(self, text: str, generation: int) -> None:
+        self._idle.clear()
+        try:
+            for _ in text.split():
+                if generation != self._generation:
+                    return
+                time.sleep(self.word_seconds)
+            self.spoken.append(text)
+        finally:
+            self._idle.set()
+
+    async def interrupt(self) -> bool:
+        self._generation += 1
+        return await asyncio.to_thread(self._idle.wait, 1.0)
+
+
+def _script(silences: int) -> List[ScriptedSegment]:
+    return (
+        [ScriptedSegment("hey jarvis", 3.0), ScriptedSegment(LONG_REQUEST, 2.0)]
+        + [ScriptedSegment("", 3.0)] * silences
+        + [ScriptedSegment("hey jarvis", 3.0), ScriptedSegment(FOLLOW_UP, 2.0)]
+    )
+
+
+async def _scenario(phase: str, scratch: pathlib.Path) -> float:
+    # Barge in while the LLM is still generating, or a few words into playback.
+    llm_seconds, silences = (3.0, 2) if phase == "llm" else (0.2, 6)
+    source = ScriptedAudioSource(_script(silences), time_scale=0.02)
+    listener = SpeechListener(MemoryManager(scratch / "memory.json"), audio_source=source)
+    listener.model = source.transcriber()
+    listener.wake_poll_interval = 0.01
+    speaker = SimulatedSpeaker()
+
+    async def run_conversation(text: str) -> str:
+        if text == LONG_REQUEST:
+            await asyncio.sleep(llm_seconds)
+            return LONG_ANSWER
+        return f"You asked: {text}"
+
+    async def run_command(text: str) -> str:
+        return text
+
+    pipeline = VoicePipeline(
+        listener=listener,
+        run_command=run_command,
+        run_conversation=run_conversation,
+        speak=speaker.speak,
+        interrupt_speech=speaker.interrupt,
+    )
+    pipeline.start()
+    try:
+        for _ in range(200):
+            if any(FOLLOW_UP in text for text in speaker.spoken):
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        await pipeline.stop()
+
+    if pipeline.last_barge_in is None:
+        raise CheckFailed(f"Barge-in during {phase} never triggered.")
+    if LONG_ANSWER in speaker.spoken:
+        raise CheckFailed(f"Barge-in during {phase} did not stop the long answer.")
+    if not any(FOLLOW_UP in text for text in speaker.spoken):
+        raise CheckFailed(f"The follow-up after a barge-in during {phase} was not answered.")
+    return pipeline.last_barge_in
+
+
+async def run(repeat: int = 5) -> List[BenchmarkResult]:
+    """
+    Drives the real listener and pipeline with scripted audio and measures how long a barge-in takes to
+    cancel generation (``llm``) or playback (``tts``), checking that the follow-up utterance is answered and
+    that every cancellation in both phases lands within ``CANCEL_BUDGET_SECONDS``.
+    """
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        for phase in ("llm", "tts"):
+            latencies = [await _scenario(phase, pathlib.Path(tmp)) for _ in range(repeat)]
+            results.append(summarize(f"barge_in.cancel[{phase}]", latencies))
+    over_budget = [result.describe() for result in results if result.max_ms > CANCEL_BUDGET_SECONDS * 1000.0]
+    if over_budget:
+        raise CheckFailed(f"Barge-in over the {CANCEL_BUDGET_SECONDS * 1000.0:.0f} ms budget: {'; '.join(over_budget)}")
+    return results
+
+
+if __name__ == "__main__":
+    for benchmark in asyncio.run(run()):
+        print(benchmark.describe())
@@ -0,0 +1,138 @@
+import inspect
+import json
+import pathlib
+import platform
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+
+class CheckFailed(AssertionError):
+    """
+    Raised by a benchmark whose functional or latency check failed; fails the run instead of skipping the suite.
+    """
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    repeat: int
+    median_ms: float
+    iqr_ms: float
+    min_ms: float
+    max_ms: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def describe(self) -> str:
+        return (
+            f"{self.name}: median {self.median_ms:.3f} ms, IQR {self.iqr_ms:.3f} ms "
+            f"(min {self.min_ms:.3f}, max {self.max_ms:.3f}, n={self.repeat})"
+        )
+
+
+def summarize(name: str, durations: List[float]) -> BenchmarkResult:
+    millis = sorted(duration * 1000.0 for duration in durations)
+    if len(millis) >= 4:
+        quartiles = statistics.quantiles(millis, n=4)
+        iqr = quartiles[2] - quartiles[0]
+    else:
+        iqr = 0.0
+    return BenchmarkResult(
+        name=name,
+        repeat=len(millis),
+        median_ms=statistics.median(millis),
+        iqr_ms=iqr,
+        min_ms=millis[0],
+        max_ms=millis[-1],
+    )
+
+
+def measure(name: str, func: Callable[[], Any], warmup: int = 3, repeat: int = 30) -> BenchmarkResult:
+    """
+    Times a synchronous callable after a few warm-up calls.
+    """
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - started)
+    return summarize(name, durations)
+
+
+async def measure_async(
+    name: str, func: Callable[[], Any], warmup: int = 3, repeat: int = 30
+) -> BenchmarkResult:
+    """
+    Times a coroutine function (or a sync callable, run in place) after a few warm-up calls.
+    """
+
+    async def _call() -> None:
+        result = func()
+        if inspect.isawaitable(result):
+            await result
+
+    for _ in range(warmup):
+        await _call()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await _call()
+        durations.append(time.perf_counter() - started)
+    return summarize(name, durations)
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def change(self) -> float:
+        return self.current_ms / self.baseline_ms - 1.0 if self.baseline_ms else float("inf")
+
+    def describe(self) -> str:
+        return f"{self.name}: {self.baseline_ms:.3f} ms -> {self.current_ms:.3f} ms (+{self.change * 100.0:.0f}%)"
+
+
+def write_report(
+    path: pathlib.Path, results: List[BenchmarkResult], metadata: Optional[Dict[str, Any]] = None
+) -> pathlib.Path:
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "metadata": metadata or {},
+        "results": [result.to_dict() for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
+
+
+def load_report(path: pathlib.Path) -> Dict[str, BenchmarkResult]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return {entry["name"]: BenchmarkResult(**entry) for entry in report.get("results", [])}
+
+
+def compare(
+    results: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult], threshold: float = 0.10
+) -> List[Regression]:
+    """
+    Flags benchmarks whose median grew by more than ``threshold`` and by more than the baseline's IQR,
+    so run-to-run noise on very fast benchmarks doesn't count as a regression.
+    """
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        slower_by = result.median_ms - previous.median_ms
+        if result.median_ms > previous.median_ms * (1.0 + threshold) and slower_by > previous.iqr_ms:
+            regressions.append(Regression(result.name, previous.median_ms, result.median_ms))
+    return regressions
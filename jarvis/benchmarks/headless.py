@@ -0,0 +1,88 @@
+import asyncio
+import json
+import pathlib
+import tempfile
+import time
+from typing import List
+
+from jarvis.assistant.headless import HeadlessServer
+from jarvis.benchmarks.harness import BenchmarkResult, summarize
+from jarvis.utils.logger import get_logger
+
+DISPATCH_TEXT = "system status"
+LLM_TEXT = "Reply with the single word: ready."
+
+
+async def _client(socket_path: pathlib.Path, session: str, text: str, requests: int) -> List[float]:
+    reader, writer = await asyncio.open_unix_connection(str(socket_path))
+    latencies: List[float] = []
+    try:
+        for index in range(requests):
+            started = time.perf_counter()
+            writer.write(json.dumps({"id": index, "session": session, "text": text}).encode("utf-8") + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            if "error" in response:
+                raise RuntimeError(f"Session {session} failed: {response['error']}")
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+    return latencies
+
+
+async def _load(
+    socket_path: pathlib.Path, name: str, text: str, sessions: int, requests: int
+) -> List[BenchmarkResult]:
+    started = time.perf_counter()
+    per_client = await asyncio.gather(
+        *(_client(socket_path, f"{name}-{index}", text, requests) for index in range(sessions))
+    )
+    elapsed = time.perf_counter() - started
+    latencies = [latency for client in per_client for latency in client]
+    # Throughput is reported as time per request so the baseline comparison treats "higher" as slower.
+    return [
+        summarize(f"headless.{name}[{sessions} sessions]", latencies),
+        summarize(f"headless.{name}.per_request[{sessions} sessions]", [elapsed / len(latencies)]),
+    ]
+
+
+async def run(
+    sessions: int = 32,
+    requests: int = 5,
+    endpoint: str = "http://localhost:11434",
+    model: str = "phi3:mini",
+) -> List[BenchmarkResult]:
+    """
+    Load-tests the headless socket front end with many concurrent sessions: skill dispatch always, and
+    LLM conversations when the Ollama endpoint is reachable.
+    """
+    # pylint: disable=import-outside-toplevel
+    from jarvis.assistant.core import JarvisAssistant
+
+    logger = get_logger(__name__)
+    if not hasattr(asyncio, "open_unix_connection"):
+        raise RuntimeError("Unix sockets are not available on this platform.")
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        assistant = JarvisAssistant(data_dir=pathlib.Path(tmp))
+        assistant.llm.client.base_url = endpoint
+        assistant.llm.model = assistant.llm.default_model = model
+        await assistant.initialize_subsystems(voice=False, speech_output=False)
+        socket_path = pathlib.Path(tmp) / "jarvis.sock"
+        server = HeadlessServer(assistant, socket_path=socket_path, use_stdin=False)
+        await server.start()
+        try:
+            results.extend(await _load(socket_path, "dispatch", DISPATCH_TEXT, sessions, requests))
+            if assistant.startup.timings["llm"].ok:
+                results.extend(await _load(socket_path, "llm", LLM_TEXT, sessions, requests))
+            else:
+                logger.info("Skipping headless LLM load: %s is not reachable.", endpoint)
+        finally:
+            await server.stop()
+            await assistant.llm.close()
+    return results
+
+
+if __name__ == "__main__":
+    for result in asyncio.run(run()):
+        print(result.describe())
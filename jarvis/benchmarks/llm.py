@@ -0,0 +1,39 @@
+import asyncio
+import pathlib
+import tempfile
+from typing import List
+
+from jarvis.assistant.llm.llm_client import LLMClient
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.benchmarks.harness import BenchmarkResult, measure_async
+from jarvis.utils.logger import get_logger
+
+PROMPT = "Reply with the single word: ready."
+SYSTEM_PROMPT = "You are Jarvis performing a benchmark. Answer as briefly as possible."
+
+
+async def run(
+    repeat: int = 5, endpoint: str = "http://localhost:11434", model: str = "phi3:mini"
+) -> List[BenchmarkResult]:
+    """
+    Measures an Ollama round-trip (non-streaming generate) against a configurable endpoint.
+    """
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        memory = MemoryManager(memory_path=pathlib.Path(tmp) / "memory.json")
+        async with LLMClient(memory_manager=memory, model=model, base_url=endpoint) as client:
+            if not await client.warm_up():
+                get_logger(__name__).info("Skipping LLM benchmarks: %s is not reachable.", endpoint)
+                return []
+            return [
+                await measure_async(
+                    f"llm.round_trip[{model}]",
+                    lambda: client.generate_response(prompt=PROMPT, system_prompt=SYSTEM_PROMPT),
+                    warmup=1,
+                    repeat=repeat,
+                )
+            ]
+
+
+if __name__ == "__main__":
+    for result in asyncio.run(run()):
+        print(result.describe())
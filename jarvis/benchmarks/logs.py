@@ -0,0 +1,74 @@
+import io
+import logging
+import queue
+import time
+from typing import List
+
+from jarvis.benchmarks.harness import BenchmarkResult, measure
+from jarvis.utils.logger import LOG_FORMAT, DroppingQueueHandler, LogListener, RateLimitFilter
+
+SINK_DELAY = 0.001
+
+
+class _SlowStream(io.StringIO):
+    """
+    A console or disk that takes ``SINK_DELAY`` per write, like a busy terminal or a slow network share.
+    """
+
+    def write(self, text: str) -> int:
+        time.sleep(SINK_DELAY)
+        return super().write(text)
+
+
+def _logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(f"jarvis.bench.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler]
+    return logger
+
+
+def run(repeat: int = 300) -> List[BenchmarkResult]:
+    """
+    Measures what a log call costs the calling thread when the sink is slow: a synchronous stream handler
+    against the queued pipeline, plus a rate-limited wake-loop debug line.
+    """
+    sink = logging.StreamHandler(_SlowStream())
+    sink.setFormatter(logging.Formatter(LOG_FORMAT))
+    results = [
+        measure(
+            "logging.sync_handler",
+            lambda: _logger("sync", sink).info("Interaction %s finished in %.0f ms", "bench", 12.5),
+            repeat=repeat,
+        )
+    ]
+
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=repeat * 2))
+    listener = LogListener(queue_handler, sink)
+    listener.start()
+    try:
+        queued = _logger("queued", queue_handler)
+        results.append(
+            measure(
+                "logging.queued_handler",
+                lambda: queued.info("Interaction %s finished in %.0f ms", "bench", 12.5),
+                repeat=repeat,
+            )
+        )
+        wake = _logger("wake", queue_handler)
+        wake.filters = [RateLimitFilter(interval=10.0)]
+        results.append(
+            measure(
+                "logging.rate_limited_debug",
+                lambda: wake.debug("Captured audio energy: %.5f", 0.00123),
+                repeat=repeat,
+            )
+        )
+    finally:
+        listener.stop()
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(result.describe())
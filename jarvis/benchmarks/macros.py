@@ -0,0 +1,65 @@
+import asyncio
+import pathlib
+import tempfile
+from typing import List, Sequence
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.skills.skill_manager import SkillManager
+from jarvis.benchmarks.harness import BenchmarkResult, CheckFailed, measure, measure_async
+
+TRIGGER_WORDS = ("morning", "evening", "focus", "movie", "work", "gaming", "study", "travel", "night", "quick")
+ACTIONS = ("system status", "latency report", "system status and latency report", "system status then latency report")
+MISS_TEXT = "what do you think about the meaning of life"
+
+
+def user_macros(count: int) -> dict:
+    """
+    ``count`` custom commands whose triggers share a handful of first words, as real routines tend to.
+    """
+    return {
+        f"{TRIGGER_WORDS[index % len(TRIGGER_WORDS)]} routine {index}": ACTIONS[index % len(ACTIONS)]
+        for index in range(count)
+    }
+
+
+async def run(sizes: Sequence[int] = (100, 500), repeat: int = 30) -> List[BenchmarkResult]:
+    """
+    Measures compiling hundreds of custom commands, matching an utterance against them (hit and miss),
+    and end-to-end macro dispatch, which runs skills directly without the classifier or the LLM. Raises if
+    a command fails to compile, the hit doesn't match its own command, or the miss matches one.
+    """
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        memory = MemoryManager(memory_path=pathlib.Path(tmp) / "memory.json")
+        manager = SkillManager(memory_manager=memory)
+        await manager.load_builtin_skills()
+        for size in sizes:
+            memory.state.user.custom_commands = user_macros(size)
+            results.append(
+                await measure_async(
+                    f"macros.compile[{size}]", manager.compile_macros, warmup=1, repeat=max(3, repeat // 5)
+                )
+            )
+            if len(manager.macros) != size:
+                raise CheckFailed(f"Only {len(manager.macros)} of {size} macros compiled.")
+            trigger = f"{TRIGGER_WORDS[-1]} routine {size - 1}"
+            hit = f"please {trigger}"
+            matched = manager.macros.match(hit)
+            if matched is None or matched.macro.trigger != trigger:
+                found = matched.macro.trigger if matched is not None else None
+                raise CheckFailed(f"{hit!r} matched {found!r} instead of {trigger!r} among {size} macros.")
+            if manager.macros.match(MISS_TEXT) is not None:
+                raise CheckFailed(f"{MISS_TEXT!r} matched a custom command among {size} macros.")
+            results.append(measure(f"macros.match[{size}]", lambda hit=hit: manager.macros.match(hit), repeat=repeat))
+            results.append(
+                measure(f"macros.match.miss[{size}]", lambda: manager.macros.match(MISS_TEXT), repeat=repeat)
+            )
+            results.append(
+                await measure_async(f"macros.dispatch[{size}]", lambda hit=hit: manager.execute(hit), repeat=repeat)
+            )
+    return results
+
+
+if __name__ == "__main__":
+    for result in asyncio.run(run()):
+        print(result.describe())
@@ -0,0 +1,37 @@
+import asyncio
+import pathlib
+import tempfile
+from typing import List, Sequence
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.benchmarks.harness import BenchmarkResult, measure_async
+
+HISTORY_SIZES = (0, 50, 500, 5000)
+
+
+def _conversation(size: int) -> List[dict]:
+    return [
+        {"user": f"Question number {index} about the weather", "assistant": f"Answer number {index}: it is sunny."}
+        for index in range(size)
+    ]
+
+
+async def run(repeat: int = 20, sizes: Sequence[int] = HISTORY_SIZES) -> List[BenchmarkResult]:
+    """
+    Measures memory load and flush against JSON files holding different conversation history sizes.
+    """
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        for size in sizes:
+            memory = MemoryManager(memory_path=pathlib.Path(tmp) / f"memory-{size}.json")
+            memory.state.conversation_log = _conversation(size)
+            memory.state.user.preferences = {f"pref-{index}": "on" for index in range(20)}
+            await memory.flush()
+            results.append(await measure_async(f"memory.flush[{size} turns]", memory.flush, repeat=repeat))
+            results.append(await measure_async(f"memory.load[{size} turns]", memory.load, repeat=repeat))
+    return results
+
+
+if __name__ == "__main__":
+    for result in asyncio.run(run()):
+        print(result.describe())
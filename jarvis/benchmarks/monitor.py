@@ -0,0 +1,23 @@
+from typing import List
+
+from jarvis.assistant.system.monitor import SystemMonitor
+from jarvis.benchmarks.harness import BenchmarkResult, measure
+
+
+def run(repeat: int = 200) -> List[BenchmarkResult]:
+    """
+    Measures SystemMonitor sampling overhead and rolling-window queries over a full ring buffer.
+    """
+    monitor = SystemMonitor(sample_interval=1.0, history_seconds=3600.0)
+    results = [measure("monitor.sample", monitor.sample, repeat=repeat)]
+    for _ in range(monitor.capacity):
+        monitor.sample()
+    results.append(measure("monitor.rolling_stats[10m]", lambda: monitor.rolling_stats("cpu", 600.0), repeat=repeat))
+    results.append(measure("monitor.trend[1h]", lambda: monitor.trend("cpu", 3600.0), repeat=repeat))
+    results.append(measure("monitor.top_processes", lambda: monitor.top_processes(5), repeat=10))
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(result.describe())
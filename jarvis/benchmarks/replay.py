@@ -0,0 +1,374 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import pathlib
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.skills.base_skill import Skill
+from jarvis.benchmarks.harness import BenchmarkResult, Regression, compare, summarize
+from jarvis.utils.logger import get_logger
+from jarvis.utils.recording import RecordedInteraction, read_bundle, recorder
+from jarvis.utils.tracing import tracer
+
+BACKENDS = ("stt", "llm", "tts", "skills")
+# Skills whose only effect is on Jarvis's own memory, which a replay keeps in a scratch directory.
+CONTAINED_SKILLS = ("Memory Management", "Custom Commands")
+
+
+def _fingerprint(audio: np.ndarray) -> str:
+    pcm = np.rint(np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2")
+    return hashlib.blake2b(pcm.tobytes(), digest_size=16).hexdigest()
+
+
+class _RecordedEvents:
+    """
+    Recorded events of one kind, handed out once each: the first unused one matching ``key``, else the
+    next unused one in recorded order.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]], key: str) -> None:
+        self.events = events
+        self.key = key
+        self._used = [False] * len(events)
+
+    def take(self, value: Any) -> Optional[Dict[str, Any]]:
+        fallback = None
+        for index, event in enumerate(self.events):
+            if self._used[index]:
+                continue
+            if event.get(self.key) == value:
+                self._used[index] = True
+                return event
+            if fallback is None:
+                fallback = index
+        if fallback is None:
+            return None
+        self._used[fallback] = True
+        return self.events[fallback]
+
+
+class ReplayTranscriber:
+    """
+    Stands in for the Whisper model: returns the transcript recorded for the same audio, after the
+    recorded transcription time unless ``instant``.
+    """
+
+    def __init__(self, interactions: Sequence[RecordedInteraction], instant: bool = False) -> None:
+        self.instant = instant
+        self.results: Dict[str, Dict[str, Any]] = {}
+        for interaction in interactions:
+            event = interaction.first("stt", purpose="command")
+            if interaction.audio is not None and event is not None:
+                self.results[_fingerprint(interaction.audio)] = event
+
+    def transcribe(self, audio: np.ndarray, **_options: Any) -> Dict[str, Any]:
+        event = self.results.get(_fingerprint(audio))
+        if event is None:
+            return {"text": "", "segments": [{"avg_logprob": -1.0}]}
+        if not self.instant:
+            time.sleep(event["seconds"])
+        # The listener maps avg_logprob to confidence as (logprob + 1) / 2.
+        return {"text": event["text"], "segments": [{"avg_logprob": event["confidence"] * 2.0 - 1.0}]}
+
+
+class ReplayLLM:
+    """
+    An httpx transport answering Ollama requests with recorded responses, matched by prompt.
+    """
+
+    def __init__(self, interactions: Sequence[RecordedInteraction], instant: bool = False) -> None:
+        self.logger = get_logger(__name__)
+        self.instant = instant
+        recorded = [event for interaction in interactions for event in interaction.events_of("llm")]
+        self.responses = _RecordedEvents(recorded, "prompt")
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/ps":
+            return httpx.Response(200, json={"models": []})
+        body = json.loads(request.content or b"{}")
+        if "prompt" not in body:
+            # Warm-up request.
+            return httpx.Response(200, json={"done": True})
+        event = self.responses.take(body["prompt"])
+        if event is None:
+            self.logger.warning("No recorded LLM response left for prompt %r", body["prompt"][-80:])
+            return httpx.Response(200, json={"response": "", "done": True})
+        if not self.instant:
+            await asyncio.sleep(event["seconds"])
+        return httpx.Response(200, json={"response": event["response"], "done": True})
+
+
+class ReplaySpeaker:
+    """
+    Stands in for text-to-speech, taking as long as the recorded speech of the same text did.
+    """
+
+    def __init__(self, interactions: Sequence[RecordedInteraction], instant: bool = False) -> None:
+        self.instant = instant
+        recorded = [event for interaction in interactions for event in interaction.events_of("tts")]
+        self.speech = _RecordedEvents(recorded, "text")
+
+    async def speak(self, text: str) -> None:
+        event = self.speech.take(text)
+        seconds = event["seconds"] if event is not None and not self.instant else 0.0
+        with tracer.span("tts.speak"):
+            await asyncio.sleep(seconds)
+        recorder.event("tts", text=text, seconds=seconds)
+
+
+class ReplaySkills:
+    """
+    Stands in for skills with side effects outside Jarvis (launching or closing programs, capturing the
+    screen, writing skill code, restarting the machine): each answers with the reply recorded for the same
+    text instead of running, and leaves the preferences as they were recorded (so a pending restart is still
+    pending). Skills in ``CONTAINED_SKILLS`` still run against the scratch memory.
+    """
+
+    def __init__(self, interactions: Sequence[RecordedInteraction]) -> None:
+        self.logger = get_logger(__name__)
+        recorded: Dict[str, List[Dict[str, Any]]] = {}
+        for interaction in interactions:
+            for event in interaction.events_of("skill"):
+                recorded.setdefault(event["skill"], []).append(event)
+        self.replies = {name: _RecordedEvents(events, "text") for name, events in recorded.items()}
+
+    def attach(self, skills: Sequence[Skill]) -> None:
+        for skill in skills:
+            if skill.metadata.name not in CONTAINED_SKILLS:
+                skill.handle = self._handler(skill.metadata.name)  # type: ignore[method-assign]
+
+    def _handler(self, name: str) -> Callable[[str, MemoryManager], Awaitable[Optional[str]]]:
+        async def handle(text: str, memory: MemoryManager) -> Optional[str]:
+            replies = self.replies.get(name)
+            event = replies.take(text) if replies is not None else None
+            if event is None:
+                self.logger.warning("No recorded %s reply left for %r; not running the skill.", name, text)
+                return None
+            if "preferences" in event:
+                memory.state.user.preferences.clear()
+                memory.state.user.preferences.update(event["preferences"])
+            return event["reply"]
+
+        return handle
+
+
+@dataclass
+class StageComparison:
+    stage: str
+    recorded: BenchmarkResult
+    replayed: BenchmarkResult
+
+    def describe(self) -> str:
+        before, after = self.recorded.median_ms, self.replayed.median_ms
+        change = f"{(after / before - 1.0) * 100.0:+.0f}%" if before else "n/a"
+        return (
+            f"{self.stage}: recorded median {before:.1f} ms, replayed {after:.1f} ms "
+            f"({change}, n={self.replayed.repeat})"
+        )
+
+
+@dataclass
+class ReplayReport:
+    interactions: int
+    stages: List[StageComparison]
+    divergences: List[str]
+    regressions: List[Regression]
+
+    def describe(self) -> List[str]:
+        lines = [f"Replayed {self.interactions} interactions"]
+        lines.extend(stage.describe() for stage in self.stages)
+        lines.extend(f"Divergence {divergence}" for divergence in self.divergences)
+        lines.extend(f"Regression {regression.describe()}" for regression in self.regressions)
+        return lines
+
+
+def _replayable(interaction: RecordedInteraction) -> bool:
+    return interaction.audio is not None or interaction.first("intent") is not None
+
+
+async def _replay_interaction(assistant, interaction: RecordedInteraction, speak: Callable[[str], Awaitable[None]]):
+    if interaction.audio is not None:
+        result = await assistant.listener.transcribe_command(interaction.audio)
+        if result is None:
+            return
+        reply = await assistant.respond(result.text, result.intent)
+    else:
+        recorded = interaction.first("intent")
+        session = assistant.sessions.get(recorded.get("session"))
+        _, reply = await assistant.process_text(recorded["text"], session)
+    if reply and interaction.events_of("tts"):
+        await speak(reply)
+
+
+def _divergences(recorded: RecordedInteraction, replayed: RecordedInteraction) -> List[str]:
+    found: List[str] = []
+
+    def _check(what: str, before: Any, after: Any) -> None:
+        if before != after:
+            found.append(f"{recorded.interaction_id} {what}: {before!r} -> {after!r}")
+
+    before_stt, after_stt = recorded.first("stt", purpose="command"), replayed.first("stt", purpose="command")
+    if before_stt is not None and after_stt is not None:
+        _check("transcript", before_stt["text"], after_stt["text"])
+    before_intents, after_intents = recorded.events_of("intent"), replayed.events_of("intent")
+    if before_intents and after_intents:
+        _check("intent", before_intents[-1]["intent"], after_intents[-1]["intent"])
+    _check(
+        "skills",
+        [(event["skill"], event["reply"]) for event in recorded.events_of("skill")],
+        [(event["skill"], event["reply"]) for event in replayed.events_of("skill")],
+    )
+    # Speculative requests may precede the final one; the last prompt is the one that was answered.
+    before_llm, after_llm = recorded.events_of("llm"), replayed.events_of("llm")
+    if before_llm and after_llm:
+        _check("LLM prompt", before_llm[-1]["prompt"], after_llm[-1]["prompt"])
+    return found
+
+
+def _compare_stages(
+    pairs: List[Tuple[RecordedInteraction, RecordedInteraction]], threshold: float
+) -> Tuple[List[StageComparison], List[Regression]]:
+    recorded_ms: Dict[str, List[float]] = {}
+    replayed_ms: Dict[str, List[float]] = {}
+    for recorded, replayed in pairs:
+        before, after = recorded.stage_ms(), replayed.stage_ms()
+        # Stages that only ran live (capture, partial transcription) have nothing to compare against.
+        for stage in before.keys() & after.keys():
+            recorded_ms.setdefault(stage, []).append(before[stage] / 1000.0)
+            replayed_ms.setdefault(stage, []).append(after[stage] / 1000.0)
+    stages = [
+        StageComparison(
+            stage, summarize(f"replay.{stage}", recorded_ms[stage]), summarize(f"replay.{stage}", replayed_ms[stage])
+        )
+        for stage in sorted(recorded_ms)
+    ]
+    baseline = {stage.recorded.name: stage.recorded for stage in stages}
+    return stages, compare([stage.replayed for stage in stages], baseline, threshold)
+
+
+async def replay(
+    path: pathlib.Path,
+    live: Sequence[str] = (),
+    instant: bool = False,
+    threshold: float = 0.10,
+    output: Optional[pathlib.Path] = None,
+) -> ReplayReport:
+    """
+    Feeds a recording back through a fresh ``JarvisAssistant`` seeded with the recorded memory. Backends
+    not listed in ``live`` answer from the recording with its timings (or instantly), and skills only run
+    for real with ``"skills"`` in ``live``; the replay is itself recorded, and its stage timings and outputs
+    are compared with the original.
+    """
+    # pylint: disable=import-outside-toplevel
+    from jarvis.assistant.core import JarvisAssistant
+
+    logger = get_logger(__name__)
+    bundle = read_bundle(path)
+    interactions = [interaction for interaction in bundle.interactions if _replayable(interaction)]
+    if recorder.enabled:
+        raise RuntimeError("A recording is already in progress; replay records into its own bundle.")
+    tracer.enabled = True
+    with tempfile.TemporaryDirectory(prefix="jarvis-replay-") as tmp:
+        scratch = pathlib.Path(tmp)
+        if "memory" in bundle.meta:
+            (scratch / "memory.json").write_text(json.dumps(bundle.meta["memory"]), encoding="utf-8")
+        assistant = JarvisAssistant(data_dir=scratch)
+        if "stt" in live:
+            assistant.listener.model_name = bundle.meta.get("stt_model", assistant.listener.model_name)
+        else:
+            assistant.listener.model = ReplayTranscriber(interactions, instant)
+        if "llm" in live:
+            assistant.llm.model = assistant.llm.default_model = bundle.meta.get("llm_model", assistant.llm.model)
+        else:
+            base_url = assistant.llm.client.base_url
+            await assistant.llm.close()
+            assistant.llm.client = httpx.AsyncClient(
+                base_url=base_url, transport=ReplayLLM(interactions, instant).transport()
+            )
+        speak = assistant.synthesizer.speak if "tts" in live else ReplaySpeaker(interactions, instant).speak
+        assistant.skill_manager.notifier = speak
+        assistant.listener.attach_intent_classifier(assistant.skill_manager.intent_classifier)
+        replay_path = output or scratch / "replay.jvrb"
+        replayed_ids: List[Tuple[RecordedInteraction, str]] = []
+        try:
+            await assistant.initialize_subsystems(voice="stt" in live, speech_output="tts" in live)
+            if "skills" not in live:
+                ReplaySkills(interactions).attach(assistant.skill_manager.skills)
+            recorder.start(replay_path, {"replay_of": str(path), "live": list(live), "instant": instant})
+            for interaction in interactions:
+                with tracer.interaction("replay") as trace:
+                    try:
+                        await _replay_interaction(assistant, interaction, speak)
+                    except Exception as exc:  # pylint: disable=broad-exception-caught
+                        logger.warning("Replaying %s failed: %s", interaction.interaction_id, exc)
+                replayed_ids.append((interaction, trace.interaction_id))
+        finally:
+            recorder.stop()
+            await assistant.shutdown()
+        replayed = {interaction.interaction_id: interaction for interaction in read_bundle(replay_path).interactions}
+
+    pairs = [(recorded, replayed[replay_id]) for recorded, replay_id in replayed_ids if replay_id in replayed]
+    stages, regressions = _compare_stages(pairs, threshold)
+    divergences = [divergence for recorded, replay_run in pairs for divergence in _divergences(recorded, replay_run)]
+    return ReplayReport(len(pairs), stages, divergences, regressions)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--replay", type=pathlib.Path, help="Replay a recording made with --record, compare and exit.")
+    parser.add_argument(
+        "--replay-live",
+        nargs="+",
+        choices=BACKENDS,
+        default=[],
+        help="Backends to run for real instead of replaying; with 'skills', replayed commands really open and "
+        "close programs or restart the machine.",
+    )
+    parser.add_argument(
+        "--replay-instant",
+        action="store_true",
+        help="Answer replayed backends immediately; checks outputs only, since timings are no longer comparable.",
+    )
+    parser.add_argument(
+        "--replay-threshold",
+        type=float,
+        default=0.10,
+        help="Relative median slowdown per stage that counts as a regression.",
+    )
+    parser.add_argument("--replay-output", type=pathlib.Path, help="Keep the recording of the replay at this path.")
+
+
+async def replay_from_args(args: argparse.Namespace) -> int:
+    """
+    Runs a replay from command-line arguments; returns a non-zero exit code on stage regressions.
+    """
+    logger = get_logger(__name__)
+    report = await replay(
+        args.replay,
+        live=args.replay_live,
+        instant=args.replay_instant,
+        threshold=args.replay_threshold,
+        output=args.replay_output,
+    )
+    for line in report.describe():
+        logger.info("%s", line)
+    return 1 if report.regressions else 0
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Replay a Jarvis session recording.")
+    add_arguments(arg_parser)
+    parsed = arg_parser.parse_args()
+    if parsed.replay is None:
+        arg_parser.error("--replay is required")
+    raise SystemExit(asyncio.run(replay_from_args(parsed)))
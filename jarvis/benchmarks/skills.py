@@ -0,0 +1,198 @@
+import asyncio
+import pathlib
+import tempfile
+from typing import List, Optional, Tuple
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.skills.builtin.status import StatusSkill
+from jarvis.assistant.skills.skill_manager import SkillManager
+from jarvis.benchmarks.harness import BenchmarkResult, CheckFailed, measure, measure_async
+from jarvis.utils.logger import get_logger
+
+# (utterance, expected intent, expected skill). Compound commands are checked the way they are dispatched:
+# routed as a command, with the planner's first step going to the expected skill.
+INTENT_CORPUS: Tuple[Tuple[str, str, Optional[str]], ...] = (
+    # Direct triggers
+    ("system status", "command", "System Status"),
+    ("open notepad", "command", "System Control"),
+    ("take a screenshot", "command", "Vision"),
+    ("latency report", "command", "Diagnostics"),
+    ("my name is Tony", "command", "Memory Management"),
+    ("list my commands", "command", "Custom Commands"),
+    # Courtesy prefixes and suffixes
+    ("please open notepad", "command", "System Control"),
+    ("jarvis, launch calculator please", "command", "System Control"),
+    ("could you take a screenshot for me", "command", "Vision"),
+    ("would you please give me a latency report", "command", "Diagnostics"),
+    ("hey jarvis can you show the top processes", "command", "System Status"),
+    ("i'd like you to remember that my favourite colour is blue", "command", "Memory Management"),
+    ("kindly close spotify, thanks", "command", "System Control"),
+    # Paraphrases
+    ("what's my cpu usage", "command", "System Status"),
+    ("how much battery is left", "command", "System Status"),
+    ("how is the memory looking", "command", "System Status"),
+    ("give me a performance report", "command", "Diagnostics"),
+    ("what do you see on my screen", "command", "Vision"),
+    ("grab the screen", "command", "Vision"),
+    ("switch to serious mode", "command", "Memory Management"),
+    ("keep an eye on my screen", "command", "Vision"),
+    ("show me the webcam", "command", "Vision"),
+    ("restart the computer", "command", "System Control"),
+    ("create skill that tells the time", "command", "Skill Development"),
+    ("jarvis confirm", "command", "Safety Confirmation"),
+    ("forget the command movie night", "command", "Custom Commands"),
+    # Compound commands route on their first step
+    ("open notepad and show me the status", "command", "System Control"),
+    ("take a screenshot then give me a latency report", "command", "Vision"),
+    ("system status and latency report", "command", "System Status"),
+    # Clauses that only extend the previous one stay a single command
+    ("what's the status of my cpu and memory", "command", "System Status"),
+    ("cpu, memory and battery", "command", "System Status"),
+    # A confirmation never runs as a step of a compound command
+    ("restart and confirm", "command", "System Control"),
+    ("open notepad and cancel", "command", "System Control"),
+    # Near-miss chat sentences share words with triggers but are conversation
+    ("tell me a joke about robots", "conversation", None),
+    ("how was the weather in paris last week", "conversation", None),
+    ("what do you think about the meaning of life", "conversation", None),
+    ("what is the status of the mars rover mission", "conversation", None),
+    ("i have a bad memory for names", "conversation", None),
+    ("who painted the mona lisa", "conversation", None),
+    ("explain how a cpu cache works", "conversation", None),
+    ("write a short poem about the sea", "conversation", None),
+    ("what year did the berlin wall fall", "conversation", None),
+    ("recommend a good science fiction book", "conversation", None),
+)
+# Share of INTENT_CORPUS that must route correctly. Known misses at the 0.45 threshold: "keep an eye on my
+# screen" (0.40) and two chat sentences that reuse a trigger word, "status" (0.48) and "memory" (0.53).
+INTENT_ACCURACY_FLOOR = 0.90
+# Per-utterance median classify time.
+INTENT_BUDGET_MS = 1.0
+# Utterances that would reboot or shut down without a separate confirmation if planned as several steps.
+CONFIRMATION_CASES = (
+    "restart and confirm",
+    "restart then jarvis confirm",
+    "shutdown, confirm",
+    "restart and cancel",
+    "open notepad and confirm",
+)
+# Utterances whose later clauses only extend the first; split, the same reply would be spoken once per clause.
+SINGLE_STEP_CASES = (
+    "what's the status of my cpu and memory",
+    "system status and memory usage",
+    "cpu, memory and battery",
+)
+# Trend requests and the window in seconds they must ask for.
+WINDOW_CASES = (
+    ("average cpu over the last five minutes", 300.0),
+    ("memory over the past 10 minutes", 600.0),
+    ("cpu in the last hour", 3600.0),
+    ("battery over the last twenty-five seconds", 25.0),
+    ("cpu over the last couple of minutes", 120.0),
+)
+DISPATCH_COMMANDS = (
+    ("skills.dispatch[status]", "system status"),
+    ("skills.dispatch[diagnostics]", "latency report"),
+    ("skills.dispatch[compound]", "system status and latency report"),
+)
+
+
+def _route(manager: SkillManager, text: str) -> Tuple[str, Optional[str]]:
+    plan = manager.planner.plan(text)
+    if plan.is_compound:
+        return "command", plan.steps[0].skill_name
+    match = manager.intent_classifier.classify(text)
+    return match.intent, match.skill_name if match.intent == "command" else None
+
+
+def check_intent_accuracy(manager: SkillManager) -> float:
+    """
+    Routes every INTENT_CORPUS utterance and raises if fewer than INTENT_ACCURACY_FLOOR are right.
+    """
+    misses = []
+    for text, intent, skill in INTENT_CORPUS:
+        routed = _route(manager, text)
+        if routed != (intent, skill):
+            misses.append(f"{text!r} -> {routed}, expected {(intent, skill)}")
+    accuracy = 1.0 - len(misses) / len(INTENT_CORPUS)
+    logger = get_logger(__name__)
+    logger.info("Intent accuracy %.0f%% on %d utterances", accuracy * 100.0, len(INTENT_CORPUS))
+    for miss in misses:
+        logger.info("Intent miss %s", miss)
+    if accuracy < INTENT_ACCURACY_FLOOR:
+        raise CheckFailed(
+            f"Intent accuracy {accuracy:.0%} is below the {INTENT_ACCURACY_FLOOR:.0%} floor: {'; '.join(misses)}"
+        )
+    return accuracy
+
+
+def check_plans(manager: SkillManager) -> None:
+    """
+    Raises if a CONFIRMATION_CASES utterance is planned with a confirmation step, which would let one
+    utterance both request and confirm a restart or shutdown, or if a SINGLE_STEP_CASES one is split.
+    """
+    for text in CONFIRMATION_CASES:
+        plan = manager.planner.plan(text)
+        if plan.is_compound and any(step.skill_name == "Safety Confirmation" for step in plan.steps):
+            steps = [step.text for step in plan.steps]
+            raise CheckFailed(f"{text!r} was planned as {steps}; a confirmation must be its own utterance.")
+    for text in SINGLE_STEP_CASES:
+        plan = manager.planner.plan(text)
+        if plan.is_compound:
+            raise CheckFailed(f"{text!r} was split into {[step.text for step in plan.steps]}.")
+
+
+def check_status_windows() -> None:
+    """
+    Raises if a WINDOW_CASES request isn't understood as its window.
+    """
+    for text, seconds in WINDOW_CASES:
+        parsed = StatusSkill._parse_window(text)  # pylint: disable=protected-access
+        if parsed != (seconds, True):
+            raise CheckFailed(f"{text!r} was parsed as {parsed}, expected a {seconds:.0f} s window.")
+
+
+async def run(repeat: int = 30) -> List[BenchmarkResult]:
+    """
+    Measures skill discovery, intent inference over a labelled corpus, and side-effect-free dispatch.
+    Raises if routing accuracy drops below its floor, classifying an utterance exceeds its budget, or a
+    confirmation is planned together with another step, a clause that only extends another is split, or a
+    status trend request's window is misread.
+    """
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        memory = MemoryManager(memory_path=pathlib.Path(tmp) / "memory.json")
+        manager = SkillManager(memory_manager=memory)
+        results.append(
+            await measure_async(
+                "skills.discovery", manager.load_builtin_skills, warmup=1, repeat=max(3, repeat // 5)
+            )
+        )
+        check_intent_accuracy(manager)
+        check_plans(manager)
+        check_status_windows()
+        classifier = manager.intent_classifier
+        corpus = [text for text, _, _ in INTENT_CORPUS]
+        classify = measure(
+            f"intent.classify[{len(corpus)} utterances]",
+            lambda: [classifier.classify(text) for text in corpus],
+            repeat=repeat,
+        )
+        results.append(classify)
+        per_utterance_ms = classify.median_ms / len(corpus)
+        if per_utterance_ms > INTENT_BUDGET_MS:
+            raise CheckFailed(
+                f"Classifying an utterance took {per_utterance_ms:.3f} ms; the budget is {INTENT_BUDGET_MS:.1f} ms."
+            )
+        planner = manager.planner
+        results.append(measure("intent.plan[compound]", lambda: planner.plan(DISPATCH_COMMANDS[2][1]), repeat=repeat))
+        for name, command in DISPATCH_COMMANDS:
+            results.append(
+                await measure_async(name, lambda command=command: manager.execute(command), repeat=repeat)
+            )
+    return results
+
+
+if __name__ == "__main__":
+    for result in asyncio.run(run()):
+        print(result.describe())
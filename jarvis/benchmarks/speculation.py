@@ -0,0 +1,128 @@
+import asyncio
+import pathlib
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from jarvis.assistant.memory.memory_manager import MemoryManager
+from jarvis.assistant.pipeline import VoicePipeline
+from jarvis.assistant.skills.skill_manager import SkillManager
+from jarvis.assistant.speculation import SpeculativeGenerator
+from jarvis.assistant.speech.audio_source import ScriptedAudioSource, ScriptedSegment
+from jarvis.assistant.speech.speech_listener import SpeechListener
+from jarvis.benchmarks.harness import BenchmarkResult, summarize
+from jarvis.utils.logger import get_logger
+
+# Each utterance follows a wake word: a plain question, a question with a mid-sentence pause (the early
+# guess diverges), and a command (never speculated on).
+UTTERANCES: Tuple[Tuple[ScriptedSegment, ...], ...] = (
+    (ScriptedSegment("what is the tallest mountain in europe", 2.0),),
+    (
+        ScriptedSegment("tell me about the history", 1.5),
+        ScriptedSegment("", 0.9),
+        ScriptedSegment("of the roman empire", 1.2),
+    ),
+    (ScriptedSegment("system status", 1.0),),
+)
+# Real time: endpointing and the speculator's stability window are both wall-clock.
+TIME_SCALE = 1.0
+STT_SECONDS = 0.15
+LLM_SECONDS = 1.5
+
+
+class _TimedListener(SpeechListener):
+    """
+    Notes when each command recording ends, i.e. when endpointing decided the user had finished.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.endpoints: List[float] = []
+
+    async def record_command(self, on_audio=None) -> Optional[np.ndarray]:
+        audio = await super().record_command(on_audio=on_audio)
+        self.endpoints.append(time.perf_counter())
+        return audio
+
+
+def _script() -> List[ScriptedSegment]:
+    segments: List[ScriptedSegment] = []
+    for utterance in UTTERANCES:
+        segments.append(ScriptedSegment("hey jarvis", 1.0))
+        segments.extend(utterance)
+        # Long enough for the reply to finish before the next wake word, which would otherwise barge in.
+        segments.append(ScriptedSegment("", 3.0))
+    return segments
+
+
+async def _scenario(speculate: bool, skills: SkillManager, scratch: pathlib.Path) -> Tuple[List[float], str]:
+    source = ScriptedAudioSource(_script(), time_scale=TIME_SCALE)
+    listener = _TimedListener(MemoryManager(scratch / "memory.json"), audio_source=source)
+    listener.model = source.transcriber(latency=STT_SECONDS)
+    listener.wake_poll_interval = 0.01
+    listener.attach_intent_classifier(skills.intent_classifier)
+    replies: List[float] = []
+
+    async def generate(text: str) -> str:
+        await asyncio.sleep(LLM_SECONDS)
+        return f"Here is what I know about {text}."
+
+    async def run_conversation(text: str, prefetched: Optional[asyncio.Task] = None) -> str:
+        return await prefetched if prefetched is not None else await generate(text)
+
+    async def speak(_text: str) -> None:
+        replies.append(time.perf_counter())
+
+    speculator = None
+    if speculate:
+        speculator = SpeculativeGenerator(
+            transcribe=listener.transcribe_partial, generate=generate, classify=listener.infer_intent
+        )
+    pipeline = VoicePipeline(
+        listener=listener,
+        run_command=skills.execute,
+        run_conversation=run_conversation,
+        speak=speak,
+        speculator=speculator,
+    )
+    pipeline.start()
+    try:
+        for _ in range(600):
+            if len(replies) >= len(UTTERANCES):
+                break
+            await asyncio.sleep(0.05)
+    finally:
+        await pipeline.stop()
+    if len(replies) < len(UTTERANCES):
+        raise RuntimeError(f"Only {len(replies)} of {len(UTTERANCES)} utterances were answered.")
+    latencies = [reply - endpoint for endpoint, reply in zip(listener.endpoints, replies)]
+    return latencies, speculator.describe() if speculator is not None else ""
+
+
+async def run(repeat: int = 2) -> List[BenchmarkResult]:
+    """
+    Drives the real listener and pipeline with scripted audio, simulated Whisper and LLM latency, and
+    measures the time from the end of each utterance to its reply with and without speculative prefetch.
+    """
+    logger = get_logger(__name__)
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        scratch = pathlib.Path(tmp)
+        skills = SkillManager(memory_manager=MemoryManager(scratch / "skills-memory.json"))
+        await skills.load_builtin_skills()
+        for speculate in (False, True):
+            latencies: List[float] = []
+            for _ in range(repeat):
+                scenario_latencies, summary = await _scenario(speculate, skills, scratch)
+                latencies.extend(scenario_latencies[:2])
+                if summary:
+                    logger.info("Speculation: %s", summary)
+            results.append(summarize(f"speculation.reply_latency[{'on' if speculate else 'off'}]", latencies))
+    return results
+
+
+if __name__ == "__main__":
+    for benchmark in asyncio.run(run()):
+        print(benchmark.describe())
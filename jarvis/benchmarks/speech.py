@@ -0,0 +1,123 @@
+import asyncio
+import pathlib
+import tempfile
+import wave
+from typing import List, Optional
+
+import numpy as np
+
+from jarvis.benchmarks.harness import BenchmarkResult, measure_async
+
+SAMPLE_RATE = 16000
+TTS_SENTENCES = (
+    "Diagnostics complete.",
+    "CPU usage is at twelve percent. Memory usage is forty one percent. Battery charge stands at eighty percent.",
+)
+
+
+def synthetic_utterance(seconds: float = 3.0, seed: int = 11) -> np.ndarray:
+    """
+    Speech-like test signal: amplitude-modulated harmonics with pauses, so energy gating and decoding both run.
+    """
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 140.0 + 30.0 * np.sin(2 * np.pi * 0.7 * times)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(phase * harmonic) / harmonic for harmonic in range(1, 6))
+    syllables = (np.sin(2 * np.pi * 4.0 * times) > -0.2).astype(np.float32)
+    signal = 0.2 * voiced * syllables + 0.005 * rng.standard_normal(times.size)
+    return signal.astype(np.float32)
+
+
+def write_wav(path: pathlib.Path, audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> pathlib.Path:
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes(pcm.tobytes())
+    return path
+
+
+def read_wav(path: pathlib.Path) -> np.ndarray:
+    """
+    Reads a 16-bit PCM WAV as mono float32 at 16 kHz (what Whisper expects).
+    """
+    with wave.open(str(path), "rb") as handle:
+        if handle.getsampwidth() != 2:
+            raise ValueError(f"{path} is not 16-bit PCM")
+        channels, rate = handle.getnchannels(), handle.getframerate()
+        pcm = np.frombuffer(handle.readframes(handle.getnframes()), dtype="<i2")
+    audio = pcm.reshape(-1, channels).mean(axis=1).astype(np.float32) / 32768.0
+    if rate != SAMPLE_RATE:
+        positions = np.linspace(0, audio.size - 1, int(audio.size * SAMPLE_RATE / rate))
+        audio = np.interp(positions, np.arange(audio.size), audio).astype(np.float32)
+    return audio
+
+
+def fixture_wavs(fixtures_dir: Optional[pathlib.Path], scratch_dir: pathlib.Path) -> List[pathlib.Path]:
+    wavs = sorted(fixtures_dir.glob("*.wav")) if fixtures_dir else []
+    if wavs:
+        return wavs
+    return [
+        write_wav(scratch_dir / "synthetic-short.wav", synthetic_utterance(2.0)),
+        write_wav(scratch_dir / "synthetic-long.wav", synthetic_utterance(8.0, seed=12)),
+    ]
+
+
+async def run_stt(
+    repeat: int = 5, fixtures_dir: Optional[pathlib.Path] = None, model_name: str = "base"
+) -> List[BenchmarkResult]:
+    """
+    Measures Whisper transcription on fixture WAVs (or synthetic ones when no fixtures are given).
+    """
+    # pylint: disable=import-outside-toplevel
+    from jarvis.assistant.memory.memory_manager import MemoryManager
+    from jarvis.assistant.speech.speech_listener import SpeechListener
+
+    results: List[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        scratch = pathlib.Path(tmp)
+        listener = SpeechListener(MemoryManager(scratch / "memory.json"), model_name=model_name)
+        await listener.load_model()
+        for path in fixture_wavs(fixtures_dir, scratch):
+            audio = read_wav(path)
+            seconds = audio.size / SAMPLE_RATE
+            results.append(
+                await measure_async(
+                    f"stt.transcribe[{model_name}:{path.stem} {seconds:.1f}s]",
+                    lambda audio=audio: asyncio.to_thread(listener._transcribe_audio, audio),  # pylint: disable=protected-access
+                    warmup=1,
+                    repeat=repeat,
+                )
+            )
+    return results
+
+
+async def run_tts(repeat: int = 5) -> List[BenchmarkResult]:
+    """
+    Measures pyttsx3 synthesis into a scratch file, so nothing plays through the speakers.
+    """
+    from jarvis.assistant.speech.speech_synthesizer import SpeechSynthesizer  # pylint: disable=import-outside-toplevel
+
+    results: List[BenchmarkResult] = []
+    synthesizer = SpeechSynthesizer()
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        results.append(await measure_async("tts.initialize", synthesizer.initialize, warmup=0, repeat=1))
+        target = str(pathlib.Path(tmp) / "speech.wav")
+        for sentence in TTS_SENTENCES:
+            results.append(
+                await measure_async(
+                    f"tts.render[{len(sentence.split())} words]",
+                    lambda sentence=sentence: synthesizer.render_to_file(sentence, target),
+                    warmup=1,
+                    repeat=repeat,
+                )
+            )
+    await synthesizer.shutdown()
+    return results
+
+
+if __name__ == "__main__":
+    for result in asyncio.run(run_stt()) + asyncio.run(run_tts()):
+        print(result.describe())
@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import pathlib
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from jarvis.benchmarks import (
+    bargein,
+    headless,
+    llm,
+    logs,
+    macros,
+    memory,
+    monitor,
+    skills,
+    speculation,
+    speech,
+    vision,
+)
+from jarvis.benchmarks.harness import BenchmarkResult, CheckFailed, compare, load_report, write_report
+from jarvis.utils.logger import get_logger
+
+SUITES = (
+    "memory",
+    "skills",
+    "macros",
+    "stt",
+    "tts",
+    "llm",
+    "bargein",
+    "speculation",
+    "headless",
+    "vision",
+    "monitor",
+    "logs",
+)
+
+
+async def run_suite(
+    selected: Sequence[str] = SUITES,
+    fixtures_dir: Optional[pathlib.Path] = None,
+    llm_endpoint: str = "http://localhost:11434",
+    llm_model: str = "phi3:mini",
+    stt_model: str = "base",
+    failures: Optional[List[str]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Runs the selected subsystem benchmarks in a fixed order. A suite whose dependencies are missing here
+    (no microphone stack, no Ollama, no display) is skipped with a log line instead of failing the run;
+    a suite whose checks fail is reported in ``failures``.
+    """
+    logger = get_logger(__name__)
+    runners: Dict[str, Callable[[], Awaitable[List[BenchmarkResult]]]] = {
+        "memory": memory.run,
+        "skills": skills.run,
+        "macros": macros.run,
+        "stt": lambda: speech.run_stt(fixtures_dir=fixtures_dir, model_name=stt_model),
+        "tts": speech.run_tts,
+        "llm": lambda: llm.run(endpoint=llm_endpoint, model=llm_model),
+        "bargein": bargein.run,
+        "speculation": speculation.run,
+        "headless": lambda: headless.run(endpoint=llm_endpoint, model=llm_model),
+        "vision": lambda: asyncio.to_thread(vision.run, fixtures_dir=fixtures_dir),
+        "monitor": lambda: asyncio.to_thread(monitor.run),
+        "logs": lambda: asyncio.to_thread(logs.run),
+    }
+    results: List[BenchmarkResult] = []
+    for name in SUITES:
+        if name not in selected:
+            continue
+        logger.info("Running %s benchmarks", name)
+        try:
+            suite_results = await runners[name]()
+        except CheckFailed as exc:
+            logger.error("%s benchmark checks failed: %s", name, exc)
+            if failures is not None:
+                failures.append(f"{name}: {exc}")
+            continue
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning("Skipping %s benchmarks: %s", name, exc)
+            continue
+        for result in suite_results:
+            logger.info("%s", result.describe())
+        results.extend(suite_results)
+    return results
+
+
+async def run_bench(
+    output: Optional[pathlib.Path] = None,
+    baseline: Optional[pathlib.Path] = None,
+    threshold: float = 0.10,
+    selected: Sequence[str] = SUITES,
+    fixtures_dir: Optional[pathlib.Path] = None,
+    llm_endpoint: str = "http://localhost:11434",
+    llm_model: str = "phi3:mini",
+    stt_model: str = "base",
+) -> int:
+    """
+    Runs the suite, writes a JSON report, and returns a non-zero exit code if a check failed or the
+    baseline shows regressions.
+    """
+    logger = get_logger(__name__)
+    failures: List[str] = []
+    results = await run_suite(selected, fixtures_dir, llm_endpoint, llm_model, stt_model, failures)
+    if output is not None:
+        metadata = {"suites": list(selected), "llm_endpoint": llm_endpoint, "llm_model": llm_model, "stt_model": stt_model}
+        logger.info("Benchmark report written to %s", write_report(output, results, metadata))
+    if failures:
+        return 1
+    if baseline is None:
+        return 0
+    if not baseline.exists():
+        logger.warning("Baseline %s not found; nothing to compare against.", baseline)
+        return 0
+    regressions = compare(results, load_report(baseline), threshold)
+    for regression in regressions:
+        logger.warning("Regression %s", regression.describe())
+    if regressions:
+        return 1
+    logger.info("No regressions over %.0f%% against %s", threshold * 100.0, baseline)
+    return 0
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--bench-output",
+        type=pathlib.Path,
+        default=pathlib.Path.cwd() / "jarvis" / "data" / "bench-results.json",
+        help="Write benchmark results to this JSON file.",
+    )
+    parser.add_argument("--bench-baseline", type=pathlib.Path, help="Compare against a previous JSON report.")
+    parser.add_argument(
+        "--bench-threshold", type=float, default=0.10, help="Relative median slowdown that counts as a regression."
+    )
+    parser.add_argument("--bench-only", nargs="+", choices=SUITES, default=list(SUITES), help="Suites to run.")
+    parser.add_argument("--bench-fixtures", type=pathlib.Path, help="Directory of fixture WAVs and images.")
+    parser.add_argument("--llm-endpoint", default="http://localhost:11434", help="Ollama endpoint to benchmark.")
+    parser.add_argument("--llm-model", default="phi3:mini", help="Ollama model to benchmark.")
+    parser.add_argument("--stt-model", default="base", help="Whisper model to benchmark.")
+
+
+def bench_from_args(args: argparse.Namespace) -> Awaitable[int]:
+    return run_bench(
+        output=args.bench_output,
+        baseline=args.bench_baseline,
+        threshold=args.bench_threshold,
+        selected=args.bench_only,
+        fixtures_dir=args.bench_fixtures,
+        llm_endpoint=args.llm_endpoint,
+        llm_model=args.llm_model,
+        stt_model=args.stt_model,
+    )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Run the Jarvis benchmark suite.")
+    add_arguments(arg_parser)
+    raise SystemExit(asyncio.run(bench_from_args(arg_parser.parse_args())))
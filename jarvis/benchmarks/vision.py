@@ -0,0 +1,154 @@
+import pathlib
+import tempfile
+import time
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from jarvis.assistant.vision.analysis import ImageAnalyzer
+from jarvis.assistant.vision.vision_manager import ENCODE_PARAMS, Frame, VisionManager
+from jarvis.assistant.vision.webcam import WebcamSession
+from jarvis.benchmarks.harness import BenchmarkResult, CheckFailed, measure
+from jarvis.utils.logger import get_logger
+
+
+def synthetic_frame(width: int = 1920, height: int = 1080, seed: int = 7) -> Frame:
+    """
+    Deterministic desktop-like BGRA frame: a gradient background with a few solid windows and noise.
+    """
+    rng = np.random.default_rng(seed)
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    pixels[:, :, 0] = np.linspace(40, 200, width, dtype=np.uint8)[None, :]
+    pixels[:, :, 1] = np.linspace(30, 120, height, dtype=np.uint8)[:, None]
+    pixels[:, :, 2] = 90
+    pixels[:, :, 3] = 255
+    for _ in range(6):
+        x, y = int(rng.integers(0, width - 400)), int(rng.integers(0, height - 300))
+        pixels[y : y + 300, x : x + 400, :3] = rng.integers(0, 255, size=3, dtype=np.uint8)
+    noise_rows = rng.integers(0, height, size=height // 10)
+    pixels[noise_rows, :, :3] = rng.integers(0, 255, size=(noise_rows.size, width, 3), dtype=np.uint8)
+    return Frame(pixels=pixels, source="synthetic", captured_at=time.time())
+
+
+def fixture_frames(fixtures_dir: Optional[pathlib.Path]) -> List[Frame]:
+    frames: List[Frame] = []
+    if fixtures_dir is None:
+        return frames
+    for path in sorted(fixtures_dir.iterdir()):
+        if path.suffix.lower() not in (".png", ".jpg", ".jpeg", ".webp"):
+            continue
+        pixels = cv2.imread(str(path), cv2.IMREAD_COLOR)
+        if pixels is not None:
+            frames.append(Frame(pixels=pixels, source=path.stem, captured_at=time.time()))
+    return frames
+
+
+def write_clip(path: pathlib.Path, frames: int = 15, fps: float = 30.0, size: tuple = (160, 120)) -> bool:
+    """
+    Writes a short MJPG clip whose frames get brighter one by one; returns False if no encoder is available.
+    """
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    if not writer.isOpened():
+        return False
+    try:
+        for index in range(frames):
+            writer.write(np.full((size[1], size[0], 3), index * 255 // frames, dtype=np.uint8))
+    finally:
+        writer.release()
+    return True
+
+
+def check_webcam_session(scratch: pathlib.Path, repeat: int, idle_timeout: float = 0.5) -> List[BenchmarkResult]:
+    """
+    Plays a synthetic clip through ``WebcamSession``: frames must keep arriving while the session is used,
+    and the device must be released once nobody has asked for a frame for ``idle_timeout`` seconds.
+    """
+    clip = scratch / "webcam.avi"
+    if not write_clip(clip):
+        get_logger(__name__).info("Skipping webcam checks: no MJPG encoder available")
+        return []
+    session = WebcamSession(str(clip), idle_timeout=idle_timeout)
+    try:
+        if session.latest() is None:
+            raise CheckFailed("WebcamSession delivered no frame from the synthetic clip.")
+        first_sequence = session.sequence
+        # Keep using the session well past the idle window; it must stay open and keep grabbing.
+        deadline = time.monotonic() + idle_timeout * 3
+        while time.monotonic() < deadline:
+            if session.latest() is None:
+                raise CheckFailed("WebcamSession stopped returning frames while in use.")
+            time.sleep(idle_timeout / 10)
+        if not session.is_open:
+            raise CheckFailed("WebcamSession closed while frames were still being requested.")
+        if session.sequence <= first_sequence + 10:
+            raise CheckFailed(f"WebcamSession grabbed only {session.sequence - first_sequence} frames in use.")
+        results = [measure("vision.webcam_latest[160x120 clip]", session.latest, repeat=repeat)]
+
+        deadline = time.monotonic() + idle_timeout + 2.0
+        while session.is_open and time.monotonic() < deadline:
+            time.sleep(idle_timeout / 10)
+        if session.is_open:
+            raise CheckFailed(f"WebcamSession was still open {idle_timeout + 2.0:.1f}s after its last use.")
+        return results
+    finally:
+        session.close()
+
+
+def run(repeat: int = 20, fixtures_dir: Optional[pathlib.Path] = None) -> List[BenchmarkResult]:
+    """
+    Measures capture, in-memory description, and encoding costs for the vision pipeline, and checks that a
+    webcam session streams a synthetic clip and closes once idle.
+    """
+    with tempfile.TemporaryDirectory(prefix="jarvis-bench-") as tmp:
+        manager = VisionManager(temp_dir=pathlib.Path(tmp))
+        try:
+            return _run(manager, repeat, fixtures_dir) + check_webcam_session(pathlib.Path(tmp), repeat)
+        finally:
+            manager.close()
+
+
+def _run(manager: VisionManager, repeat: int, fixtures_dir: Optional[pathlib.Path]) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    frame = synthetic_frame()
+    uncached = ImageAnalyzer(cache_size=0)
+    results.append(measure("vision.analyze[1080p synthetic]", lambda: uncached.analyze(frame), repeat=repeat))
+    uhd = synthetic_frame(3840, 2160)
+    results.append(measure("vision.analyze[4k synthetic]", lambda: uncached.analyze(uhd), repeat=repeat))
+    cached = ImageAnalyzer()
+    results.append(measure("vision.analyze[4k cached]", lambda: cached.analyze(uhd), repeat=repeat))
+    for fixture in fixture_frames(fixtures_dir):
+        results.append(
+            measure(f"vision.analyze[{fixture.source}]", lambda fixture=fixture: uncached.analyze(fixture), repeat=repeat)
+        )
+
+    try:
+        manager.grab_screen()
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        get_logger(__name__).info("Skipping screen capture benchmarks: %s", exc)
+    else:
+        results.append(measure("vision.grab_screen", manager.grab_screen, repeat=repeat))
+        results.append(measure("vision.grab_all_screens", manager.grab_all_screens, repeat=repeat))
+        results.append(
+            measure(
+                "vision.capture_to_description",
+                lambda: [uncached.analyze(screen).describe() for screen in manager.grab_all_screens()],
+                repeat=repeat,
+            )
+        )
+
+    for image_format in ENCODE_PARAMS:
+        results.append(
+            measure(
+                f"vision.encode[{image_format}]",
+                lambda image_format=image_format: manager.save_frame(frame, "bench-frame", image_format),
+                warmup=1,
+                repeat=max(3, repeat // 4),
+            )
+        )
+    return results
+
+
+if __name__ == "__main__":
+    for result in run():
+        print(result.describe())
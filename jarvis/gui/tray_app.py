@@ -28,10 +28,14 @@ class TrayApplication:
         menu = pystray.Menu(
             pystray.MenuItem("Wake Jarvis", lambda _icon, _item: self.assistant.listener.force_wake()),
             pystray.MenuItem("Sample Metrics", lambda _icon, _item: self.assistant.monitor.sample()),
+            pystray.MenuItem(
+                lambda _item: "Stop Profiler" if self.assistant.profiler.running else "Start Profiler",
+                lambda _icon, _item: self.assistant.profiler.toggle(),
+            ),
             pystray.MenuItem("Exit", lambda _icon, _item: self.stop()),
         )
         self._icon = pystray.Icon("Jarvis", icon_image, "Jarvis Assistant", menu=menu)
-        self._thread = threading.Thread(target=self._icon.run, daemon=True)
+        self._thread = threading.Thread(target=self._icon.run, name="jarvis-tray", daemon=True)
         self._thread.start()
         self.logger.info("Tray icon started.")
 
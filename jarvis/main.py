@@ -1,17 +1,42 @@
 import argparse
 import asyncio
+import pathlib
 import signal
+from typing import Optional
 
 from jarvis.assistant.core import JarvisAssistant
-from jarvis.gui.tray_app import TrayApplication
-from jarvis.utils.logger import configure_logging
+from jarvis.assistant.headless import HeadlessServer
+from jarvis.benchmarks import replay, suite
+from jarvis.utils.logger import configure_logging, get_logger
+from jarvis.utils.metrics import MetricsExporter
+from jarvis.utils.tracing import tracer
 
 
-async def run(check_only: bool = False) -> None:
+async def run(
+    check_only: bool = False,
+    metrics_port: Optional[int] = None,
+    metrics_file: Optional[pathlib.Path] = None,
+    profile: bool = False,
+    headless: bool = False,
+    socket_path: Optional[pathlib.Path] = None,
+    port: Optional[int] = None,
+    use_stdin: bool = True,
+    speak: bool = False,
+    record: Optional[pathlib.Path] = None,
+) -> None:
     configure_logging()
 
     assistant = JarvisAssistant()
-    tray = TrayApplication(assistant=assistant)
+    server: Optional[HeadlessServer] = None
+    tray = None
+    if not headless:
+        # The tray pulls in pystray and Pillow, which a headless box doesn't need.
+        from jarvis.gui.tray_app import TrayApplication
+
+        tray = TrayApplication(assistant=assistant)
+    exporter = MetricsExporter(port=metrics_port, file_path=metrics_file)
+    if profile:
+        assistant.profiler.start()
 
     loop = asyncio.get_running_loop()
 
@@ -24,33 +49,111 @@ async def run(check_only: bool = False) -> None:
         if not stop_event.is_set():
             stop_event.set()
             await assistant.shutdown()
-            tray.stop()
+            if tray is not None:
+                tray.stop()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, _handle_shutdown)
 
     try:
         if check_only:
-            await assistant.memory.load()
-            await assistant.skill_manager.load_builtin_skills()
-            await assistant.llm.generate_response(
-                prompt="Run a quick systems diagnostic summary.",
-                system_prompt="You are Jarvis performing a startup check.",
-            )
-            await assistant.synthesizer.speak("Diagnostics complete. All subsystems nominal.")
+            with tracer.interaction("check"):
+                with tracer.span("startup"):
+                    await assistant.initialize_subsystems()
+                await assistant.llm.generate_response(
+                    prompt="Run a quick systems diagnostic summary.",
+                    system_prompt="You are Jarvis performing a startup check.",
+                )
+                await assistant.synthesizer.speak("Diagnostics complete. All subsystems nominal.")
+            logger = get_logger(__name__)
+            for trace in tracer.recent_traces():
+                logger.info("Trace %s", trace.describe())
+            for line in tracer.summary():
+                logger.info("Latency %s", line)
             await assistant.shutdown()
             return
 
-        await assistant.start()
-        tray.start()
+        if headless:
+            await assistant.start(voice=False, speech_output=speak)
+            # With only stdin to serve, end-of-input means the session is over.
+            server = HeadlessServer(
+                assistant,
+                socket_path=socket_path,
+                port=port,
+                use_stdin=use_stdin,
+                speak=speak,
+                on_stdin_closed=None if socket_path or port else _handle_shutdown,
+            )
+            await server.start()
+        else:
+            await assistant.start()
+            tray.start()
+        if record is not None:
+            await assistant.start_recording(record)
+        await exporter.start()
         await stop_event.wait()
     finally:
+        if server is not None:
+            await server.stop()
+        await exporter.stop()
         await assistant.shutdown()
-        tray.stop()
+        if tray is not None:
+            tray.stop()
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Launch the Jarvis assistant.")
     parser.add_argument("--check", action="store_true", help="Run a diagnostics check and exit.")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on 127.0.0.1 at this port.")
+    parser.add_argument("--metrics-file", type=pathlib.Path, help="Periodically rewrite Prometheus metrics to this file.")
+    parser.add_argument(
+        "--profile", action="store_true", help="Run the sampling profiler from startup and dump stacks on exit."
+    )
+    parser.add_argument(
+        "--bench", action="store_true", help="Run the per-subsystem benchmark suite, write JSON results and exit."
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without microphone or tray, answering JSON lines on stdin and a local socket.",
+    )
+    parser.add_argument(
+        "--socket",
+        type=pathlib.Path,
+        default=pathlib.Path(__file__).resolve().parent / "data" / "jarvis.sock",
+        help="Unix socket path for --headless.",
+    )
+    parser.add_argument("--no-socket", action="store_true", help="With --headless, only read stdin.")
+    parser.add_argument(
+        "--port", type=int, help="With --headless, listen on 127.0.0.1 at this port (used instead of --socket on Windows)."
+    )
+    parser.add_argument("--no-stdin", action="store_true", help="With --headless, don't read requests from stdin.")
+    parser.add_argument("--speak", action="store_true", help="With --headless, also speak replies aloud.")
+    parser.add_argument(
+        "--record",
+        type=pathlib.Path,
+        help="Record every interaction (audio, transcripts, replies, timings) to this file for --replay.",
+    )
+    suite.add_arguments(parser)
+    replay.add_arguments(parser)
     args = parser.parse_args()
-    asyncio.run(run(check_only=args.check))
+    if args.bench:
+        configure_logging(log_to_file=False)
+        raise SystemExit(asyncio.run(suite.bench_from_args(args)))
+    if args.replay:
+        configure_logging(log_to_file=False)
+        raise SystemExit(asyncio.run(replay.replay_from_args(args)))
+    asyncio.run(
+        run(
+            check_only=args.check,
+            metrics_port=args.metrics_port,
+            metrics_file=args.metrics_file,
+            profile=args.profile,
+            headless=args.headless,
+            socket_path=None if args.no_socket else args.socket,
+            port=args.port,
+            use_stdin=not args.no_stdin,
+            speak=args.speak,
+            record=args.record,
+        )
+    )
@@ -0,0 +1,158 @@
+import asyncio
+import contextvars
+import functools
+import itertools
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jarvis.utils.logger import get_logger
+from jarvis.utils.metrics import registry
+
+HIGH = 0
+NORMAL = 1
+LOW = 2
+
+_CORES = os.cpu_count() or 1
+# audio: blocking microphone reads; inference: Whisper decode, model loads and vision analysis;
+# disk: memory/metrics/frame writes and skill imports; subprocess: launching and killing programs.
+EXECUTOR_SIZES: Dict[str, int] = {
+    "audio": 2,
+    "inference": max(1, min(2, _CORES // 4)),
+    "disk": 2,
+    "subprocess": 2,
+}
+
+EXECUTOR_QUEUE_DEPTH = registry.gauge(
+    "jarvis_executor_queue_depth", "Work items waiting for a thread in each executor.", ("executor",)
+)
+EXECUTOR_WAIT = registry.histogram(
+    "jarvis_executor_wait_seconds", "Time work items spend queued before a thread picks them up.", ("executor",)
+)
+
+_SHUTDOWN = (sys.maxsize, sys.maxsize, None)
+
+
+class PriorityExecutor(Executor):
+    """
+    Fixed-size daemon thread pool whose backlog is served by priority (``HIGH`` first), FIFO within a level.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.logger = get_logger(__name__)
+        self.name = name
+        self.max_workers = max_workers
+        self._queue: "queue.PriorityQueue[Tuple[int, int, Any]]" = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+        EXECUTOR_QUEUE_DEPTH.set_function(self.qsize, executor=name)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        return self.submit_with_priority(NORMAL, fn, *args, **kwargs)
+
+    def submit_with_priority(self, priority: int, fn: Callable, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError(f"Executor {self.name} has been shut down")
+            self._queue.put((priority, next(self._sequence), (future, fn, args, kwargs, time.perf_counter())))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker, name=f"jarvis-{self.name}_{len(self._threads)}", daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            threads = list(self._threads)
+        if cancel_futures:
+            while True:
+                try:
+                    _, _, work = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                work[0].cancel()
+        for _ in threads:
+            self._queue.put(_SHUTDOWN)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _worker(self) -> None:
+        while True:
+            _, _, work = self._queue.get()
+            if work is None:
+                return
+            future, fn, args, kwargs, submitted = work
+            if not future.set_running_or_notify_cancel():
+                continue
+            EXECUTOR_WAIT.observe(time.perf_counter() - submitted, executor=self.name)
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:  # pylint: disable=broad-exception-caught
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
+class ExecutorRegistry:
+    """
+    Lazily creates one named executor per workload so slow work in one class can't starve another.
+    """
+
+    def __init__(self, sizes: Optional[Dict[str, int]] = None) -> None:
+        self.sizes = dict(sizes or EXECUTOR_SIZES)
+        self._executors: Dict[str, PriorityExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> PriorityExecutor:
+        executor = self._executors.get(name)
+        if executor is None:
+            if name not in self.sizes:
+                raise KeyError(f"Unknown executor: {name}")
+            with self._lock:
+                executor = self._executors.get(name)
+                if executor is None:
+                    executor = PriorityExecutor(name, self.sizes[name])
+                    self._executors[name] = executor
+        return executor
+
+    async def run(self, name: str, func: Callable, /, *args, priority: int = NORMAL, **kwargs) -> Any:
+        """
+        Runs ``func`` on the named executor with the caller's contextvars (tracing spans keep their
+        interaction). Cancelling the awaiting task drops the work if it hasn't started yet.
+        """
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await asyncio.wrap_future(self.get(name).submit_with_priority(priority, call))
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def default_native_threads() -> int:
+    """
+    Intra-op threads per inference worker, so concurrent decodes don't oversubscribe the cores.
+    """
+    return max(1, _CORES // EXECUTOR_SIZES["inference"])
+
+
+executors = ExecutorRegistry()
+run_in = executors.run
@@ -1,15 +1,251 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import pathlib
+import queue
+import sys
+import threading
+import time
+from collections.abc import Mapping
 from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+QUEUE_SIZE = 10000
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
+ROTATE_SECONDS = 24 * 60 * 60
+# Arguments of these types can't change between the log call and formatting on the listener thread.
+_IMMUTABLE_ARGS = (str, int, float, bool, bytes, type(None))
+
+
+def default_log_dir() -> pathlib.Path:
+    """
+    Per-user state directory for log files, outside the source tree: ``%LOCALAPPDATA%\\Jarvis\\logs`` on
+    Windows, ``$XDG_STATE_HOME/jarvis/logs`` (``~/.local/state/jarvis/logs`` by default) elsewhere.
+    """
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return pathlib.Path(os.environ["LOCALAPPDATA"]) / "Jarvis" / "logs"
+    state_home = os.environ.get("XDG_STATE_HOME") or str(pathlib.Path.home() / ".local" / "state")
+    return pathlib.Path(state_home) / "jarvis" / "logs"
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotates to numbered backups when the file would exceed ``max_bytes`` or is ``interval`` seconds old.
+    """
+
+    def __init__(self, filename: pathlib.Path, max_bytes: int, backup_count: int, interval: float) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True)
+        self.interval = interval
+        # Like TimedRotatingFileHandler, an existing file's age counts from its last write.
+        started = os.stat(filename).st_mtime if os.path.exists(filename) else time.time()
+        self.rollover_at = started + interval
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.rollover_at = time.time() + self.interval
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hands records to the listener thread without blocking or formatting them; when the queue is full the
+    record is dropped and counted rather than stalling the caller (often the event loop or audio thread).
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args.values() if isinstance(record.args, Mapping) else record.args or ()
+        if not all(isinstance(arg, _IMMUTABLE_ARGS) for arg in args):
+            # Mutable arguments (lists, arrays, traces) are rendered now so later changes don't leak in.
+            record.msg, record.args = record.getMessage(), None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+
+class LogListener(logging.handlers.QueueListener):
+    """
+    Writes queued records to the real handlers and reports records dropped since the last one.
+    """
+
+    def __init__(self, queue_handler: DroppingQueueHandler, *handlers: logging.Handler) -> None:
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=True)
+        self.queue_handler = queue_handler
+        self._reported = 0
+
+    def handle(self, record: logging.LogRecord) -> None:
+        dropped = self.queue_handler.dropped
+        if dropped > self._reported:
+            notice = logging.makeLogRecord(
+                {
+                    "name": __name__,
+                    "levelno": logging.WARNING,
+                    "levelname": logging.getLevelName(logging.WARNING),
+                    "msg": "Log queue full: dropped %d records",
+                    "args": (dropped - self._reported,),
+                }
+            )
+            self._reported = dropped
+            super().handle(notice)
+        super().handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # The stock put_nowait would fail on a full queue and leave the thread running.
+        self.queue.put(self._sentinel, timeout=5.0)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets each message template at or below ``max_level`` through at most once per ``interval`` seconds and
+    notes how many repeats were suppressed. Meant for polling loops that would otherwise log every pass.
+    """
+
+    def __init__(self, interval: float = 10.0, max_level: int = logging.DEBUG) -> None:
+        super().__init__()
+        self.interval = interval
+        self.max_level = max_level
+        self.suppressed = 0
+        self._last: Dict[Tuple[str, str], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            last, skipped = self._last.get(key, (float("-inf"), 0))
+            if now - last < self.interval:
+                self._last[key] = (last, skipped + 1)
+                self.suppressed += 1
+                return False
+            self._last[key] = (now, 0)
+        if skipped:
+            record.msg = f"{record.msg} ({skipped} similar suppressed)"
+        return True
+
+
+class LogPipeline:
+    """
+    Process-wide logging setup: loggers enqueue records, and a background listener formats them and writes
+    them to stderr (and, once ``add_file`` is called, a rotating file), so a slow console or disk never stalls
+    the caller.
+    """
+
+    def __init__(self) -> None:
+        self.queue_handler: Optional[DroppingQueueHandler] = None
+        self.listener: Optional[LogListener] = None
+        self.file_handler: Optional[SizeAndTimeRotatingFileHandler] = None
+        self.filters: List[RateLimitFilter] = []
+
+    @property
+    def dropped(self) -> int:
+        return self.queue_handler.dropped if self.queue_handler is not None else 0
+
+    @property
+    def suppressed(self) -> int:
+        return sum(log_filter.suppressed for log_filter in self.filters)
+
+    @property
+    def pending(self) -> int:
+        return self.queue_handler.queue.qsize() if self.queue_handler is not None else 0
+
+    def start(self, level: int, log_dir: Optional[pathlib.Path] = None, queue_size: int = QUEUE_SIZE) -> None:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.queue_handler = DroppingQueueHandler(queue.Queue(maxsize=queue_size))
+        self.listener = LogListener(self.queue_handler, stream_handler)
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(self.queue_handler)
+        self.listener.start()
+        atexit.register(self.stop)
+        if log_dir is not None:
+            self.add_file(log_dir)
+
+    def add_file(self, log_dir: pathlib.Path) -> None:
+        """
+        Also writes to ``jarvis.log`` in ``log_dir``, rotated by size and age.
+        """
+        if self.listener is None or self.file_handler is not None:
+            return
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            handler = SizeAndTimeRotatingFileHandler(log_dir / "jarvis.log", MAX_LOG_BYTES, LOG_BACKUPS, ROTATE_SECONDS)
+        except OSError as exc:
+            sys.stderr.write(f"File logging disabled: {exc}\n")
+            return
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self.file_handler = handler
+        # The listener thread reads its handler tuple per record, so swapping it in is safe while running.
+        self.listener.handlers = (*self.listener.handlers, handler)
+
+    def stop(self) -> None:
+        """
+        Writes out everything still queued and closes the handlers.
+        """
+        if self.listener is None:
+            return
+        listener, self.listener = self.listener, None
+        # Records logged after this fall through to logging's last-resort stderr handler.
+        logging.getLogger().removeHandler(self.queue_handler)
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+    def rate_limit(self, logger: logging.Logger, interval: float = 10.0) -> logging.Logger:
+        if not any(isinstance(log_filter, RateLimitFilter) for log_filter in logger.filters):
+            log_filter = RateLimitFilter(interval)
+            logger.addFilter(log_filter)
+            self.filters.append(log_filter)
+        return logger
+
+
+log_pipeline = LogPipeline()
 
 
 @lru_cache(maxsize=1)
-def configure_logging() -> None:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    )
+def _start_console_logging() -> None:
+    level = logging.getLevelName(os.environ.get("JARVIS_LOG_LEVEL", "INFO").upper())
+    log_pipeline.start(level=level if isinstance(level, int) else logging.INFO)
+
+
+def configure_logging(log_to_file: bool = True) -> None:
+    """
+    Called once by the entry point. With ``log_to_file``, also logs to ``JARVIS_LOG_DIR`` (by default
+    ``default_log_dir()``; empty means stderr only). Modules just call ``get_logger``, which never opens files.
+    """
+    _start_console_logging()
+    if not log_to_file:
+        return
+    log_dir = os.environ.get("JARVIS_LOG_DIR", str(default_log_dir()))
+    if log_dir:
+        log_pipeline.add_file(pathlib.Path(log_dir))
 
 
 def get_logger(name: str) -> logging.Logger:
-    configure_logging()
+    _start_console_logging()
     return logging.getLogger(name)
+
+
+def get_rate_limited_logger(name: str, interval: float = 10.0) -> logging.Logger:
+    """
+    A logger whose repeated debug messages are sampled; see ``RateLimitFilter``.
+    """
+    return log_pipeline.rate_limit(get_logger(name), interval)
@@ -0,0 +1,321 @@
+import asyncio
+import inspect
+import os
+import pathlib
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from jarvis.utils.logger import get_logger, log_pipeline
+from jarvis.utils.tracing import LatencyHistogram
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labelnames: Tuple[str, ...], labels: Dict[str, str]) -> LabelKey:
+    return tuple((name, str(labels.get(name, ""))) for name in labelnames)
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + escaped + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_key(self.labelnames, labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelKey, float] = {}
+        self._functions: Dict[LabelKey, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def set_function(self, function: Callable[[], float], **labels: str) -> None:
+        """
+        Evaluates ``function`` lazily at exposition time, e.g. for queue depths.
+        """
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._functions[key] = function
+
+    def value(self, **labels: str) -> float:
+        key = _label_key(self.labelnames, labels)
+        function = self._functions.get(key)
+        return float(function()) if function else self._values.get(key, 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, function in functions.items():
+            try:
+                values[key] = float(function())
+            except Exception:  # pylint: disable=broad-exception-caught
+                continue
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}" for key, value in values.items()]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._histograms: Dict[LabelKey, LatencyHistogram] = {}
+
+    def observe(self, seconds: float, **labels: str) -> None:
+        key = _label_key(self.labelnames, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+        histogram.observe(seconds)
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = list(self._histograms.items())
+        for key, histogram in items:
+            cumulative = 0
+            for bound, count in zip(histogram.buckets_ms, histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound / 1000.0)
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {histogram.total_ms / 1000.0!r}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {histogram.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Holds Jarvis metrics and renders them in the Prometheus text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Union[None, Awaitable[None]]]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Tuple[str, ...]):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames)
+                self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames)
+
+    def add_collector(self, collector: Callable[[], Union[None, Awaitable[None]]]) -> None:
+        """
+        Registers a callback (sync or async) that refreshes gauges right before each exposition.
+        """
+        self._collectors.append(collector)
+
+    async def collect(self) -> None:
+        logger = get_logger(__name__)
+        for collector in list(self._collectors):
+            try:
+                result = collector()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.debug("Metrics collector %s failed: %s", collector, exc)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+WAKES = registry.counter("jarvis_wakes_total", "Wake word detections, including tray wakes.")
+COMMANDS = registry.counter("jarvis_commands_total", "Utterances routed to skills.")
+CONVERSATIONS = registry.counter("jarvis_conversations_total", "Utterances routed to the language model.")
+SKILL_DISPATCHES = registry.counter("jarvis_skill_dispatches_total", "Skill invocations.", ("skill",))
+ERRORS = registry.counter("jarvis_errors_total", "Errors caught by Jarvis subsystems.", ("stage",))
+MODEL_RESIDENT = registry.gauge("jarvis_model_resident", "1 when a model is loaded in memory.", ("kind", "model"))
+PROCESS_RSS = registry.gauge("jarvis_process_resident_memory_bytes", "Resident set size of the Jarvis process.")
+QUEUE_DEPTH = registry.gauge("jarvis_queue_depth", "Items waiting in internal queues.", ("queue",))
+SESSIONS = registry.gauge("jarvis_sessions", "Conversation sessions currently held in memory.")
+HEADLESS_REQUESTS = registry.counter(
+    "jarvis_headless_requests_total", "Utterances received by the headless front end.", ("transport",)
+)
+QUEUE_DROPS = registry.counter("jarvis_queue_drops_total", "Items dropped by a full pipeline queue.", ("queue",))
+STT_LATENCY = registry.histogram("jarvis_stt_seconds", "Whisper transcription latency.", ("model",))
+LLM_LATENCY = registry.histogram("jarvis_llm_seconds", "Ollama generation round-trip latency.", ("model",))
+TTS_LATENCY = registry.histogram("jarvis_tts_seconds", "Text-to-speech playback latency.", ("engine",))
+BARGE_IN_LATENCY = registry.histogram(
+    "jarvis_barge_in_seconds", "Time from a barge-in to generation and speech being stopped."
+)
+SPECULATIONS = registry.counter(
+    "jarvis_speculations_total", "Speculative LLM requests started on partial transcripts, by outcome.", ("outcome",)
+)
+SPECULATION_SAVED = registry.histogram(
+    "jarvis_speculation_saved_seconds", "LLM latency hidden by accepted speculative requests."
+)
+LOG_SUPPRESSED = registry.counter(
+    "jarvis_log_suppressed_total", "Repeated debug log lines left out by rate limiting (e.g. on the wake loop)."
+)
+
+
+def _collect_logging() -> None:
+    # The log pipeline keeps plain counters (it can't import this module); catch the metrics up to them.
+    for counter, total, labels in (
+        (QUEUE_DROPS, log_pipeline.dropped, {"queue": "log"}),
+        (LOG_SUPPRESSED, log_pipeline.suppressed, {}),
+    ):
+        behind = total - counter.value(**labels)
+        if behind > 0:
+            counter.inc(behind, **labels)
+
+
+QUEUE_DEPTH.set_function(lambda: log_pipeline.pending, queue="log")
+registry.add_collector(_collect_logging)
+
+
+class MetricsExporter:
+    """
+    Serves metrics on a loopback HTTP port and/or periodically rewrites them to a file.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsRegistry = registry,
+        port: Optional[int] = None,
+        file_path: Optional[pathlib.Path] = None,
+        file_interval: float = 15.0,
+    ) -> None:
+        self.logger = get_logger(__name__)
+        self.metrics = metrics
+        self.port = port
+        self.file_path = file_path
+        self.file_interval = file_interval
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._file_task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.port is not None:
+            self._server = await asyncio.start_server(self._handle_client, host="127.0.0.1", port=self.port)
+            self.logger.info("Metrics endpoint listening on http://127.0.0.1:%s/metrics", self.port)
+        if self.file_path is not None:
+            self._file_task = asyncio.get_running_loop().create_task(self._file_loop(), name="jarvis-metrics-file")
+            self.logger.info("Writing metrics to %s every %.0fs", self.file_path, self.file_interval)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._file_task is not None:
+            self._file_task.cancel()
+            await asyncio.gather(self._file_task, return_exceptions=True)
+            self._file_task = None
+            await self._write_file()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            while (await asyncio.wait_for(reader.readline(), timeout=5.0)) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET" or parts[1].split("?")[0] not in ("/", "/metrics"):
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            else:
+                await self.metrics.collect()
+                body = self.metrics.render().encode("utf-8")
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                    + f"Content-Length: {len(body)}\r\n".encode("ascii")
+                    + b"Connection: close\r\n\r\n"
+                    + body
+                )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as exc:
+            self.logger.debug("Metrics client error: %s", exc)
+        finally:
+            writer.close()
+
+    async def _file_loop(self) -> None:
+        while True:
+            await self._write_file()
+            await asyncio.sleep(self.file_interval)
+
+    async def _write_file(self) -> None:
+        await self.metrics.collect()
+        body = self.metrics.render()
+        tmp_path = self.file_path.with_suffix(self.file_path.suffix + ".tmp")
+
+        def _write() -> None:
+            tmp_path.write_text(body, encoding="utf-8")
+            os.replace(tmp_path, self.file_path)
+
+        # Imported here: the executors module registers its own metrics in this module's registry.
+        from jarvis.utils.executors import LOW, run_in  # pylint: disable=import-outside-toplevel
+
+        await run_in("disk", _write, priority=LOW)
@@ -0,0 +1,120 @@
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from jarvis.utils.logger import get_logger
+
+WORKER_SUFFIX_PATTERN = re.compile(r"_\d+$")
+THREAD_ALIASES = {
+    "MainThread": "event-loop",
+    "asyncio": "to_thread-executor",
+    "jarvis-tts": "tts-executor",
+    "jarvis-audio": "audio-executor",
+    "jarvis-inference": "inference-executor",
+    "jarvis-disk": "disk-executor",
+    "jarvis-subprocess": "subprocess-executor",
+    "jarvis-tray": "tray",
+}
+
+
+class SamplingProfiler:
+    """
+    Low-overhead wall-clock sampler that periodically walks ``sys._current_frames`` from a daemon thread.
+    """
+
+    def __init__(self, output_dir: Path, interval: float = 0.005, max_depth: int = 64) -> None:
+        self.logger = get_logger(__name__)
+        self.output_dir = output_dir
+        self.interval = interval
+        self.max_depth = max_depth
+        self._stacks: Counter = Counter()
+        self._samples = 0
+        self._started_at = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._stacks = Counter()
+            self._samples = 0
+            self._started_at = time.time()
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="jarvis-profiler", daemon=True)
+            self._thread.start()
+        self.logger.info("Sampling profiler started (every %.1f ms)", self.interval * 1000.0)
+
+    def stop(self) -> Optional[Path]:
+        with self._lock:
+            if self._thread is None:
+                return None
+            self._stop_event.set()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        return self.dump()
+
+    def toggle(self) -> Optional[Path]:
+        if self.running:
+            return self.stop()
+        self.start()
+        return None
+
+    def dump(self) -> Optional[Path]:
+        """
+        Writes collapsed stacks (``thread;frame;frame count``), the input format of flamegraph.pl and speedscope.
+        """
+        if not self._stacks:
+            self.logger.info("Sampling profiler captured no samples.")
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started_at))
+        path = self.output_dir / f"profile-{stamp}.collapsed"
+        lines = [f"{stack} {count}" for stack, count in self._stacks.most_common()]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self.logger.info("Profile with %d samples written to %s", self._samples, path)
+        for thread, share in self.thread_breakdown()[:5]:
+            self.logger.info("Profile thread %s: %.1f%% of samples", thread, share * 100.0)
+        return path
+
+    def thread_breakdown(self) -> List[tuple[str, float]]:
+        totals: Dict[str, int] = {}
+        for stack, count in self._stacks.items():
+            thread = stack.split(";", 1)[0]
+            totals[thread] = totals.get(thread, 0) + count
+        grand_total = sum(totals.values()) or 1
+        return sorted(((thread, count / grand_total) for thread, count in totals.items()), key=lambda item: -item[1])
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():  # pylint: disable=protected-access
+                if ident == own_ident:
+                    continue
+                stack = self._collapse(frame)
+                self._stacks[f"{self._thread_label(names.get(ident, str(ident)))};{stack}"] += 1
+            self._samples += 1
+
+    def _collapse(self, frame) -> str:
+        frames: List[str] = []
+        while frame is not None and len(frames) < self.max_depth:
+            code = frame.f_code
+            module = frame.f_globals.get("__name__", "?")
+            frames.append(f"{module}:{getattr(code, 'co_qualname', code.co_name)}")
+            frame = frame.f_back
+        return ";".join(reversed(frames))
+
+    @staticmethod
+    def _thread_label(name: str) -> str:
+        # Pool workers are numbered (asyncio_0, jarvis-tts_0); fold them into one label per pool.
+        return THREAD_ALIASES.get(WORKER_SUFFIX_PATTERN.sub("", name), name)
@@ -0,0 +1,232 @@
+import gzip
+import json
+import pathlib
+import queue
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from jarvis.utils.logger import get_logger
+from jarvis.utils.tracing import Trace, current_interaction_id, tracer
+
+MAGIC = b"JVRB"
+VERSION = 1
+# Every frame: kind (u8) and payload length (u32), little-endian. Payloads are UTF-8 JSON, except audio,
+# which is a u16-length JSON header followed by 16-bit PCM. The whole stream is gzip-compressed.
+FRAME = struct.Struct("<BI")
+AUDIO_HEADER = struct.Struct("<H")
+KIND_META = 1
+KIND_EVENT = 2
+KIND_AUDIO = 3
+
+
+@dataclass
+class RecordedInteraction:
+    """
+    Everything captured for one interaction: its command audio, events in order, and the finished trace.
+    """
+
+    interaction_id: str
+    label: str = ""
+    audio: Optional[np.ndarray] = None
+    sample_rate: int = 16000
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    spans: List[Dict[str, Any]] = field(default_factory=list)
+    duration_ms: Optional[float] = None
+
+    def events_of(self, kind: str) -> List[Dict[str, Any]]:
+        return [event for event in self.events if event.get("kind") == kind]
+
+    def first(self, kind: str, **match: Any) -> Optional[Dict[str, Any]]:
+        for event in self.events_of(kind):
+            if all(event.get(key) == value for key, value in match.items()):
+                return event
+        return None
+
+    def stage_ms(self) -> Dict[str, float]:
+        """
+        Total time per span name, so repeated stages (e.g. several skill steps) compare as one.
+        """
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span["name"]] = totals.get(span["name"], 0.0) + span["duration_ms"]
+        return totals
+
+
+@dataclass
+class RecordingBundle:
+    meta: Dict[str, Any]
+    interactions: List[RecordedInteraction]
+
+
+class SessionRecorder:
+    """
+    Opt-in recorder of everything needed to replay voice interactions offline. While disabled, every call
+    is a cheap no-op; only work inside a traced interaction is recorded, so idle wake-word polling isn't.
+    Callers only encode and enqueue frames; a writer thread compresses them and writes them to disk.
+    """
+
+    def __init__(self) -> None:
+        self.logger = get_logger(__name__)
+        self.path: Optional[pathlib.Path] = None
+        self._queue: Optional["queue.Queue[Optional[Tuple[int, bytes, bool]]]"] = None
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._queue is not None
+
+    def start(self, path: pathlib.Path, meta: Optional[Dict[str, Any]] = None) -> None:
+        if self.enabled:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = gzip.open(path, "wb", compresslevel=6)
+        stream.write(MAGIC + struct.pack("<H", VERSION))
+        frames: "queue.Queue[Optional[Tuple[int, bytes, bool]]]" = queue.Queue()
+        writer = threading.Thread(target=self._write_loop, args=(stream, frames), name="jarvis-recorder", daemon=True)
+        with self._lock:
+            self._queue, self._writer, self.path = frames, writer, path
+        writer.start()
+        self._write(KIND_META, {"version": VERSION, "created": time.time(), **(meta or {})})
+        tracer.add_listener(self._on_trace)
+        self.logger.info("Recording interactions to %s", path)
+
+    def stop(self) -> None:
+        """
+        Waits for queued frames to be written and closes the bundle.
+        """
+        tracer.remove_listener(self._on_trace)
+        with self._lock:
+            frames, writer = self._queue, self._writer
+            self._queue, self._writer = None, None
+        if frames is None or writer is None:
+            return
+        frames.put(None)
+        writer.join()
+        self.logger.info("Recording saved to %s", self.path)
+
+    def event(self, kind: str, **fields: Any) -> None:
+        if not self.enabled:
+            return
+        interaction_id = current_interaction_id()
+        if interaction_id is None:
+            return
+        self._write(KIND_EVENT, {"interaction": interaction_id, "kind": kind, "time": time.time(), **fields})
+
+    def audio(self, audio: np.ndarray, sample_rate: int) -> None:
+        if not self.enabled:
+            return
+        interaction_id = current_interaction_id()
+        if interaction_id is None:
+            return
+        header = json.dumps(
+            {"interaction": interaction_id, "sample_rate": sample_rate, "samples": len(audio)}
+        ).encode("utf-8")
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+        self._write_raw(KIND_AUDIO, AUDIO_HEADER.pack(len(header)) + header + pcm)
+
+    def _on_trace(self, trace: Trace) -> None:
+        self._write(
+            KIND_EVENT,
+            {
+                "interaction": trace.interaction_id,
+                "kind": "trace",
+                "label": trace.label,
+                "duration_ms": trace.duration_ms,
+                "spans": [asdict(span) for span in trace.spans],
+            },
+            flush=True,
+        )
+
+    def _write(self, kind: int, payload: Dict[str, Any], flush: bool = False) -> None:
+        self._write_raw(kind, json.dumps(payload, default=str).encode("utf-8"), flush)
+
+    def _write_raw(self, kind: int, payload: bytes, flush: bool = False) -> None:
+        with self._lock:
+            if self._queue is not None:
+                self._queue.put((kind, payload, flush))
+
+    def _write_loop(self, stream: IO[bytes], frames: "queue.Queue[Optional[Tuple[int, bytes, bool]]]") -> None:
+        try:
+            while True:
+                frame = frames.get()
+                if frame is None:
+                    return
+                kind, payload, flush = frame
+                stream.write(FRAME.pack(kind, len(payload)))
+                stream.write(payload)
+                if flush:
+                    # One sync point per interaction keeps a crashed session readable up to its last trace.
+                    stream.flush()
+        except OSError as exc:
+            self.logger.warning("Recording to %s failed, stopping: %s", self.path, exc)
+            with self._lock:
+                if self._queue is frames:
+                    self._queue, self._writer = None, None
+        finally:
+            try:
+                stream.close()
+            except OSError as exc:
+                self.logger.warning("Closing recording %s failed: %s", self.path, exc)
+
+
+def read_bundle(path: pathlib.Path) -> RecordingBundle:
+    """
+    Reads a recording; a truncated tail (e.g. after a crash) ends the bundle instead of failing.
+    """
+    logger = get_logger(__name__)
+    meta: Dict[str, Any] = {}
+    interactions: Dict[str, RecordedInteraction] = {}
+
+    def _interaction(interaction_id: str) -> RecordedInteraction:
+        if interaction_id not in interactions:
+            interactions[interaction_id] = RecordedInteraction(interaction_id=interaction_id)
+        return interactions[interaction_id]
+
+    with gzip.open(path, "rb") as stream:
+        header = stream.read(len(MAGIC) + 2)
+        if header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a Jarvis recording")
+        (version,) = struct.unpack("<H", header[len(MAGIC) :])
+        if version > VERSION:
+            raise ValueError(f"{path} uses recording format {version}; this build reads up to {VERSION}")
+        while True:
+            try:
+                prefix = stream.read(FRAME.size)
+                if len(prefix) < FRAME.size:
+                    break
+                kind, length = FRAME.unpack(prefix)
+                payload = stream.read(length)
+            except (EOFError, OSError) as exc:
+                logger.warning("Recording %s is truncated: %s", path, exc)
+                break
+            if len(payload) < length:
+                logger.warning("Recording %s ends mid-frame.", path)
+                break
+            if kind == KIND_META:
+                meta.update(json.loads(payload))
+            elif kind == KIND_AUDIO:
+                (header_length,) = AUDIO_HEADER.unpack_from(payload)
+                audio_header = json.loads(payload[AUDIO_HEADER.size : AUDIO_HEADER.size + header_length])
+                pcm = np.frombuffer(payload[AUDIO_HEADER.size + header_length :], dtype="<i2")
+                interaction = _interaction(audio_header["interaction"])
+                interaction.audio = pcm.astype(np.float32) / 32767.0
+                interaction.sample_rate = audio_header["sample_rate"]
+            elif kind == KIND_EVENT:
+                event = json.loads(payload)
+                interaction = _interaction(event.pop("interaction"))
+                if event["kind"] == "trace":
+                    interaction.label = event["label"]
+                    interaction.duration_ms = event["duration_ms"]
+                    interaction.spans = event["spans"]
+                else:
+                    interaction.events.append(event)
+    return RecordingBundle(meta=meta, interactions=list(interactions.values()))
+
+
+recorder = SessionRecorder()
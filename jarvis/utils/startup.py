@@ -0,0 +1,107 @@
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from jarvis.utils.logger import get_logger
+
+
+@dataclass
+class SubsystemTiming:
+    name: str
+    started_ms: float
+    finished_ms: float = 0.0
+    ok: bool = False
+    error: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        return self.finished_ms - self.started_ms
+
+
+class StartupTimeline:
+    """
+    Tracks per-subsystem readiness during startup and records when each piece became usable.
+    """
+
+    def __init__(self) -> None:
+        self.logger = get_logger(__name__)
+        self.origin = time.perf_counter()
+        self.timings: Dict[str, SubsystemTiming] = {}
+        self._ready: Dict[str, asyncio.Event] = {}
+
+    def _event(self, name: str) -> asyncio.Event:
+        event = self._ready.get(name)
+        if event is None:
+            event = asyncio.Event()
+            self._ready[name] = event
+        return event
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000.0
+
+    def is_ready(self, name: str) -> bool:
+        return self._event(name).is_set()
+
+    async def wait_ready(self, name: str) -> None:
+        await self._event(name).wait()
+
+    async def run(self, name: str, initializer: Callable[[], Awaitable[object]]) -> bool:
+        """
+        Runs one subsystem initialiser and marks it ready afterwards. A failing subsystem is still marked
+        ready so dependants degrade gracefully instead of waiting forever.
+        """
+        timing = SubsystemTiming(name=name, started_ms=self.elapsed_ms())
+        self.timings[name] = timing
+        try:
+            result = await initializer()
+            timing.ok = result is not False
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            timing.error = str(exc)
+            self.logger.exception("Startup of %s failed: %s", name, exc)
+        timing.finished_ms = self.elapsed_ms()
+        self._event(name).set()
+        self.logger.info("Subsystem %s ready after %.0f ms (took %.0f ms)", name, timing.finished_ms, timing.duration_ms)
+        return timing.ok
+
+    async def gather(self, initializers: Dict[str, Callable[[], Awaitable[object]]]) -> Dict[str, bool]:
+        results = await asyncio.gather(*(self.run(name, init) for name, init in initializers.items()))
+        return dict(zip(initializers, results))
+
+    def describe(self) -> str:
+        parts: List[str] = []
+        for timing in sorted(self.timings.values(), key=lambda item: item.finished_ms):
+            status = "" if timing.ok else " (failed)" if timing.error else " (unavailable)"
+            parts.append(f"{timing.name} {timing.started_ms:.0f}->{timing.finished_ms:.0f}ms{status}")
+        return ", ".join(parts)
+
+    def to_dict(self) -> Dict[str, object]:
+        finished = [timing.finished_ms for timing in self.timings.values()]
+        return {
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "time_to_ready_ms": round(max(finished, default=0.0), 1),
+            "subsystems": [
+                {
+                    **asdict(timing),
+                    "started_ms": round(timing.started_ms, 1),
+                    "finished_ms": round(timing.finished_ms, 1),
+                    "duration_ms": round(timing.duration_ms, 1),
+                }
+                for timing in self.timings.values()
+            ],
+        }
+
+    def append_to(self, path: Path) -> Optional[Path]:
+        """
+        Appends this run as one JSON line so time-to-ready can be compared across releases.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(self.to_dict()) + "\n")
+        except OSError as exc:
+            self.logger.warning("Could not write startup timeline to %s: %s", path, exc)
+            return None
+        return path
@@ -0,0 +1,268 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+    float("inf"),
+)
+
+_interaction_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("jarvis_interaction_id", default=None)
+_current_trace: contextvars.ContextVar[Optional["Trace"]] = contextvars.ContextVar("jarvis_trace", default=None)
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def current_interaction_id() -> Optional[str]:
+    return _interaction_id.get()
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram; cheap to update from any thread.
+    """
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * len(buckets_ms)
+        self.count = 0
+        self.total_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        millis = seconds * 1000.0
+        with self._lock:
+            for index, bound in enumerate(self.buckets_ms):
+                if millis <= bound:
+                    self.counts[index] += 1
+                    break
+            self.count += 1
+            self.total_ms += millis
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """
+        Estimates a percentile in milliseconds by interpolating inside the matching bucket.
+        """
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+        if not total:
+            return None
+        rank = quantile * total
+        cumulative = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets_ms, counts):
+            if count and cumulative + count >= rank:
+                if bound == float("inf"):
+                    return lower
+                return lower + (bound - lower) * ((rank - cumulative) / count)
+            cumulative += count
+            if bound != float("inf"):
+                lower = bound
+        return lower
+
+    @property
+    def mean_ms(self) -> Optional[float]:
+        return self.total_ms / self.count if self.count else None
+
+
+@dataclass
+class SpanRecord:
+    name: str
+    offset_ms: float
+    duration_ms: float
+    thread: str
+    error: Optional[str] = None
+
+
+@dataclass
+class Trace:
+    interaction_id: str
+    label: str
+    started_at: float
+    started: float = field(default_factory=time.perf_counter)
+    duration_ms: Optional[float] = None
+    spans: List[SpanRecord] = field(default_factory=list)
+
+    def describe(self) -> str:
+        stages = ", ".join(f"{span.name} {span.duration_ms:.0f}ms" for span in self.spans)
+        total = f"{self.duration_ms:.0f}ms" if self.duration_ms is not None else "in progress"
+        return f"[{self.interaction_id}] {self.label} {total}: {stages}"
+
+
+class Tracer:
+    """
+    In-process span tracer with per-stage histograms and a ring buffer of recent interactions.
+    """
+
+    def __init__(self, enabled: bool = True, recent_limit: int = 50) -> None:
+        self.enabled = enabled
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.recent: Deque[Trace] = deque(maxlen=recent_limit)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Trace], None]] = []
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    @contextlib.contextmanager
+    def interaction(self, label: str = "interaction") -> Iterator[Optional[Trace]]:
+        trace = self.begin(label)
+        try:
+            with self.resume(trace):
+                yield trace
+        finally:
+            self.finish(trace)
+
+    def begin(self, label: str = "interaction") -> Optional[Trace]:
+        """
+        Starts a trace without activating it; pair with ``resume`` and ``finish`` when an interaction
+        is handed between tasks (e.g. pipeline stages).
+        """
+        if not self.enabled:
+            return None
+        return Trace(interaction_id=f"{os.getpid():x}-{next(self._ids)}", label=label, started_at=time.time())
+
+    @contextlib.contextmanager
+    def resume(self, trace: Optional[Trace]) -> Iterator[Optional[Trace]]:
+        if trace is None:
+            yield None
+            return
+        id_token = _interaction_id.set(trace.interaction_id)
+        trace_token = _current_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _current_trace.reset(trace_token)
+            _interaction_id.reset(id_token)
+
+    def finish(self, trace: Optional[Trace]) -> None:
+        if trace is None or trace.duration_ms is not None:
+            return
+        trace.duration_ms = (time.perf_counter() - trace.started) * 1000.0
+        self.histogram(f"interaction.{trace.label}").observe(trace.duration_ms / 1000.0)
+        self.recent.append(trace)
+        for listener in list(self._listeners):
+            listener(trace)
+
+    def add_listener(self, listener: Callable[[Trace], None]) -> None:
+        """
+        Calls ``listener`` with every finished trace (e.g. to persist it).
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Trace], None]) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def span(self, name: str):
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextlib.contextmanager
+    def _span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            yield
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.histogram(name).observe(elapsed)
+            trace = _current_trace.get()
+            if trace is not None:
+                trace.spans.append(
+                    SpanRecord(
+                        name=name,
+                        offset_ms=(started - trace.started) * 1000.0,
+                        duration_ms=elapsed * 1000.0,
+                        thread=threading.current_thread().name,
+                        error=error,
+                    )
+                )
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorates a sync or async callable so every call is recorded as a span.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if not self.enabled:
+                        return await func(*args, **kwargs)
+                    with self._span(span_name):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._span(span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def percentiles(self, name: str, quantiles: Tuple[float, ...] = (0.5, 0.9, 0.99)) -> Dict[str, Optional[float]]:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            return {f"p{int(q * 100)}": None for q in quantiles}
+        return {f"p{int(q * 100)}": histogram.percentile(q) for q in quantiles}
+
+    def summary(self) -> List[str]:
+        lines = []
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            if not histogram.count:
+                continue
+            stats = self.percentiles(name)
+            lines.append(
+                f"{name}: n={histogram.count} p50={stats['p50']:.1f}ms p90={stats['p90']:.1f}ms p99={stats['p99']:.1f}ms"
+            )
+        return lines
+
+    def recent_traces(self, limit: int = 10) -> List[Trace]:
+        return list(self.recent)[-limit:]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms = {}
+        self.recent.clear()
+
+
+tracer = Tracer(enabled=os.environ.get("JARVIS_TRACING", "1") != "0")